@@ -0,0 +1,17 @@
+-- ============================================
+-- ORGANIZATION DIMENSION SCORES
+-- Per-organization assessment score (0-100) for each of the 7 dimensions.
+-- Input to the batch scoring engine.
+-- ============================================
+CREATE TABLE organization_dimension_scores (
+    score_id BIGSERIAL PRIMARY KEY,
+    organization_id UUID NOT NULL REFERENCES organizations(organization_id),
+    dimension_id VARCHAR(50) NOT NULL REFERENCES dimensions(dimension_id),
+    score DECIMAL(5,2) NOT NULL CHECK (score >= 0 AND score <= 100),
+    assessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_current BOOLEAN DEFAULT TRUE,
+    UNIQUE (organization_id, dimension_id, assessed_at)
+);
+
+CREATE INDEX idx_org_dim_scores_current ON organization_dimension_scores(organization_id)
+    WHERE is_current = TRUE;
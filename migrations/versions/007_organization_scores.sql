@@ -0,0 +1,20 @@
+-- ============================================
+-- ORGANIZATION SCORES (latest result per organization)
+-- config_version is the fingerprint of the sector weights/calibrations the
+-- score was computed with; readers compare it with the current fingerprint
+-- to tell fresh results from stale ones.
+-- ============================================
+CREATE TABLE organization_scores (
+    organization_id UUID PRIMARY KEY REFERENCES organizations(organization_id),
+    focus_group_id VARCHAR(50) NOT NULL REFERENCES focus_groups(focus_group_id),
+    weighted_score DECIMAL(6,3) NOT NULL,
+    penalty DECIMAL(6,4) NOT NULL,
+    v_r_score DECIMAL(6,3) NOT NULL,
+    h_r_score DECIMAL(6,3) NOT NULL,
+    synergy_score DECIMAL(6,3) NOT NULL,
+    org_air_score DECIMAL(6,3) NOT NULL,
+    config_version VARCHAR(64) NOT NULL,
+    computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_org_scores_focus_group ON organization_scores(focus_group_id, config_version);
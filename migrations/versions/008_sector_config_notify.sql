@@ -0,0 +1,31 @@
+-- ============================================
+-- SECTOR CONFIG CHANGE NOTIFICATIONS
+-- Any write to a sector's focus group, weights or calibrations emits
+-- NOTIFY sector_config_changed, '<focus_group_id>' so app instances can
+-- invalidate exactly that sector's cached configuration.
+-- ============================================
+CREATE OR REPLACE FUNCTION notify_sector_config_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('sector_config_changed', OLD.focus_group_id);
+    ELSE
+        PERFORM pg_notify('sector_config_changed', NEW.focus_group_id);
+        IF TG_OP = 'UPDATE' AND OLD.focus_group_id IS DISTINCT FROM NEW.focus_group_id THEN
+            PERFORM pg_notify('sector_config_changed', OLD.focus_group_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_focus_groups_notify
+    AFTER INSERT OR UPDATE OR DELETE ON focus_groups
+    FOR EACH ROW EXECUTE FUNCTION notify_sector_config_changed();
+
+CREATE TRIGGER trg_dimension_weights_notify
+    AFTER INSERT OR UPDATE OR DELETE ON focus_group_dimension_weights
+    FOR EACH ROW EXECUTE FUNCTION notify_sector_config_changed();
+
+CREATE TRIGGER trg_calibrations_notify
+    AFTER INSERT OR UPDATE OR DELETE ON focus_group_calibrations
+    FOR EACH ROW EXECUTE FUNCTION notify_sector_config_changed();
@@ -0,0 +1,31 @@
+-- ============================================
+-- ORGANIZATION LISTING INDEXES
+-- GET /api/v1/organizations pages by keyset on (legal_name, organization_id).
+-- The first three indexes lead with equality filter columns and end with
+-- the sort key, so a listing filtered only by status, a single sector and/or
+-- country reads any page, however deep, as an index range scan that stops
+-- after `limit` rows.
+-- Other filters do not get that guarantee. A list of several sectors
+-- (focus_group_id = ANY(...)) and revenue/employee ranges cannot follow the
+-- sort order: Postgres narrows the candidates (the partial
+-- (focus_group_id, <metric>) indexes serve range filters within a sector)
+-- and then sorts them, so the cost grows with the number of matching rows,
+-- not with `limit`.
+-- ============================================
+CREATE INDEX idx_org_status_name
+    ON organizations(status, legal_name, organization_id);
+
+CREATE INDEX idx_org_focus_group_status_name
+    ON organizations(focus_group_id, status, legal_name, organization_id);
+
+CREATE INDEX idx_org_country_status_name
+    ON organizations(headquarters_country, status, legal_name, organization_id)
+    WHERE headquarters_country IS NOT NULL;
+
+CREATE INDEX idx_org_focus_group_revenue
+    ON organizations(focus_group_id, annual_revenue_usd)
+    WHERE annual_revenue_usd IS NOT NULL;
+
+CREATE INDEX idx_org_focus_group_employees
+    ON organizations(focus_group_id, employee_count)
+    WHERE employee_count IS NOT NULL;
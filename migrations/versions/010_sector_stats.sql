@@ -0,0 +1,203 @@
+-- ============================================
+-- SECTOR STATS (precomputed per-sector aggregates)
+-- One row per sector, rebuilt by refresh_sector_stats(<focus_group_id>).
+-- Writes to organizations / organization_dimension_scores mark the affected
+-- sectors in sector_stats_dirty (statement-level triggers, so a COPY of
+-- 100k rows costs one marker per sector) and NOTIFY sector_stats_dirty;
+-- the app refreshes only those sectors.
+-- ============================================
+CREATE TABLE sector_stats (
+    focus_group_id VARCHAR(50) PRIMARY KEY REFERENCES focus_groups(focus_group_id),
+
+    -- Counts by status
+    active_count INTEGER NOT NULL DEFAULT 0,
+    inactive_count INTEGER NOT NULL DEFAULT 0,
+    archived_count INTEGER NOT NULL DEFAULT 0,
+
+    -- Revenue (active organizations with a reported revenue)
+    revenue_reported_count INTEGER NOT NULL DEFAULT 0,
+    revenue_total_usd DECIMAL(18,2),
+    revenue_avg_usd DECIMAL(18,2),
+    revenue_median_usd DECIMAL(18,2),
+
+    -- Employees (active organizations with a reported headcount)
+    employee_reported_count INTEGER NOT NULL DEFAULT 0,
+    employee_total BIGINT,
+    employee_min INTEGER,
+    employee_p25 DECIMAL(12,1),
+    employee_median DECIMAL(12,1),
+    employee_p75 DECIMAL(12,1),
+    employee_p90 DECIMAL(12,1),
+    employee_max INTEGER,
+    employee_buckets JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- Current dimension scores of active organizations
+    scored_count INTEGER NOT NULL DEFAULT 0,
+    dimension_score_avgs JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE sector_stats_dirty (
+    focus_group_id VARCHAR(50) PRIMARY KEY,
+    marked_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Rebuild one sector's row. The dirty marker is removed first: a write that
+-- commits after this point re-marks the sector, so no change is ever lost.
+CREATE OR REPLACE FUNCTION refresh_sector_stats(p_focus_group_id VARCHAR) RETURNS void AS $$
+BEGIN
+    DELETE FROM sector_stats_dirty WHERE focus_group_id = p_focus_group_id;
+
+    INSERT INTO sector_stats (
+        focus_group_id, active_count, inactive_count, archived_count,
+        revenue_reported_count, revenue_total_usd, revenue_avg_usd, revenue_median_usd,
+        employee_reported_count, employee_total, employee_min, employee_p25,
+        employee_median, employee_p75, employee_p90, employee_max, employee_buckets,
+        scored_count, dimension_score_avgs, refreshed_at
+    )
+    SELECT
+        fg.focus_group_id,
+        o.active_count, o.inactive_count, o.archived_count,
+        o.revenue_reported_count, o.revenue_total_usd, o.revenue_avg_usd, o.revenue_median_usd,
+        o.employee_reported_count, o.employee_total, o.employee_min, o.employee_pct[1],
+        o.employee_pct[2], o.employee_pct[3], o.employee_pct[4], o.employee_max, o.employee_buckets,
+        COALESCE(s.scored_count, 0), COALESCE(s.dimension_score_avgs, '{}'::jsonb), CURRENT_TIMESTAMP
+    FROM focus_groups fg
+    CROSS JOIN LATERAL (
+        SELECT
+            count(*) FILTER (WHERE status = 'active') AS active_count,
+            count(*) FILTER (WHERE status = 'inactive') AS inactive_count,
+            count(*) FILTER (WHERE status = 'archived') AS archived_count,
+            count(annual_revenue_usd) FILTER (WHERE status = 'active') AS revenue_reported_count,
+            sum(annual_revenue_usd) FILTER (WHERE status = 'active') AS revenue_total_usd,
+            round(avg(annual_revenue_usd) FILTER (WHERE status = 'active'), 2) AS revenue_avg_usd,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY annual_revenue_usd)
+                FILTER (WHERE status = 'active') AS revenue_median_usd,
+            count(employee_count) FILTER (WHERE status = 'active') AS employee_reported_count,
+            sum(employee_count) FILTER (WHERE status = 'active') AS employee_total,
+            min(employee_count) FILTER (WHERE status = 'active') AS employee_min,
+            percentile_cont(ARRAY[0.25, 0.5, 0.75, 0.9]) WITHIN GROUP (ORDER BY employee_count)
+                FILTER (WHERE status = 'active') AS employee_pct,
+            max(employee_count) FILTER (WHERE status = 'active') AS employee_max,
+            jsonb_build_object(
+                '1-49', count(*) FILTER (WHERE status = 'active' AND employee_count < 50),
+                '50-249', count(*) FILTER (WHERE status = 'active' AND employee_count BETWEEN 50 AND 249),
+                '250-999', count(*) FILTER (WHERE status = 'active' AND employee_count BETWEEN 250 AND 999),
+                '1000-4999', count(*) FILTER (WHERE status = 'active' AND employee_count BETWEEN 1000 AND 4999),
+                '5000+', count(*) FILTER (WHERE status = 'active' AND employee_count >= 5000)
+            ) AS employee_buckets
+        FROM organizations
+        WHERE focus_group_id = fg.focus_group_id
+    ) o
+    CROSS JOIN LATERAL (
+        SELECT
+            (SELECT count(DISTINCT ds.organization_id)
+             FROM organization_dimension_scores ds
+             JOIN organizations so ON so.organization_id = ds.organization_id
+             WHERE so.focus_group_id = fg.focus_group_id
+               AND so.status = 'active'
+               AND ds.is_current = TRUE) AS scored_count,
+            (SELECT jsonb_object_agg(x.dimension_code, x.avg_score)
+             FROM (
+                 SELECT d.dimension_code, round(avg(ds.score), 2) AS avg_score
+                 FROM organization_dimension_scores ds
+                 JOIN organizations so ON so.organization_id = ds.organization_id
+                 JOIN dimensions d ON d.dimension_id = ds.dimension_id
+                 WHERE so.focus_group_id = fg.focus_group_id
+                   AND so.status = 'active'
+                   AND ds.is_current = TRUE
+                 GROUP BY d.dimension_code
+             ) x) AS dimension_score_avgs
+    ) s
+    WHERE fg.focus_group_id = p_focus_group_id
+    ON CONFLICT (focus_group_id) DO UPDATE SET
+        active_count = EXCLUDED.active_count,
+        inactive_count = EXCLUDED.inactive_count,
+        archived_count = EXCLUDED.archived_count,
+        revenue_reported_count = EXCLUDED.revenue_reported_count,
+        revenue_total_usd = EXCLUDED.revenue_total_usd,
+        revenue_avg_usd = EXCLUDED.revenue_avg_usd,
+        revenue_median_usd = EXCLUDED.revenue_median_usd,
+        employee_reported_count = EXCLUDED.employee_reported_count,
+        employee_total = EXCLUDED.employee_total,
+        employee_min = EXCLUDED.employee_min,
+        employee_p25 = EXCLUDED.employee_p25,
+        employee_median = EXCLUDED.employee_median,
+        employee_p75 = EXCLUDED.employee_p75,
+        employee_p90 = EXCLUDED.employee_p90,
+        employee_max = EXCLUDED.employee_max,
+        employee_buckets = EXCLUDED.employee_buckets,
+        scored_count = EXCLUDED.scored_count,
+        dimension_score_avgs = EXCLUDED.dimension_score_avgs,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Mark sectors touched by a statement on organizations
+CREATE OR REPLACE FUNCTION mark_sector_stats_dirty() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO sector_stats_dirty (focus_group_id)
+        SELECT DISTINCT focus_group_id FROM new_rows
+        ON CONFLICT (focus_group_id) DO UPDATE SET marked_at = CURRENT_TIMESTAMP;
+        PERFORM pg_notify('sector_stats_dirty', f) FROM (SELECT DISTINCT focus_group_id AS f FROM new_rows) n;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO sector_stats_dirty (focus_group_id)
+        SELECT DISTINCT focus_group_id FROM old_rows
+        ON CONFLICT (focus_group_id) DO UPDATE SET marked_at = CURRENT_TIMESTAMP;
+        PERFORM pg_notify('sector_stats_dirty', f) FROM (SELECT DISTINCT focus_group_id AS f FROM old_rows) o;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Same, for dimension score writes (sector found through the organization)
+CREATE OR REPLACE FUNCTION mark_sector_stats_dirty_from_scores() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO sector_stats_dirty (focus_group_id)
+        SELECT DISTINCT o.focus_group_id FROM new_rows r JOIN organizations o USING (organization_id)
+        ON CONFLICT (focus_group_id) DO UPDATE SET marked_at = CURRENT_TIMESTAMP;
+        PERFORM pg_notify('sector_stats_dirty', f)
+        FROM (SELECT DISTINCT o.focus_group_id AS f FROM new_rows r JOIN organizations o USING (organization_id)) n;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO sector_stats_dirty (focus_group_id)
+        SELECT DISTINCT o.focus_group_id FROM old_rows r JOIN organizations o USING (organization_id)
+        ON CONFLICT (focus_group_id) DO UPDATE SET marked_at = CURRENT_TIMESTAMP;
+        PERFORM pg_notify('sector_stats_dirty', f)
+        FROM (SELECT DISTINCT o.focus_group_id AS f FROM old_rows r JOIN organizations o USING (organization_id)) n;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow one event per trigger, hence three of each
+CREATE TRIGGER trg_organizations_stats_insert
+    AFTER INSERT ON organizations REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_sector_stats_dirty();
+
+CREATE TRIGGER trg_organizations_stats_update
+    AFTER UPDATE ON organizations REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_sector_stats_dirty();
+
+CREATE TRIGGER trg_organizations_stats_delete
+    AFTER DELETE ON organizations REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_sector_stats_dirty();
+
+CREATE TRIGGER trg_dimension_scores_stats_insert
+    AFTER INSERT ON organization_dimension_scores REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_sector_stats_dirty_from_scores();
+
+CREATE TRIGGER trg_dimension_scores_stats_update
+    AFTER UPDATE ON organization_dimension_scores REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_sector_stats_dirty_from_scores();
+
+CREATE TRIGGER trg_dimension_scores_stats_delete
+    AFTER DELETE ON organization_dimension_scores REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_sector_stats_dirty_from_scores();
+
+-- Initial build for every sector
+SELECT refresh_sector_stats(focus_group_id) FROM focus_groups WHERE platform = 'pe_org_air';
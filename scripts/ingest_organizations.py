@@ -0,0 +1,57 @@
+# scripts/ingest_organizations.py
+"""Bulk-load organizations (+ sector attributes) from a CSV or NDJSON file.
+
+Usage:
+    python scripts/ingest_organizations.py portfolio.csv
+    python scripts/ingest_organizations.py fund_iv.ndjson.gz --chunk-size 10000
+    python scripts/ingest_organizations.py portfolio.csv --dry-run
+"""
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.services.ingest import ingest_stream, read_file
+
+
+def _detect_format(path: Path) -> str:
+    suffixes = [s for s in path.suffixes if s != ".gz"]
+    ext = suffixes[-1].lower() if suffixes else ""
+    if ext == ".csv":
+        return "csv"
+    if ext in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise SystemExit(f"❌ cannot infer format from {path.name}; pass --format csv|ndjson")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=("csv", "ndjson"))
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--dry-run", action="store_true", help="validate only, write nothing")
+    args = parser.parse_args()
+
+    fmt = args.format or _detect_format(args.path)
+    if not args.dry_run:
+        await adb.open_pool(min_size=1, max_size=2)
+    try:
+        report = await ingest_stream(
+            read_file(args.path), fmt, chunk_size=args.chunk_size, dry_run=args.dry_run
+        )
+    finally:
+        await adb.close_pool()
+
+    print(json.dumps(report.to_dict(), indent=2, default=str))
+    if report.failed:
+        raise SystemExit(f"❌ ingest failed after {report.rows_written} rows: {report.failed}")
+    print(f"✅ {report.rows_written} written, {report.rows_rejected} rejected in {report.duration_s}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
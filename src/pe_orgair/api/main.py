@@ -7,11 +7,21 @@ from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import structlog
+from opentelemetry import trace
 
 from pe_orgair.config.settings import settings
 from pe_orgair.api.routes.v1 import router as v1_router
 from pe_orgair.api.routes.v2 import router as v2_router
-from pe_orgair.api.routes import health
+from pe_orgair.api.routes import health, metrics
+from pe_orgair.db.notify import PgNotificationListener
+from pe_orgair.db.snowflake import adb
+from pe_orgair.infrastructure.cache import SimpleCache, TieredCache, cache
+from pe_orgair.services.jobs import job_service, job_store
+from pe_orgair.services.rescoring import rescoring_pipeline
+from pe_orgair.services.sector_config import sector_service
+from pe_orgair.services.sector_stats import sector_stats_service
+from pe_orgair.services.warmup import cache_warmer
+from pe_orgair.observability.metrics import HTTP_IN_FLIGHT, HTTP_LATENCY, HTTP_REQUESTS
 from pe_orgair.observability.setup import setup_tracing, setup_logging
 
 logger = structlog.get_logger()
@@ -26,13 +36,47 @@ async def lifespan(app: FastAPI):
                 env=settings.APP_ENV)
     
     # Initialize connections, caches, etc.
-    # await initialize_redis()
-    # await validate_database()
+    pool_kwargs = dict(
+        min_size=settings.DB_POOL_MIN_SIZE,
+        max_size=settings.DB_POOL_MAX_SIZE,
+        timeout=settings.DB_POOL_TIMEOUT,
+        max_idle=settings.DB_POOL_MAX_IDLE,
+        max_lifetime=settings.DB_POOL_MAX_LIFETIME,
+    )
+    # Only the async pool: request handling never uses the sync `db` client
+    await adb.open_pool(**pool_kwargs)
+    if isinstance(cache, (SimpleCache, TieredCache)):
+        cache.start_sweeper(settings.CACHE_SWEEP_INTERVAL)
+    if isinstance(cache, TieredCache):
+        cache.start_listener()
+    job_store.start_sweeper(settings.CACHE_SWEEP_INTERVAL)
+    rescoring_pipeline.register()
+    listeners = []
+    if settings.SECTOR_CDC_ENABLED:
+        listeners.append(PgNotificationListener("sector_config_changed", sector_service.invalidate_cache))
+        listeners.append(PgNotificationListener("sector_stats_dirty", sector_stats_service.mark_dirty))
+        for listener in listeners:
+            listener.start()
+        sector_service.configure_ttl(hard=settings.CACHE_TTL_SECTORS, soft=settings.CACHE_TTL_SECTORS // 2)
+    sector_stats_service.start(settings.SECTOR_STATS_REFRESH_INTERVAL)
+    cache_warmer.start()
     
     yield
     
     # Shutdown
     logger.info("shutting_down_application")
+    await job_service.stop()
+    job_store.stop_sweeper()
+    await cache_warmer.stop()
+    await sector_stats_service.stop()
+    for listener in listeners:
+        await listener.stop()
+    rescoring_pipeline.unregister()
+    if isinstance(cache, TieredCache):
+        cache.stop_listener()
+    if isinstance(cache, (SimpleCache, TieredCache)):
+        cache.stop_sweeper()
+    await adb.close_pool()
 
 def create_app() -> FastAPI:
     """Application factory."""
@@ -60,10 +104,26 @@ def create_app() -> FastAPI:
         correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
+        span = trace.get_current_span()
+        if span.get_span_context().is_valid:
+            span.set_attribute("correlation_id", correlation_id)
+            structlog.contextvars.bind_contextvars(trace_id=format(span.get_span_context().trace_id, "032x"))
         
+        in_flight = HTTP_IN_FLIGHT.labels(request.method)
+        in_flight.inc()
         start_time = time.perf_counter()
-        response = await call_next(request)
-        duration = time.perf_counter() - start_time
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            duration = time.perf_counter() - start_time
+            in_flight.dec()
+            # Route template (not raw path) keeps label cardinality bounded
+            route = request.scope.get("route")
+            route_label = getattr(route, "path", "unmatched")
+            HTTP_REQUESTS.labels(request.method, route_label, str(status_code)).inc()
+            HTTP_LATENCY.labels(request.method, route_label).observe(duration)
         
         response.headers["X-Correlation-ID"] = correlation_id
         response.headers["X-Process-Time"] = f"{duration:.4f}"
@@ -97,6 +157,7 @@ def create_app() -> FastAPI:
     
     # Routes
     app.include_router(health.router, tags=["Health"])
+    app.include_router(metrics.router, tags=["Observability"])
     app.include_router(v1_router, prefix=settings.API_V1_PREFIX)
     app.include_router(v2_router, prefix=settings.API_V2_PREFIX)
     
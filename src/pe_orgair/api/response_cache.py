@@ -0,0 +1,62 @@
+# src/pe_orgair/api/response_cache.py
+"""Pre-encoded JSON response bodies with content ETags."""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class EncodedResponse(NamedTuple):
+    source: Any  # the object the body was rendered from
+    body: bytes
+    etag: str
+
+
+def encode_json(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against `etag`."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    """Per-key encoded bodies, reused for as long as the source object is unchanged.
+
+    The source is the (immutable) object returned by the service layer; when the
+    service hands back the same or an equal object, the stored bytes and ETag are
+    returned without re-encoding. A changed source re-renders and replaces them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, EncodedResponse] = {}
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key: str, source: Any, render: Callable[[Any], Any]) -> EncodedResponse:
+        entry = self._entries.get(key)
+        if entry is not None and (entry.source is source or entry.source == source):
+            return entry
+        body = encode_json(render(source))
+        entry = EncodedResponse(source, body, make_etag(body))
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def discard(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
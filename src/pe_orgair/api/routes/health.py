@@ -1,7 +1,17 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from pe_orgair.services.warmup import cache_warmer
 
 router = APIRouter()
 
 @router.get("/health", summary="Health check")
 def health_check():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+@router.get("/ready", summary="Readiness check (503 until caches are warm)")
+def readiness_check():
+    return JSONResponse(
+        status_code=200 if cache_warmer.is_ready else 503,
+        content=cache_warmer.status(),
+    )
@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from pe_orgair.observability.metrics import render_latest
+
+router = APIRouter()
+
+@router.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+def metrics():
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
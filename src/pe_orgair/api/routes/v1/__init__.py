@@ -13,4 +13,8 @@ def greet_user(payload: GreetUserRequest):
 from pe_orgair.api.routes.v1.items import router as items_router
 router.include_router(items_router)
 from pe_orgair.api.routes.v1.sector_config import router as sector_router
-app.include_router(sector_router)
\ No newline at end of file
+router.include_router(sector_router)
+from pe_orgair.api.routes.v1.organizations import router as organizations_router
+router.include_router(organizations_router)
+from pe_orgair.api.routes.v1.jobs import router as jobs_router
+router.include_router(jobs_router)
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+
+from pe_orgair.schemas.jobs import JobInfo, JobSubmitRequest
+from pe_orgair.services.jobs import job_service
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def job_response(request: Request, job: JobInfo, created: bool) -> JSONResponse:
+    """202 for a newly queued job, 200 when an idempotent resubmission returned an existing one."""
+    return JSONResponse(
+        job.model_dump(mode="json"),
+        status_code=202 if created else 200,
+        headers={"Location": str(request.url_for("get_job", job_id=job.job_id))},
+    )
+
+
+@router.post("", response_model=JobInfo, status_code=202)
+async def submit_job(
+    request: Request,
+    payload: JobSubmitRequest,
+    idempotency_key: Optional[str] = Header(default=None, max_length=200),
+):
+    """Queue a catalog reload or portfolio rescore; poll GET /jobs/{job_id} for progress.
+
+    Resubmitting with the same `idempotency_key` (body field or Idempotency-Key
+    header) returns the existing job unless it failed. Without a key, an
+    identical request returns the job already queued or running, if any.
+    """
+    try:
+        job, created = await job_service.submit(
+            payload.kind, payload.params, payload.idempotency_key or idempotency_key
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    return job_response(request, job, created)
+
+
+@router.get("/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str):
+    """Current state, progress and (once finished) result or error of a job."""
+    job = await job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
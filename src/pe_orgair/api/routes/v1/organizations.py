@@ -0,0 +1,102 @@
+import asyncio
+import uuid
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from pe_orgair.api.routes.v1.jobs import job_response
+from pe_orgair.services.ingest import ingest_stream
+from pe_orgair.services.jobs import job_service, spool_dir
+from pe_orgair.services.organizations import OrganizationFilters, organization_service
+
+router = APIRouter(prefix="/organizations", tags=["organizations"])
+
+_INGEST_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json-seq": "ndjson",
+}
+
+
+@router.get("")
+async def list_organizations(
+    focus_group_id: Optional[List[str]] = Query(default=None),
+    status: Literal["active", "inactive", "archived"] = "active",
+    headquarters_country: Optional[str] = Query(default=None, min_length=2, max_length=3),
+    min_revenue: Optional[float] = Query(default=None, ge=0),
+    max_revenue: Optional[float] = Query(default=None, ge=0),
+    min_employees: Optional[int] = Query(default=None, ge=0),
+    max_employees: Optional[int] = Query(default=None, ge=0),
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+):
+    """Organizations ordered by legal name, paginated by cursor (not offset).
+
+    Pass the returned `next_cursor` to get the following page; it is null on the
+    last page and only valid with the same filters.
+    """
+    filters = OrganizationFilters(
+        focus_group_ids=tuple(sorted(set(focus_group_id))) if focus_group_id else None,
+        status=status,
+        headquarters_country=headquarters_country.upper() if headquarters_country else None,
+        min_revenue=min_revenue,
+        max_revenue=max_revenue,
+        min_employees=min_employees,
+        max_employees=max_employees,
+    )
+    try:
+        rows, next_cursor = await organization_service.list_organizations(filters, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    return {"organizations": rows, "count": len(rows), "next_cursor": next_cursor}
+
+
+@router.post(":ingest")
+async def ingest_organizations(
+    request: Request,
+    content_type: Optional[str] = Header(default=None),
+    chunk_size: int = Query(default=5000, ge=100, le=50000),
+    dry_run: bool = Query(default=False),
+    background: bool = Query(default=False, description="spool the body and ingest it as a job"),
+    idempotency_key: Optional[str] = Header(default=None, max_length=200),
+):
+    """Bulk upsert organizations (+ sector attributes) from a streamed CSV or NDJSON body.
+
+    The body is parsed while it is being received; rows that fail validation
+    are counted and listed (first 100) in the report instead of failing the
+    upload. A database error stops the ingest; chunks committed before it stay.
+
+    With `background=true` the body is written to the spool directory and a
+    202 with an `ingest_organizations` job is returned instead; its result is
+    the same report. Poll GET /jobs/{job_id} for progress.
+    """
+    fmt = _INGEST_FORMATS.get((content_type or "").split(";")[0].strip().lower())
+    if fmt is None:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Content-Type must be one of: {', '.join(sorted(_INGEST_FORMATS))}",
+        )
+    if background:
+        path = spool_dir() / f"{uuid.uuid4().hex}.{fmt}"
+        try:
+            with open(path, "wb") as f:
+                async for chunk in request.stream():
+                    await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        try:
+            job, created = await job_service.submit(
+                "ingest_organizations",
+                {"path": str(path), "format": fmt, "chunk_size": chunk_size, "dry_run": dry_run},
+                idempotency_key,
+            )
+        except Exception:
+            path.unlink(missing_ok=True)
+            raise
+        if not created:
+            path.unlink(missing_ok=True)
+        return job_response(request, job, created)
+    report = await ingest_stream(request.stream(), fmt, chunk_size=chunk_size, dry_run=dry_run)
+    return JSONResponse(report.to_dict(), status_code=500 if report.failed else 200)
@@ -1,18 +1,112 @@
-from fastapi import APIRouter, HTTPException
+from typing import Iterable, Iterator, List, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pe_orgair.api.response_cache import EncodedResponse, ResponseCache, encode_json, etag_matches
+from pe_orgair.schemas.sector_config import SectorBatchGetRequest, SectorConfigContract
 from pe_orgair.services.sector_config import sector_service
+from pe_orgair.services.sector_stats import sector_stats_service
 
 router = APIRouter(prefix="/sectors", tags=["sectors"])
 
+NDJSON = "application/x-ndjson"
+
+# Encoded bodies keyed by focus_group_id; re-rendered only when the config changes
+_responses = ResponseCache()
+_stats_responses = ResponseCache()
+
+
+def _sector_payload(cfg: SectorConfigContract) -> dict:
+    weights_sum = sum(cfg.dimension_weights.values())
+    return {
+        "focus_group_id": cfg.sector_id,
+        "group_name": cfg.sector_name,
+        "group_code": cfg.sector_code,
+        "dimension_weights": {k: str(v) for k, v in cfg.dimension_weights.items()},
+        "calibrations": {k: str(v) for k, v in cfg.calibrations.items()},
+        "weights_sum_ok": abs(weights_sum - 1) < 0.001,
+    }
+
+
+def _encoded(cfgs: Iterable[SectorConfigContract]) -> List[EncodedResponse]:
+    return [_responses.get_or_render(cfg.sector_id, cfg, _sector_payload) for cfg in cfgs]
+
+
+def _ndjson_lines(encoded: List[EncodedResponse]) -> Iterator[bytes]:
+    for item in encoded:
+        yield item.body + b"\n"
+
+
+def _collection_response(encoded: List[EncodedResponse], accept: Optional[str], **extra) -> Response:
+    """JSON envelope spliced from the cached per-sector bodies, or NDJSON when asked."""
+    if accept and NDJSON in accept:
+        return StreamingResponse(_ndjson_lines(encoded), media_type=NDJSON)
+    body = b'{"sectors":[' + b",".join(e.body for e in encoded) + b"]"
+    body += b',"count":' + str(len(encoded)).encode()
+    for name, value in extra.items():
+        body += b',"' + name.encode() + b'":' + encode_json(value)
+    return Response(content=body + b"}", media_type="application/json")
+
+
+@router.get("")
+async def list_sector_configs(
+    focus_group_id: Optional[List[str]] = Query(default=None),
+    group_code: Optional[List[str]] = Query(default=None),
+    accept: Optional[str] = Header(default=None),
+):
+    """All active sectors, optionally filtered by id and/or group code."""
+    cfgs = await sector_service.get_all_configs()
+    if focus_group_id:
+        wanted = set(focus_group_id)
+        cfgs = [c for c in cfgs if c.sector_id in wanted]
+    if group_code:
+        wanted = {code.upper() for code in group_code}
+        cfgs = [c for c in cfgs if c.sector_code in wanted]
+    return _collection_response(_encoded(cfgs), accept)
+
+
+@router.post(":batchGet")
+async def batch_get_sector_configs(
+    payload: SectorBatchGetRequest,
+    accept: Optional[str] = Header(default=None),
+):
+    """Several sectors by id in one call; unknown ids are listed in `not_found`."""
+    found = await sector_service.get_configs(payload.ids)
+    cfgs = [cfg for cfg in found.values() if cfg is not None]
+    not_found = [fg_id for fg_id, cfg in found.items() if cfg is None]
+    return _collection_response(_encoded(cfgs), accept, not_found=not_found)
+
+
 @router.get("/{focus_group_id}")
-async def get_sector_config(focus_group_id: str):
+async def get_sector_config(
+    focus_group_id: str,
+    if_none_match: Optional[str] = Header(default=None),
+):
     cfg = await sector_service.get_config(focus_group_id)
     if not cfg:
+        _responses.discard(focus_group_id)
         raise HTTPException(status_code=404, detail="Unknown focus_group_id")
-    return {
-        "focus_group_id": cfg.focus_group_id,
-        "group_name": cfg.group_name,
-        "group_code": cfg.group_code,
-        "dimension_weights": {k: str(v) for k, v in cfg.dimension_weights.items()},
-        "calibrations": {k: str(v) for k, v in cfg.calibrations.items()},
-        "weights_sum_ok": cfg.validate_weights_sum(),
-    }
\ No newline at end of file
+
+    encoded = _responses.get_or_render(focus_group_id, cfg, _sector_payload)
+    headers = {"ETag": encoded.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, encoded.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
+@router.get("/{focus_group_id}/stats")
+async def get_sector_stats(
+    focus_group_id: str,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """Precomputed counts, revenue, headcount distribution and average dimension scores."""
+    stats = await sector_stats_service.get_stats(focus_group_id)
+    if stats is None:
+        _stats_responses.discard(focus_group_id)
+        raise HTTPException(status_code=404, detail="Unknown focus_group_id")
+
+    encoded = _stats_responses.get_or_render(focus_group_id, stats, lambda s: s.model_dump(mode="json"))
+    headers = {"ETag": encoded.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, encoded.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
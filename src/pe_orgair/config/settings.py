@@ -42,6 +42,13 @@ class Settings(BaseSettings):
     SNOWFLAKE_WAREHOUSE: str
     SNOWFLAKE_ROLE: str = "PE_ORGAIR_ROLE"
     
+    # Postgres connection pool
+    DB_POOL_MIN_SIZE: int = Field(default=2, ge=0, le=100)
+    DB_POOL_MAX_SIZE: int = Field(default=10, ge=1, le=200)
+    DB_POOL_TIMEOUT: float = Field(default=10.0, gt=0)        # seconds to wait for a free connection
+    DB_POOL_MAX_IDLE: float = Field(default=300.0, gt=0)      # close idle connections above min_size
+    DB_POOL_MAX_LIFETIME: float = Field(default=3600.0, gt=0) # recycle connections after this long
+    
     # AWS
     AWS_ACCESS_KEY_ID: SecretStr
     AWS_SECRET_ACCESS_KEY: SecretStr
@@ -50,7 +57,20 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_BACKEND: Literal["memory", "redis", "tiered"] = "memory"
+    CACHE_L1_TTL: int = Field(default=5, ge=1)  # seconds; local tier of the "tiered" backend
+    CACHE_MAX_ENTRIES: int = Field(default=10000, ge=0)  # 0 = unbounded
+    CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, ge=0)  # approximate; 0 = unbounded
+    CACHE_EVICTION_POLICY: Literal["lru", "lfu"] = "lru"
+    CACHE_SWEEP_INTERVAL: float = Field(default=60.0, gt=0)  # seconds between expired-key sweeps
+    # Push invalidation via Postgres LISTEN/NOTIFY (migration 008); when on,
+    # sector configs are cached for CACHE_TTL_SECTORS instead of 1 hour
+    SECTOR_CDC_ENABLED: bool = False
     CACHE_TTL_SECTORS: int = 86400  # 24 hours
+
+    # Sector stats: the dirty table is drained every SECTOR_STATS_REFRESH_INTERVAL
+    # seconds (and on NOTIFY when SECTOR_CDC_ENABLED)
+    SECTOR_STATS_REFRESH_INTERVAL: float = Field(default=60.0, gt=0)
     CACHE_TTL_SCORES: int = 3600    # 1 hour
     
     # LLM Providers (Multi-provider via LiteLLM)
@@ -85,10 +105,24 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
+
+    # Background jobs: "local" runs them in a process pool on each API instance,
+    # "celery" sends them to `celery -A pe_orgair.worker worker`
+    JOBS_BACKEND: Literal["local", "celery"] = "local"
+    JOBS_LOCAL_WORKERS: int = Field(default=2, ge=1, le=32)
+    JOB_TTL: int = Field(default=86400, ge=60)  # seconds a job's status is kept
+    # Job status is kept in Redis under Celery or a redis/tiered CACHE_BACKEND
+    # (in process otherwise). That Redis must not evict keys (maxmemory-policy
+    # noeviction); default: REDIS_URL
+    JOBS_REDIS_URL: Optional[str] = None
+    INGEST_SPOOL_DIR: Optional[str] = None  # uploads for background ingest; default: system temp dir
     
     # Observability
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None
     OTEL_SERVICE_NAME: str = "pe-orgair"
+    OTEL_TRACES_EXPORTER: Optional[Literal["otlp", "console", "file", "memory", "none"]] = None
+    OTEL_TRACES_SAMPLER_RATIO: float = Field(default=1.0, ge=0.0, le=1.0)
+    OTEL_TRACES_FILE: str = "traces.jsonl"  # used by the "file" exporter
     
     @field_validator("OPENAI_API_KEY")
     @classmethod
@@ -109,6 +143,13 @@ class Settings(BaseSettings):
             raise ValueError(f"Dimension weights must sum to 1.0, got {total}")
         return self
     
+    @model_validator(mode="after")
+    def validate_db_pool(self):
+        """Pool minimum cannot exceed its maximum."""
+        if self.DB_POOL_MIN_SIZE > self.DB_POOL_MAX_SIZE:
+            raise ValueError("DB_POOL_MIN_SIZE must be <= DB_POOL_MAX_SIZE")
+        return self
+    
     @model_validator(mode="after")
     def validate_production_settings(self):
         """Ensure production has required security settings."""
@@ -0,0 +1,92 @@
+# src/pe_orgair/db/notify.py
+"""Postgres LISTEN/NOTIFY consumer."""
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Optional, Set
+
+import psycopg
+import structlog
+from psycopg import sql
+
+from pe_orgair.db.snowflake import _database_url
+
+logger = structlog.get_logger()
+
+
+class PgNotificationListener:
+    """Listens on one channel and hands payloads to `handler`, debounced.
+
+    Payloads arriving within `debounce` seconds are de-duplicated and delivered
+    together, so a transaction touching many weight rows of one sector causes a
+    single callback. After a reconnect `handler(None)` is called once, because
+    notifications sent while disconnected are lost.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        handler: Callable[[Optional[str]], None],
+        debounce: float = 0.1,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self._channel = channel
+        self._handler = handler
+        self._debounce = debounce
+        self._max_backoff = max_backoff
+        self._pending: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        for task in (self._task, self._flush_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._flush_task = None
+
+    async def _run(self) -> None:
+        backoff = 0.5
+        connected_before = False
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(_database_url(), autocommit=True) as conn:
+                    await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+                    logger.info("pg_listener_connected", channel=self._channel)
+                    if connected_before:
+                        self._deliver(None)
+                    connected_before = True
+                    backoff = 0.5
+                    async for notify in conn.notifies():
+                        self._enqueue(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("pg_listener_disconnected", channel=self._channel, error=str(e), retry_in_s=backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+
+    def _enqueue(self, payload: str) -> None:
+        self._pending.add(payload)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._debounce)
+        pending, self._pending = self._pending, set()
+        for payload in sorted(pending):
+            self._deliver(payload or None)
+
+    def _deliver(self, payload: Optional[str]) -> None:
+        try:
+            self._handler(payload)
+        except Exception as e:
+            logger.exception("pg_listener_handler_failed", channel=self._channel, payload=payload, error=str(e))
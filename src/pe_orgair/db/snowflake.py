@@ -2,29 +2,208 @@
 # (Yes the filename says snowflake — we’re keeping it so your existing import works.)
 
 import os
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
 import psycopg
 import psycopg.rows
+from opentelemetry import trace
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+from pe_orgair.observability.metrics import DB_QUERY_ERRORS, DB_QUERY_SECONDS
+
+_tracer = trace.get_tracer(__name__)
+
+
+@contextmanager
+def _observe(client: str, op: str, name: Optional[str] = None) -> Iterator[trace.Span]:
+    """Time a query and wrap it in a client span; `name` labels the statement in traces."""
+    with DB_QUERY_SECONDS.labels(client, op).time(), _tracer.start_as_current_span(
+        f"db.{name or op}",
+        kind=trace.SpanKind.CLIENT,
+        attributes={"db.system": "postgresql", "db.operation.name": op},
+    ) as span:
+        try:
+            yield span
+        except Exception:
+            DB_QUERY_ERRORS.labels(client, op).inc()
+            raise
+
+
+def _database_url() -> str:
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL not set in environment/.env")
+    return url
 
 
 class _DB:
-    def _conn(self):
-        url = os.getenv("DATABASE_URL")
-        if not url:
-            raise RuntimeError("DATABASE_URL not set in environment/.env")
-        return psycopg.connect(url, row_factory=psycopg.rows.dict_row)
-
-    def fetch_one(self, query: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        with self._conn() as conn:
+    """Sync query helper.
+
+    When a pool has been opened connections are borrowed from it; otherwise each
+    call opens a one-off connection, which keeps standalone scripts working
+    without any setup. The app itself queries through `adb`, so its lifespan
+    opens only the async pool.
+    """
+
+    def __init__(self) -> None:
+        self._pool: Optional[ConnectionPool] = None
+
+    def open_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle: float = 600.0,
+        max_lifetime: float = 3600.0,
+    ) -> None:
+        """Open the shared connection pool (no-op if already open)."""
+        if self._pool is not None:
+            return
+        self._pool = ConnectionPool(
+            _database_url(),
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            max_idle=max_idle,
+            max_lifetime=max_lifetime,
+            check=ConnectionPool.check_connection,
+            kwargs={"row_factory": psycopg.rows.dict_row},
+            name="pe_orgair",
+            open=False,
+        )
+        self._pool.open(wait=True, timeout=timeout)
+
+    def close_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    @contextmanager
+    def _conn(self) -> Iterator[psycopg.Connection]:
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                yield conn
+            return
+        with psycopg.connect(_database_url(), row_factory=psycopg.rows.dict_row) as conn:
+            yield conn
+
+    def fetch_one(
+        self, query: str, params: Optional[Dict[str, Any]] = None, *, name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        with _observe("sync", "fetch_one", name) as span, self._conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params or {})
-                return cur.fetchone()
+                row = cur.fetchone()
+                span.set_attribute("db.response.returned_rows", int(row is not None))
+                return row
 
-    def fetch_all(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        with self._conn() as conn:
+    def fetch_all(
+        self, query: str, params: Optional[Dict[str, Any]] = None, *, name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        with _observe("sync", "fetch_all", name) as span, self._conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params or {})
-                return cur.fetchall()
+                rows = cur.fetchall()
+                span.set_attribute("db.response.returned_rows", len(rows))
+                return rows
+
+
+class _AsyncDB:
+    """Async counterpart of `_DB` for code running on the event loop.
+
+    Same pooling/fallback behavior: borrow from the async pool when the
+    lifespan has opened it, otherwise open a one-off `AsyncConnection`.
+    """
+
+    def __init__(self) -> None:
+        self._pool: Optional[AsyncConnectionPool] = None
+
+    async def open_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle: float = 600.0,
+        max_lifetime: float = 3600.0,
+    ) -> None:
+        """Open the shared async connection pool (no-op if already open)."""
+        if self._pool is not None:
+            return
+        self._pool = AsyncConnectionPool(
+            _database_url(),
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            max_idle=max_idle,
+            max_lifetime=max_lifetime,
+            check=AsyncConnectionPool.check_connection,
+            kwargs={"row_factory": psycopg.rows.dict_row},
+            name="pe_orgair_async",
+            open=False,
+        )
+        await self._pool.open(wait=True, timeout=timeout)
+
+    async def close_pool(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    @asynccontextmanager
+    async def _conn(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        if self._pool is not None:
+            async with self._pool.connection() as conn:
+                yield conn
+            return
+        async with await psycopg.AsyncConnection.connect(
+            _database_url(), row_factory=psycopg.rows.dict_row
+        ) as conn:
+            yield conn
+
+    async def fetch_one(
+        self, query: str, params: Optional[Dict[str, Any]] = None, *, name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        with _observe("async", "fetch_one", name) as span:
+            async with self._conn() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params or {})
+                    row = await cur.fetchone()
+                    span.set_attribute("db.response.returned_rows", int(row is not None))
+                    return row
+
+    async def fetch_all(
+        self, query: str, params: Optional[Dict[str, Any]] = None, *, name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        with _observe("async", "fetch_all", name) as span:
+            async with self._conn() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params or {})
+                    rows = await cur.fetchall()
+                    span.set_attribute("db.response.returned_rows", len(rows))
+                    return rows
+
+    async def execute_many(
+        self, query: str, params_seq: Sequence[Dict[str, Any]], *, name: Optional[str] = None
+    ) -> int:
+        """Run one statement for every params dict in a single transaction; returns rows affected."""
+        with _observe("async", "execute_many", name) as span:
+            async with self._conn() as conn:
+                async with conn.cursor() as cur:
+                    await cur.executemany(query, params_seq)
+                    span.set_attribute("db.response.affected_rows", cur.rowcount)
+                    return cur.rowcount
+
+    @asynccontextmanager
+    async def transaction(self, name: Optional[str] = None) -> AsyncIterator[psycopg.AsyncConnection]:
+        """A connection inside one transaction (committed on exit, rolled back on error).
+
+        For multi-statement work such as COPY into a staging table followed by
+        an upsert.
+        """
+        with _observe("async", "transaction", name):
+            async with self._conn() as conn:
+                async with conn.transaction():
+                    yield conn
 
 
-db = _DB()
\ No newline at end of file
+db = _DB()
+adb = _AsyncDB()
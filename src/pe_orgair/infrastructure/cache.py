@@ -1,40 +1,849 @@
 # src/pe_orgair/infrastructure/cache.py
 
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import asyncio
+import heapq
+import importlib
+import json
+import random
+import sys
+import threading
 import time
 
+import redis
+import structlog
+from opentelemetry import trace
+from pydantic import BaseModel
+
+from pe_orgair.config.settings import settings
+from pe_orgair.observability.metrics import CACHE_EVICTIONS, CACHE_REQUESTS
+
+logger = structlog.get_logger()
+
+_MISSING = object()
+
+# Pre-bound metric children keep the hot path to a single increment
+_MEM_HIT = CACHE_REQUESTS.labels("memory", "hit")
+_MEM_MISS = CACHE_REQUESTS.labels("memory", "miss")
+_MEM_EVICTED = CACHE_EVICTIONS.labels("memory", "capacity")
+_MEM_EXPIRED = CACHE_EVICTIONS.labels("memory", "expired")
+_REDIS_HIT = CACHE_REQUESTS.labels("redis", "hit")
+_REDIS_MISS = CACHE_REQUESTS.labels("redis", "miss")
+_REDIS_ERROR = CACHE_REQUESTS.labels("redis", "error")
+
+_tracer = trace.get_tracer(__name__)
+
+
+def _span(backend: str, op: str, **attributes: Any):
+    """Internal span for one cache operation (e.g. "cache.memory.get")."""
+    return _tracer.start_as_current_span(
+        f"cache.{backend}.{op}",
+        kind=trace.SpanKind.INTERNAL if backend == "memory" else trace.SpanKind.CLIENT,
+        attributes={"cache.backend": backend, **attributes},
+    )
+
+
+def jittered(ttl: int, fraction: float = 0.1) -> int:
+    """Spread a TTL by ±fraction so keys written together don't expire together."""
+    if not ttl or ttl <= 0:
+        return ttl
+    spread = int(ttl * fraction)
+    return max(1, ttl + random.randint(-spread, spread))
+
+
+class CacheEntry(NamedTuple):
+    """A cached value plus its soft expiry (0 = never goes stale)."""
+    value: Any
+    soft_expires_at: float = 0.0
+
+    @property
+    def stale(self) -> bool:
+        return bool(self.soft_expires_at) and time.time() > self.soft_expires_at
+
+
+def _soft_deadline(ttl: int, soft_ttl: int) -> float:
+    # A soft TTL only means something if it ends before the hard TTL
+    if soft_ttl and soft_ttl > 0 and (not ttl or ttl <= 0 or soft_ttl < ttl):
+        return time.time() + soft_ttl
+    return 0.0
+
+
+class EvictionPolicy(ABC):
+    """Tracks key usage for SimpleCache and picks the next key to evict."""
+
+    @abstractmethod
+    def add(self, key: str) -> None: ...
+
+    @abstractmethod
+    def touch(self, key: str) -> None: ...
+
+    @abstractmethod
+    def remove(self, key: str) -> None: ...
+
+    @abstractmethod
+    def victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        """The next key to evict, never `exclude` (None if there is no other key)."""
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+    def __init__(self) -> None:
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, key: str) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def touch(self, key: str) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        # `exclude` is the key just stored, so at most the first two are looked at
+        return next((key for key in self._order if key != exclude), None)
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evict the least frequently used key (LRU among ties), O(1) per operation."""
+
+    def __init__(self) -> None:
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min = 0
+
+    def _bump(self, key: str, freq: int) -> None:
+        self._freq[key] = freq
+        self._buckets.setdefault(freq, OrderedDict())[key] = None
+
+    def _unlink(self, key: str) -> int:
+        freq = self._freq.pop(key)
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min == freq:
+                self._min = min(self._buckets, default=0)
+        return freq
+
+    def add(self, key: str) -> None:
+        if key in self._freq:
+            self.touch(key)
+            return
+        self._bump(key, 1)
+        self._min = 1
+
+    def touch(self, key: str) -> None:
+        if key not in self._freq:
+            return
+        freq = self._unlink(key) + 1
+        self._bump(key, freq)
+        if not self._min or freq < self._min:
+            self._min = freq
+
+    def remove(self, key: str) -> None:
+        if key in self._freq:
+            self._unlink(key)
+
+    def victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        bucket = self._buckets.get(self._min)
+        if bucket:
+            for key in bucket:
+                if key != exclude:
+                    return key
+        # `exclude` (a fresh insert, frequency 1) is alone in the lowest bucket
+        higher = [freq for freq in self._buckets if freq != self._min]
+        return next(iter(self._buckets[min(higher)])) if higher else None
+
+
+_POLICIES = {"lru": LRUPolicy, "lfu": LFUPolicy}
+
+
+_SIZE_SAMPLE = 64
+
+
+def _sampled_size(items: Iterable[Any], n: int, depth: int) -> int:
+    # Large containers (e.g. columnar batches) are sized from an evenly spaced sample
+    if n > _SIZE_SAMPLE:
+        stride = n // _SIZE_SAMPLE
+        items = [item for i, item in enumerate(items) if i % stride == 0]
+    total = sum(_approx_size(item, depth) for item in items)
+    return total * n // len(items) if n > _SIZE_SAMPLE else total
+
+
+def _approx_size(value: Any, _depth: int = 0) -> int:
+    """Rough in-memory footprint of a cached value (containers walked a few levels deep)."""
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        size += _sampled_size(value.keys(), len(value), _depth + 1)
+        size += _sampled_size(value.values(), len(value), _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += _sampled_size(value, len(value), _depth + 1)
+    elif isinstance(value, BaseModel):
+        size += _approx_size(value.__dict__, _depth + 1)
+    return size
+
+
+class _TrieNode:
+    __slots__ = ("children", "key")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.key: Optional[str] = None
+
+
+class _PrefixIndex:
+    """Trie over ':'-separated key segments, so pattern lookups only visit matching subtrees."""
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def add(self, key: str) -> None:
+        node = self._root
+        for seg in key.split(":"):
+            node = node.children.setdefault(seg, _TrieNode())
+        node.key = key
+
+    def remove(self, key: str) -> None:
+        path = [self._root]
+        segs = key.split(":")
+        for seg in segs:
+            node = path[-1].children.get(seg)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].key = None
+        # Prune now-empty branches bottom-up
+        for seg, parent, node in zip(reversed(segs), reversed(path[:-1]), reversed(path[1:])):
+            if node.key is not None or node.children:
+                break
+            del parent.children[seg]
+
+    def with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield every indexed key that starts with `prefix`."""
+        *full, partial = prefix.split(":")
+        node = self._root
+        for seg in full:
+            node = node.children.get(seg)
+            if node is None:
+                return
+        for seg, child in list(node.children.items()):
+            if seg.startswith(partial):
+                yield from self._walk(child)
+
+    @staticmethod
+    def _walk(node: _TrieNode) -> Iterator[str]:
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n.key is not None:
+                yield n.key
+            stack.extend(n.children.values())
+
+
+def _literal_prefix(pattern: str) -> str:
+    """The part of a glob pattern before its first wildcard."""
+    for i, ch in enumerate(pattern):
+        if ch in "*?[":
+            return pattern[:i]
+    return pattern
+
 
 class SimpleCache:
-    def __init__(self):
+    """In-process cache with hard/soft TTLs and optional bounds.
+
+    `max_entries` / `max_bytes` (0 = unbounded) are enforced on `set` by evicting
+    keys chosen by the eviction policy ("lru", "lfu" or an EvictionPolicy).
+    Expired keys are dropped lazily on read and by `sweep_expired()`, which
+    `start_sweeper()` runs periodically on a daemon thread. Keys are indexed by
+    ':'-separated prefix so `invalidate_pattern` only touches matching keys.
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0, policy: Any = "lru"):
         self._store: Dict[str, Any] = {}
         self._expires: Dict[str, float] = {}
+        self._soft: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._index = _PrefixIndex()
+        self._bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._policy: EvictionPolicy = _POLICIES[policy]() if isinstance(policy, str) else policy
+        self._lock = threading.RLock()
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
 
     def get(self, key: str) -> Optional[Any]:
-        exp = self._expires.get(key)
-        if exp is not None and time.time() > exp:
-            self._store.pop(key, None)
-            self._expires.pop(key, None)
-            return None
-        return self._store.get(key)
+        with _span("memory", "get", key=key) as span:
+            value = self._lookup(key)
+            span.set_attribute("cache.hit", value is not None)
+            return value
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        with self._lock:
+            exp = self._expires.get(key)
+            if exp is not None and time.time() > exp:
+                self._remove(key)
+                self.expirations += 1
+                _MEM_EXPIRED.inc()
+                _MEM_MISS.inc()
+                return None
+            value = self._store.get(key, _MISSING)
+            if value is _MISSING:
+                _MEM_MISS.inc()
+                return None
+            self._policy.touch(key)
+            _MEM_HIT.inc()
+            return value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Like get(), but also reports whether the value is past its soft TTL."""
+        with _span("memory", "get_entry", key=key) as span:
+            entry = self._lookup_entry(key)
+            span.set_attribute("cache.hit", entry is not None)
+            return entry
+
+    def _lookup_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                return None
+            return CacheEntry(value, self._soft.get(key, 0.0))
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Multi-get: entries for the keys that are present (misses are omitted)."""
+        keys = list(keys)
+        with _span("memory", "get_entries", keys=len(keys)) as span, self._lock:
+            found = {}
+            for key in keys:
+                entry = self._lookup_entry(key)
+                if entry is not None:
+                    found[key] = entry
+            span.set_attribute("cache.hits", len(found))
+            return found
+
+    def set(self, key: str, value: Any, ttl: int = 0, soft_ttl: int = 0) -> None:
+        """Store `value`; `ttl` is the hard expiry, `soft_ttl` when it turns stale."""
+        with _span("memory", "set", key=key, ttl=ttl):
+            self._store_value(key, value, ttl, soft_ttl)
+
+    def _store_value(self, key: str, value: Any, ttl: int, soft_ttl: int) -> None:
+        size = _approx_size(value) if self._max_bytes else 0
+        if self._max_bytes and size > self._max_bytes:
+            logger.warning("cache_value_too_large", key=key, size=size, max_bytes=self._max_bytes)
+            with self._lock:
+                self._remove(key)
+            return
 
-    def set(self, key: str, value: Any, ttl: int = 0) -> None:
-        self._store[key] = value
-        if ttl and ttl > 0:
-            self._expires[key] = time.time() + ttl
-        else:
-            self._expires.pop(key, None)
+        with self._lock:
+            if key in self._store:
+                self._bytes -= self._sizes.get(key, 0)
+            else:
+                self._index.add(key)
+            self._store[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+            self._policy.add(key)
+            if ttl and ttl > 0:
+                exp = time.time() + ttl
+                self._expires[key] = exp
+                heapq.heappush(self._expiry_heap, (exp, key))
+            else:
+                self._expires.pop(key, None)
+            soft_at = _soft_deadline(ttl, soft_ttl)
+            if soft_at:
+                self._soft[key] = soft_at
+            else:
+                self._soft.pop(key, None)
+            self._enforce_bounds(keep=key)
+
+    def add(self, key: str, value: Any, ttl: int = 0) -> bool:
+        """Store `value` only if `key` is absent (or expired); True if it was stored."""
+        with _span("memory", "add", key=key) as span, self._lock:
+            added = self._lookup(key) is None
+            if added:
+                self._store_value(key, value, ttl, 0)
+            span.set_attribute("cache.added", added)
+            return added
 
     def delete(self, key: str) -> None:
-        self._store.pop(key, None)
+        with _span("memory", "delete", key=key), self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        if self._store.pop(key, _MISSING) is _MISSING:
+            return
         self._expires.pop(key, None)
+        self._soft.pop(key, None)
+        self._bytes -= self._sizes.pop(key, 0)
+        self._policy.remove(key)
+        self._index.remove(key)
+
+    def _enforce_bounds(self, keep: str) -> None:
+        while (self._max_entries and len(self._store) > self._max_entries) or (
+            self._max_bytes and self._bytes > self._max_bytes
+        ):
+            # Never the key being stored: under LFU it is usually the least used
+            victim = self._policy.victim(exclude=keep)
+            if victim is None:
+                break
+            self._remove(victim)
+            self.evictions += 1
+            _MEM_EVICTED.inc()
+
+    def sweep_expired(self) -> int:
+        """Drop every key whose hard TTL has passed; returns how many were removed."""
+        removed = 0
+        now = time.time()
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                exp, key = heapq.heappop(heap)
+                # Heap entries go stale when a key is re-set or deleted; skip those
+                if self._expires.get(key) == exp:
+                    self._remove(key)
+                    removed += 1
+            self.expirations += removed
+        _MEM_EXPIRED.inc(removed)
+        return removed
+
+    def start_sweeper(self, interval: float = 60.0) -> None:
+        """Run sweep_expired() every `interval` seconds on a daemon thread."""
+        if self._sweeper is not None:
+            return
+        self._sweeper_stop.clear()
+
+        def _run() -> None:
+            while not self._sweeper_stop.wait(interval):
+                self.sweep_expired()
+
+        self._sweeper = threading.Thread(target=_run, name="cache-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper_stop.set()
+            self._sweeper.join(timeout=5)
+            self._sweeper = None
+
+    # Async API: every backend offers one so callers on the event loop don't
+    # care which they hold. In-process operations never block, so these run inline.
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aget_entry(self, key: str) -> Optional[CacheEntry]:
+        return self.get_entry(key)
+
+    async def aget_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        return self.get_entries(keys)
+
+    async def aset(self, key: str, value: Any, ttl: int = 0, soft_ttl: int = 0) -> None:
+        self.set(key, value, ttl, soft_ttl)
+
+    async def aadd(self, key: str, value: Any, ttl: int = 0) -> bool:
+        return self.add(key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        self.delete(key)
+
+    async def ainvalidate_pattern(self, pattern: str) -> None:
+        self.invalidate_pattern(pattern)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._store),
+            "bytes": self._bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def invalidate_pattern(self, pattern: str) -> None:
+        """Delete keys matching a glob pattern like "sectors:*" or "score:pe_?*:2024-*"."""
+        prefix = _literal_prefix(pattern)
+        with _span("memory", "invalidate_pattern", pattern=pattern) as span, self._lock:
+            if prefix == pattern:
+                self._remove(pattern)
+                return
+            keys = [k for k in self._index.with_prefix(prefix) if fnmatchcase(k, pattern)]
+            for k in keys:
+                self._remove(k)
+            span.set_attribute("cache.removed", len(keys))
+
+
+# Only our own models may be named in a cached payload, so a value written to
+# the shared Redis by anything else can't make us import arbitrary modules.
+_MODEL_PACKAGE = "pe_orgair."
+
+
+@lru_cache(maxsize=None)
+def _model_class(path: str) -> type:
+    module, _, qualname = path.partition(":")
+    if not module.startswith(_MODEL_PACKAGE) or not qualname:
+        raise TypeError(f"{path} is not an allowed cache model")
+    cls = importlib.import_module(module)
+    for part in qualname.split("."):
+        cls = getattr(cls, part)
+    if not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+        raise TypeError(f"{path} is not a pydantic model")
+    return cls
+
+
+def _encode(value: Any) -> Any:
+    """Make a value JSON-safe; pydantic models are tagged so they decode back to models."""
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        return {"__model__": f"{cls.__module__}:{cls.__qualname__}", "data": value.model_dump(mode="json")}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict) and "__model__" in value:
+        return _model_class(value["__model__"]).model_validate(value["data"])
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class RedisCache:
+    """Shared cache with the same contract as SimpleCache, backed by Redis.
+
+    Values must be JSON-serializable or pydantic models (serialized with
+    `model_dump(mode="json")` and re-validated on read) and are stored as
+    `[soft_expires_at, value]`; the hard TTL is the Redis key expiry. Redis
+    errors are logged and treated as misses so a cache outage degrades to DB
+    reads instead of failing requests.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "pe_orgair:", scan_count: int = 500):
+        self._client = redis.Redis.from_url(url)
+        self._prefix = key_prefix
+        self._scan_count = scan_count
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client
+
+    def _k(self, key: str) -> str:
+        return self._prefix + key
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return None if entry is None else entry.value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with _span("redis", "get", key=key) as span:
+            try:
+                raw = self._client.get(self._k(key))
+            except redis.RedisError as e:
+                logger.warning("cache_redis_error", op="get", key=key, error=str(e))
+                _REDIS_ERROR.inc()
+                return None
+            span.set_attribute("cache.hit", raw is not None)
+        if raw is None:
+            _REDIS_MISS.inc()
+            return None
+        _REDIS_HIT.inc()
+        soft_at, value = self._loads(raw)
+        return CacheEntry(_decode(value), soft_at)
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Multi-get in a single MGET round trip."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        with _span("redis", "mget", keys=len(keys)):
+            try:
+                raws = self._client.mget([self._k(k) for k in keys])
+            except redis.RedisError as e:
+                logger.warning("cache_redis_error", op="mget", keys=len(keys), error=str(e))
+                _REDIS_ERROR.inc(len(keys))
+                return {}
+        found = {}
+        for key, raw in zip(keys, raws):
+            if raw is not None:
+                soft_at, value = self._loads(raw)
+                found[key] = CacheEntry(_decode(value), soft_at)
+        _REDIS_HIT.inc(len(found))
+        _REDIS_MISS.inc(len(keys) - len(found))
+        return found
+
+    def set(self, key: str, value: Any, ttl: int = 0, soft_ttl: int = 0) -> None:
+        payload = self._dumps([_soft_deadline(ttl, soft_ttl), _encode(value)])
+        with _span("redis", "set", key=key, ttl=ttl):
+            try:
+                self._client.set(self._k(key), payload, ex=ttl if ttl and ttl > 0 else None)
+            except redis.RedisError as e:
+                logger.warning("cache_redis_error", op="set", key=key, error=str(e))
+
+    def add(self, key: str, value: Any, ttl: int = 0) -> bool:
+        """SET NX: store `value` only if `key` is absent; True if it was stored."""
+        payload = self._dumps([0.0, _encode(value)])
+        with _span("redis", "add", key=key) as span:
+            try:
+                added = bool(self._client.set(self._k(key), payload, ex=ttl if ttl and ttl > 0 else None, nx=True))
+            except redis.RedisError as e:
+                logger.warning("cache_redis_error", op="add", key=key, error=str(e))
+                _REDIS_ERROR.inc()
+                return False
+            span.set_attribute("cache.added", added)
+            return added
+
+    def delete(self, key: str) -> None:
+        with _span("redis", "delete", key=key):
+            try:
+                self._client.delete(self._k(key))
+            except redis.RedisError as e:
+                logger.warning("cache_redis_error", op="delete", key=key, error=str(e))
+
+    def invalidate_pattern(self, pattern: str) -> None:
+        # SCAN (not KEYS) so a large keyspace never blocks the Redis server
+        with _span("redis", "invalidate_pattern", pattern=pattern):
+            self._unlink_matching(pattern)
+
+    def _unlink_matching(self, pattern: str) -> None:
+        try:
+            batch = []
+            for k in self._client.scan_iter(match=self._k(pattern), count=self._scan_count):
+                batch.append(k)
+                if len(batch) >= self._scan_count:
+                    self._client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                self._client.unlink(*batch)
+        except redis.RedisError as e:
+            logger.warning("cache_redis_error", op="invalidate_pattern", pattern=pattern, error=str(e))
+
+    # Async API: the sync client's round trips run on a worker thread so the
+    # event loop never waits on Redis. (A redis.asyncio client is bound to one
+    # loop; this cache is shared by the API loop and by job runs that each
+    # start their own.)
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aget_entry(self, key: str) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self.get_entry, key)
+
+    async def aget_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        return await asyncio.to_thread(self.get_entries, list(keys))
+
+    async def aset(self, key: str, value: Any, ttl: int = 0, soft_ttl: int = 0) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl, soft_ttl)
+
+    async def aadd(self, key: str, value: Any, ttl: int = 0) -> bool:
+        return await asyncio.to_thread(self.add, key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        await asyncio.to_thread(self.delete, key)
+
+    async def ainvalidate_pattern(self, pattern: str) -> None:
+        await asyncio.to_thread(self.invalidate_pattern, pattern)
+
+
+class TieredCache:
+    """In-process L1 (short TTL) in front of a shared Redis L2.
+
+    Reads are served from the local dict when possible. Deletes and pattern
+    invalidations are applied to both tiers and broadcast on a pub/sub channel
+    so every worker evicts its L1 copy; call `start_listener()` once per
+    process to receive those broadcasts.
+    """
+
+    def __init__(
+        self,
+        l2: RedisCache,
+        l1_ttl: int = 5,
+        channel: str = "pe_orgair:cache:invalidate",
+        l1: Optional[SimpleCache] = None,
+    ):
+        self._l1 = l1 if l1 is not None else SimpleCache()
+        self._l2 = l2
+        self._l1_ttl = l1_ttl
+        self._channel = channel
+        self._pubsub = None
+        self._listener = None
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return None if entry is None else entry.value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._l1.get_entry(key)
+        if entry is not None:
+            return entry
+        entry = self._l2.get_entry(key)
+        if entry is not None and not entry.stale:
+            # Stale L2 entries are not promoted; the caller's refresh will replace them
+            soft_left = int(entry.soft_expires_at - time.time()) if entry.soft_expires_at else 0
+            self._l1.set(key, entry.value, self._l1_ttl, soft_left)
+        return entry
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        keys = list(keys)
+        found = self._l1.get_entries(keys)
+        missing = [k for k in keys if k not in found]
+        for key, entry in self._l2.get_entries(missing).items():
+            found[key] = entry
+            if not entry.stale:
+                soft_left = int(entry.soft_expires_at - time.time()) if entry.soft_expires_at else 0
+                self._l1.set(key, entry.value, self._l1_ttl, soft_left)
+        return found
+
+    def set(self, key: str, value: Any, ttl: int = 0, soft_ttl: int = 0) -> None:
+        self._l2.set(key, value, ttl, soft_ttl)
+        l1_ttl = min(ttl, self._l1_ttl) if ttl and ttl > 0 else self._l1_ttl
+        self._l1.set(key, value, l1_ttl, soft_ttl)
+
+    def add(self, key: str, value: Any, ttl: int = 0) -> bool:
+        # Decided by L2 alone; an L1 copy could hide a key another worker just added
+        self._l1.delete(key)
+        return self._l2.add(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self._l1.delete(key)
+        self._l2.delete(key)
+        self._broadcast({"op": "delete", "key": key})
 
     def invalidate_pattern(self, pattern: str) -> None:
-        # pattern like "sectors:*"
-        prefix = pattern.replace("*", "")
-        keys = [k for k in self._store.keys() if k.startswith(prefix)]
-        for k in keys:
-            self.delete(k)
+        self._l1.invalidate_pattern(pattern)
+        self._l2.invalidate_pattern(pattern)
+        self._broadcast({"op": "pattern", "pattern": pattern})
+
+    # Async API: L1 hits are answered inline, anything touching Redis runs on
+    # a worker thread (see RedisCache)
+    async def aget(self, key: str) -> Optional[Any]:
+        entry = await self.aget_entry(key)
+        return None if entry is None else entry.value
+
+    async def aget_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._l1.get_entry(key)
+        if entry is not None:
+            return entry
+        return await asyncio.to_thread(self.get_entry, key)
+
+    async def aget_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        keys = list(keys)
+        found = self._l1.get_entries(keys)
+        missing = [k for k in keys if k not in found]
+        if missing:
+            found.update(await asyncio.to_thread(self.get_entries, missing))
+        return found
+
+    async def aset(self, key: str, value: Any, ttl: int = 0, soft_ttl: int = 0) -> None:
+        await asyncio.to_thread(self.set, key, value, ttl, soft_ttl)
+
+    async def aadd(self, key: str, value: Any, ttl: int = 0) -> bool:
+        return await asyncio.to_thread(self.add, key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        await asyncio.to_thread(self.delete, key)
+
+    async def ainvalidate_pattern(self, pattern: str) -> None:
+        await asyncio.to_thread(self.invalidate_pattern, pattern)
+
+    def _broadcast(self, message: Dict[str, str]) -> None:
+        try:
+            self._l2.client.publish(self._channel, json.dumps(message, separators=(",", ":")))
+        except redis.RedisError as e:
+            logger.warning("cache_broadcast_failed", error=str(e), **message)
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            data = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if data.get("op") == "delete":
+            self._l1.delete(data["key"])
+        elif data.get("op") == "pattern":
+            self._l1.invalidate_pattern(data["pattern"])
+
+    def start_sweeper(self, interval: float = 60.0) -> None:
+        self._l1.start_sweeper(interval)
+
+    def stop_sweeper(self) -> None:
+        self._l1.stop_sweeper()
+
+    def start_listener(self) -> None:
+        """Subscribe to invalidation broadcasts in a background thread."""
+        if self._listener is not None:
+            return
+        self._pubsub = self._l2.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self._channel: self._on_message})
+        self._listener = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+def off_loop(call: Callable[..., Any], *args: Any) -> None:
+    """Run a cache write (e.g. `cache.delete`) from sync code without blocking the event loop.
+
+    For sync hooks such as invalidation listeners. In-process caches, and
+    callers with no running loop, run the call inline; a Redis-backed call
+    on the loop goes to the default executor and its failure is logged.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None or isinstance(getattr(call, "__self__", None), SimpleCache):
+        call(*args)
+        return
+    future = loop.run_in_executor(None, partial(call, *args))
+    future.add_done_callback(_log_background_failure)
+
+
+def _log_background_failure(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("cache_background_call_failed", error=str(future.exception()))
+
+
+def _build_cache():
+    """Pick the cache backend from settings.CACHE_BACKEND ("memory" | "redis" | "tiered")."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache(settings.REDIS_URL)
+    local = SimpleCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        policy=settings.CACHE_EVICTION_POLICY,
+    )
+    if settings.CACHE_BACKEND == "tiered":
+        return TieredCache(RedisCache(settings.REDIS_URL), l1_ttl=settings.CACHE_L1_TTL, l1=local)
+    return local
 
 
-cache = SimpleCache()
\ No newline at end of file
+cache = _build_cache()
@@ -0,0 +1,66 @@
+# src/pe_orgair/infrastructure/singleflight.py
+"""Per-key request coalescing for async loaders."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from pe_orgair.observability.metrics import SINGLEFLIGHT_COALESCED, SINGLEFLIGHT_LOADS
+
+
+class SingleFlight:
+    """Run at most one loader per key at a time; concurrent callers share its result.
+
+    The load runs as its own task and callers await it through `shield`, so a
+    cancelled caller never cancels the load the others are waiting on.
+    """
+
+    def __init__(self, name: str = "default") -> None:
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.loads = 0       # loader executions
+        self.coalesced = 0   # callers that piggybacked on an in-flight load
+        self._loads_metric = SINGLEFLIGHT_LOADS.labels(name)
+        self._coalesced_metric = SINGLEFLIGHT_COALESCED.labels(name)
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    def start(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Return the in-flight task for `key`, starting `loader` if there is none."""
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            self._coalesced_metric.inc()
+            return task
+
+        task = asyncio.ensure_future(loader())
+        self._calls[key] = task
+        self.loads += 1
+        self._loads_metric.inc()
+        task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        return task
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the shared load for `key`."""
+        return await asyncio.shield(self.start(key, loader))
+
+    def forget(self, key: Optional[str] = None) -> None:
+        """Detach the in-flight load for `key` (all keys if None) so the next caller starts a new one.
+
+        Callers already awaiting a detached load still get its result. Used on
+        invalidation, so nobody joins a load that began before the change.
+        """
+        if key is None:
+            self._calls.clear()
+        else:
+            self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"loads": self.loads, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when nobody was left awaiting it
+        if not task.cancelled():
+            task.exception()
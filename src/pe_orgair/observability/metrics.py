@@ -0,0 +1,64 @@
+"""Prometheus metrics shared by the API, cache and DB layers."""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+)
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served", ["method"]
+)
+
+# Cache
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups by backend and result", ["backend", "result"]
+)
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total", "Cache entries removed before being read", ["backend", "reason"]
+)
+
+# Request coalescing
+SINGLEFLIGHT_LOADS = Counter(
+    "singleflight_loads_total", "Loader executions", ["name"]
+)
+SINGLEFLIGHT_COALESCED = Counter(
+    "singleflight_coalesced_total", "Callers that shared an in-flight load", ["name"]
+)
+
+# Database
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Database round-trip time per call (including connection checkout)",
+    ["client", "op"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors_total", "Database calls that raised", ["client", "op"]
+)
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Exposition payload; aggregates across workers when PROMETHEUS_MULTIPROC_DIR is set."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -1,17 +1,119 @@
+import json
 import logging
+from typing import Optional, Sequence
+
 import structlog
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from opentelemetry import trace
+
+from pe_orgair.config.settings import settings
+
+# Populated when OTEL_TRACES_EXPORTER=memory, so local checks can inspect spans
+memory_exporter = None
+_provider_installed = False
 
 def setup_logging() -> None:
     """Basic structlog setup (minimal version for lab)."""
     logging.basicConfig(level=logging.INFO)
     structlog.configure(
         processors=[
+            structlog.contextvars.merge_contextvars,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.JSONRenderer(),
         ],
     )
 
+def _file_exporter(path: str):
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+    class _JsonLinesSpanExporter(SpanExporter):
+        """Appends one JSON object per finished span to a local file."""
+
+        def export(self, spans: Sequence) -> SpanExportResult:
+            with open(path, "a", encoding="utf-8") as f:
+                for span in spans:
+                    f.write(json.dumps(json.loads(span.to_json()), separators=(",", ":")) + "\n")
+            return SpanExportResult.SUCCESS
+
+    return _JsonLinesSpanExporter()
+
+def _build_exporter(kind: str, endpoint: Optional[str], path: str):
+    global memory_exporter
+    if kind == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=f"{endpoint.rstrip('/')}/v1/traces") if endpoint else OTLPSpanExporter()
+    if kind == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        return ConsoleSpanExporter()
+    if kind == "file":
+        return _file_exporter(path)
+    if kind == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        memory_exporter = InMemorySpanExporter()
+        return memory_exporter
+    return None
+
+def _install_provider(kind: str) -> bool:
+    global _provider_installed
+    if _provider_installed:
+        return True
+    exporter = _build_exporter(kind, settings.OTEL_EXPORTER_OTLP_ENDPOINT, settings.OTEL_TRACES_FILE)
+    if exporter is None:
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME, "service.version": settings.APP_VERSION}),
+        sampler=ParentBased(TraceIdRatioBased(settings.OTEL_TRACES_SAMPLER_RATIO)),
+    )
+    # Export synchronously for local exporters so spans are visible immediately
+    processor = SimpleSpanProcessor(exporter) if kind in ("memory", "file", "console") else BatchSpanProcessor(exporter)
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
+    _provider_installed = True
+    return True
+
+def _instrument_app(app: FastAPI) -> None:
+    tracer = trace.get_tracer("pe_orgair.api")
+
+    # Registered after the correlation middleware, so it wraps it and the
+    # request span is current when the correlation id is bound.
+    @app.middleware("http")
+    async def trace_request(request: Request, call_next):
+        with tracer.start_as_current_span(
+            f"{request.method} {request.url.path}",
+            kind=trace.SpanKind.SERVER,
+            attributes={"http.request.method": request.method, "url.path": request.url.path},
+        ) as span:
+            response = await call_next(request)
+            route = request.scope.get("route")
+            if route is not None:
+                span.update_name(f"{request.method} {route.path}")
+                span.set_attribute("http.route", route.path)
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.set_status(trace.StatusCode.ERROR)
+            return response
+
 def setup_tracing(app: FastAPI) -> None:
-    """Tracing placeholder for lab (no-op unless OTEL added later)."""
-    return
\ No newline at end of file
+    """Install an OpenTelemetry tracer provider and a per-request server span.
+
+    The exporter comes from OTEL_TRACES_EXPORTER ("otlp" by default when
+    OTEL_EXPORTER_OTLP_ENDPOINT is set, otherwise "none", which leaves the
+    no-op provider in place). Sampling is parent-based with
+    OTEL_TRACES_SAMPLER_RATIO for root spans.
+    """
+    kind = settings.OTEL_TRACES_EXPORTER or ("otlp" if settings.OTEL_EXPORTER_OTLP_ENDPOINT else "none")
+    if kind == "none":
+        return
+    # The global provider can only be set once per process; later apps reuse it
+    if not _install_provider(kind):
+        return
+    _instrument_app(app)
@@ -0,0 +1,70 @@
+# src/pe_orgair/schemas/jobs.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+JobState = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobInfo(BaseModel):
+    """
+    Status record of one background job (what GET /jobs/{job_id} returns).
+    `progress` runs from 0.0 to 1.0; `result` is set once the job succeeds
+    (failed ingests keep their partial report there) and `error` once it fails.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    job_id: str
+    kind: str
+    state: JobState = "queued"
+    idempotency_key: Optional[str] = None
+    params: Dict[str, Any] = Field(default_factory=dict)
+    progress: float = 0.0
+    message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("succeeded", "failed")
+
+
+class JobSubmitRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Literal["reload_sector_configs", "rescore_portfolio"]
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+    # Submitting the same kind + key again returns the existing job unless it failed
+    idempotency_key: Optional[str] = Field(default=None, min_length=1, max_length=200)
+
+
+class RescorePortfolioParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    # None rescores every sector
+    focus_group_ids: Optional[List[str]] = None
+
+    # Set for config-change rescores: the fingerprint that triggered the run.
+    # Sectors already scored at their current config are then skipped.
+    config_version: Optional[str] = Field(default=None, max_length=64)
+
+
+class ReloadSectorConfigsParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class IngestOrganizationsParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    path: str
+    format: Literal["csv", "ndjson"]
+    chunk_size: int = Field(default=5000, ge=100, le=50000)
+    dry_run: bool = False
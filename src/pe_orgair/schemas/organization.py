@@ -0,0 +1,235 @@
+# src/pe_orgair/schemas/organization.py
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Annotated, Any, Dict, Iterator, List, Literal, Optional
+from uuid import UUID, uuid4
+
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, model_validator
+
+
+class OrganizationBatch(BaseModel):
+    """
+    Columnar batch of one sector's active organizations.
+    Every column is a list aligned with `organization_ids`; `attributes` holds
+    the sector-specific columns from that sector's org_attributes_* table
+    (None where an organization has no attribute row).
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    focus_group_id: str
+    attribute_table: str
+    organization_ids: List[str]
+
+    # Core organizations columns, e.g. "legal_name", "employee_count"
+    columns: Dict[str, List[Any]]
+
+    # Sector attribute columns, e.g. "plant_count", "fhir_enabled"
+    attributes: Dict[str, List[Any]]
+
+    @model_validator(mode="after")
+    def _validate_alignment(self) -> "OrganizationBatch":
+        n = len(self.organization_ids)
+        ragged = [
+            name for name, values in {**self.columns, **self.attributes}.items() if len(values) != n
+        ]
+        if ragged:
+            raise ValueError(f"columns not aligned with organization_ids ({n} rows): {sorted(ragged)}")
+        return self
+
+    def __len__(self) -> int:
+        return len(self.organization_ids)
+
+    def column(self, name: str) -> List[Any]:
+        """A core or attribute column by name."""
+        if name in self.columns:
+            return self.columns[name]
+        if name in self.attributes:
+            return self.attributes[name]
+        raise KeyError(name)
+
+    def array(self, name: str, dtype: Any = np.float64, fill: Any = np.nan) -> np.ndarray:
+        """A column as a NumPy array, with NULLs replaced by `fill`."""
+        return np.array([fill if v is None else v for v in self.column(name)], dtype=dtype)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Row-wise view (one dict per organization), for the few callers that need it."""
+        names = list(self.columns) + list(self.attributes)
+        cols = [self.column(name) for name in names]
+        for i, org_id in enumerate(self.organization_ids):
+            row = {"organization_id": org_id}
+            row.update((name, col[i]) for name, col in zip(names, cols))
+            yield row
+
+
+def _split_list(value: Any) -> Any:
+    # CSV cells carry array columns as "a|b|c"; NDJSON sends real lists
+    if isinstance(value, str):
+        return [part.strip() for part in value.split("|") if part.strip()]
+    return value
+
+
+StrList = Annotated[List[str], BeforeValidator(_split_list)]
+
+
+class _SectorAttributes(BaseModel):
+    """Base for the per-sector org_attributes_* row models (fields mirror 002e)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ManufacturingAttributes(_SectorAttributes):
+    ot_systems: Optional[StrList] = None
+    it_ot_integration: Optional[str] = Field(default=None, max_length=20)
+    scada_vendor: Optional[str] = Field(default=None, max_length=100)
+    mes_system: Optional[str] = Field(default=None, max_length=100)
+    plant_count: Optional[int] = Field(default=None, ge=0)
+    automation_level: Optional[str] = Field(default=None, max_length=20)
+    iot_platforms: Optional[StrList] = None
+    digital_twin_status: Optional[str] = Field(default=None, max_length=20)
+    edge_computing: Optional[bool] = None
+    supply_chain_visibility: Optional[str] = Field(default=None, max_length=20)
+    demand_forecasting_ai: Optional[bool] = None
+
+
+class FinancialServicesAttributes(_SectorAttributes):
+    regulatory_bodies: Optional[StrList] = None
+    charter_type: Optional[str] = Field(default=None, max_length=50)
+    model_risk_framework: Optional[str] = Field(default=None, max_length=50)
+    mrm_team_size: Optional[int] = Field(default=None, ge=0)
+    model_inventory_count: Optional[int] = Field(default=None, ge=0)
+    algo_trading: Optional[bool] = None
+    fraud_detection_ai: Optional[bool] = None
+    credit_ai: Optional[bool] = None
+    aml_ai: Optional[bool] = None
+    aum_billions: Optional[Decimal] = Field(default=None, ge=0, max_digits=12, decimal_places=2)
+    total_assets_billions: Optional[Decimal] = Field(default=None, ge=0, max_digits=12, decimal_places=2)
+
+
+class HealthcareAttributes(_SectorAttributes):
+    hipaa_certified: Optional[bool] = None
+    hitrust_certified: Optional[bool] = None
+    fda_clearances: Optional[StrList] = None
+    fda_clearance_count: Optional[int] = Field(default=None, ge=0)
+    ehr_system: Optional[str] = Field(default=None, max_length=100)
+    ehr_integration_level: Optional[str] = Field(default=None, max_length=20)
+    fhir_enabled: Optional[bool] = None
+    clinical_ai_deployed: Optional[bool] = None
+    imaging_ai: Optional[bool] = None
+    org_type: Optional[str] = Field(default=None, max_length=50)
+    bed_count: Optional[int] = Field(default=None, ge=0)
+
+
+class TechnologyAttributes(_SectorAttributes):
+    tech_category: Optional[str] = Field(default=None, max_length=50)
+    primary_language: Optional[str] = Field(default=None, max_length=50)
+    cloud_native: Optional[bool] = None
+    github_org: Optional[str] = Field(default=None, max_length=100)
+    github_stars_total: Optional[int] = Field(default=None, ge=0)
+    open_source_projects: Optional[int] = Field(default=None, ge=0)
+    ml_platform: Optional[str] = Field(default=None, max_length=100)
+    llm_integration: Optional[bool] = None
+    ai_product_features: Optional[int] = Field(default=None, ge=0)
+    gpu_infrastructure: Optional[bool] = None
+
+
+class RetailAttributes(_SectorAttributes):
+    retail_type: Optional[str] = Field(default=None, max_length=50)
+    store_count: Optional[int] = Field(default=None, ge=0)
+    ecommerce_pct: Optional[Decimal] = Field(default=None, ge=0, le=100, decimal_places=2)
+    cdp_vendor: Optional[str] = Field(default=None, max_length=100)
+    loyalty_program: Optional[bool] = None
+    loyalty_members: Optional[int] = Field(default=None, ge=0)
+    personalization_ai: Optional[bool] = None
+    recommendation_engine: Optional[str] = Field(default=None, max_length=100)
+    demand_forecasting: Optional[bool] = None
+
+
+class EnergyAttributes(_SectorAttributes):
+    energy_type: Optional[str] = Field(default=None, max_length=50)
+    regulated: Optional[bool] = None
+    scada_systems: Optional[StrList] = None
+    ami_deployed: Optional[bool] = None
+    smart_grid_pct: Optional[Decimal] = Field(default=None, ge=0, le=100, decimal_places=2)
+    generation_capacity_mw: Optional[Decimal] = Field(default=None, ge=0, max_digits=12, decimal_places=2)
+    grid_optimization_ai: Optional[bool] = None
+    predictive_maintenance: Optional[bool] = None
+    renewable_pct: Optional[Decimal] = Field(default=None, ge=0, le=100, decimal_places=2)
+
+
+class ProfessionalServicesAttributes(_SectorAttributes):
+    firm_type: Optional[str] = Field(default=None, max_length=50)
+    partnership_model: Optional[str] = Field(default=None, max_length=50)
+    partner_count: Optional[int] = Field(default=None, ge=0)
+    professional_staff: Optional[int] = Field(default=None, ge=0)
+    km_system: Optional[str] = Field(default=None, max_length=100)
+    document_ai: Optional[bool] = None
+    knowledge_graph: Optional[bool] = None
+    client_ai_services: Optional[bool] = None
+    internal_ai_tools: Optional[bool] = None
+
+
+SECTOR_ATTRIBUTE_MODELS: Dict[str, type] = {
+    "pe_manufacturing": ManufacturingAttributes,
+    "pe_financial_services": FinancialServicesAttributes,
+    "pe_healthcare": HealthcareAttributes,
+    "pe_technology": TechnologyAttributes,
+    "pe_retail": RetailAttributes,
+    "pe_energy": EnergyAttributes,
+    "pe_professional_services": ProfessionalServicesAttributes,
+}
+
+
+class OrganizationIngestRow(BaseModel):
+    """
+    One organization in an ingest file.
+    Rows are flat: any field that is not an organizations column is treated
+    as a sector attribute and validated against the row's sector model.
+    Empty attribute values are dropped, so one CSV can mix sectors; empty core
+    fields that have a default (organization_id, status, ...) take it.
+    """
+
+    organization_id: UUID = Field(default_factory=uuid4)
+    legal_name: str = Field(..., min_length=1, max_length=255)
+    display_name: Optional[str] = Field(default=None, max_length=255)
+    ticker_symbol: Optional[str] = Field(default=None, max_length=10)
+    cik_number: Optional[str] = Field(default=None, max_length=20)
+    duns_number: Optional[str] = Field(default=None, max_length=20)
+    focus_group_id: str = Field(..., pattern=r"^pe_", max_length=50)
+    primary_sic_code: Optional[str] = Field(default=None, max_length=10)
+    primary_naics_code: Optional[str] = Field(default=None, max_length=10)
+    employee_count: Optional[int] = Field(default=None, ge=0)
+    annual_revenue_usd: Optional[Decimal] = Field(default=None, ge=0, max_digits=15, decimal_places=2)
+    founding_year: Optional[int] = Field(default=None, ge=1600, le=2100)
+    headquarters_country: Optional[str] = Field(default=None, max_length=3)
+    headquarters_state: Optional[str] = Field(default=None, max_length=50)
+    headquarters_city: Optional[str] = Field(default=None, max_length=100)
+    website_url: Optional[str] = Field(default=None, max_length=500)
+    status: Literal["active", "inactive", "archived"] = "active"
+
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _collect_attributes(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        # A blank CSV cell arrives as None: let fields with a default fall back to it
+        core = {
+            k: v for k, v in data.items()
+            if k in cls.model_fields and (v is not None or cls.model_fields[k].is_required())
+        }
+        extra = {k: v for k, v in data.items() if k not in cls.model_fields and v is not None}
+        if extra:
+            core["attributes"] = {**(core.get("attributes") or {}), **extra}
+        return core
+
+    @model_validator(mode="after")
+    def _validate_attributes(self) -> "OrganizationIngestRow":
+        model = SECTOR_ATTRIBUTE_MODELS.get(self.focus_group_id)
+        if model is None:
+            raise ValueError(f"unknown focus_group_id: {self.focus_group_id}")
+        self.attributes = model.model_validate(self.attributes).model_dump()
+        return self
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -43,4 +43,12 @@ class SectorConfigContract(BaseModel):
         if missing:
             raise ValueError(f"missing required calibrations: {sorted(missing)}")
 
-        return self
\ No newline at end of file
+        return self
+
+
+class SectorBatchGetRequest(BaseModel):
+    """Body of POST /sectors:batchGet."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    ids: List[str] = Field(..., min_length=1, max_length=100)
@@ -0,0 +1,54 @@
+# src/pe_orgair/schemas/sector_stats.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class EmployeeDistribution(BaseModel):
+    """Headcount distribution of a sector's active organizations."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    reported: int
+    total: Optional[int] = None
+    min: Optional[int] = None
+    p25: Optional[float] = None
+    median: Optional[float] = None
+    p75: Optional[float] = None
+    p90: Optional[float] = None
+    max: Optional[int] = None
+
+    # Organization counts per headcount band, e.g. "50-249"
+    buckets: Dict[str, int]
+
+
+class RevenueSummary(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    reported: int
+    total_usd: Optional[float] = None
+    avg_usd: Optional[float] = None
+    median_usd: Optional[float] = None
+
+
+class SectorStats(BaseModel):
+    """
+    Precomputed aggregates for one sector (row of sector_stats).
+    `refreshed_at` is when the row was last rebuilt from organizations.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    focus_group_id: str
+    organization_counts: Dict[str, int]  # by status
+    revenue: RevenueSummary
+    employees: EmployeeDistribution
+    scored_organizations: int
+
+    # Keys are dimension_code like "AI_GOV", values are average current scores
+    dimension_score_averages: Dict[str, float]
+
+    refreshed_at: datetime
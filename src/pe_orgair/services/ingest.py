@@ -0,0 +1,423 @@
+# src/pe_orgair/services/ingest.py
+"""Streaming bulk ingest of organizations and their sector attributes via COPY.
+
+    bytes -> lines -> parsed dicts -> validated chunks -> (bounded queue) -> COPY writer
+
+Input is read incrementally (CSV or NDJSON), validated a chunk at a time with
+one pydantic call per chunk, and written by a single writer task. Each chunk
+is one transaction: COPY into temp staging tables, then a set-based upsert
+into `organizations` and the sector's `org_attributes_*` table, so re-running
+a file is idempotent for rows that carry an organization_id. The queue
+between validation and the writer is small, so a slow database stalls
+parsing (and, over HTTP, reading the request body) instead of buffering the
+whole file in memory.
+"""
+from __future__ import annotations
+
+import asyncio
+import codecs
+import csv
+import gzip
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import structlog
+from opentelemetry import trace
+from pydantic import TypeAdapter, ValidationError
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.schemas.organization import OrganizationIngestRow
+from pe_orgair.services.organizations import CORE_COLUMNS, SECTOR_ATTRIBUTES, organization_service
+
+logger = structlog.get_logger()
+_tracer = trace.get_tracer(__name__)
+
+ORG_COLUMNS = ("organization_id", "focus_group_id", "status", *CORE_COLUMNS)
+
+_ROWS = TypeAdapter(List[OrganizationIngestRow])
+
+READ_SIZE = 1 << 20  # 1 MiB
+
+
+class ParsedRow(NamedTuple):
+    line: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+async def read_file(
+    path: Path, on_read: Optional[Callable[[int, int], None]] = None
+) -> AsyncIterator[bytes]:
+    """Stream a (optionally gzipped) file; `on_read(position, size)` reports progress on disk."""
+    size = os.path.getsize(path)
+    gzipped = path.suffix == ".gz"
+    opener = gzip.open if gzipped else open
+    with opener(path, "rb") as f:
+        raw = f.fileobj if gzipped else f
+        while True:
+            # File reads run off the event loop so the COPY writer keeps going
+            chunk = await asyncio.to_thread(f.read, READ_SIZE)
+            if not chunk:
+                return
+            if on_read is not None:
+                on_read(raw.tell(), size)
+            yield chunk
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a UTF-8 byte stream into lines without holding more than one chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRow]:
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ParsedRow(line_no, None, f"invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield ParsedRow(line_no, None, "expected a JSON object")
+            continue
+        yield ParsedRow(line_no, data)
+
+
+# A record still inside a quoted field after this many characters is taken to
+# be an unmatched quote, and the ingest fails rather than buffer the file
+MAX_RECORD_CHARS = 1 << 20
+
+# Quote states of the CSV dialect csv.reader uses by default
+_FIELD_START, _IN_FIELD, _IN_QUOTED, _QUOTE_IN_QUOTED = range(4)
+
+
+def _ends_quoted(line: str, quoted: bool) -> bool:
+    """Whether a record is inside a quoted field at the end of `line`.
+
+    Follows csv.reader: a quote opens a quoted field only as a field's first
+    character, `""` inside one is an escaped quote, and anywhere else a quote
+    is an ordinary character.
+    """
+    if '"' not in line:
+        return quoted
+    state = _IN_QUOTED if quoted else _FIELD_START
+    for ch in line:
+        if state == _IN_QUOTED:
+            if ch == '"':
+                state = _QUOTE_IN_QUOTED
+        elif state == _QUOTE_IN_QUOTED:
+            state = _IN_QUOTED if ch == '"' else _FIELD_START if ch == "," else _IN_FIELD
+        elif ch == ",":
+            state = _FIELD_START
+        elif state == _FIELD_START:
+            state = _IN_QUOTED if ch == '"' else _IN_FIELD
+    return state == _IN_QUOTED
+
+
+class _CsvRecords:
+    """Groups lines into CSV records (a quoted field may span lines)."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.start = 0
+        self._size = 0
+        self._quoted = False
+
+    def feed(self, line_no: int, line: str) -> Optional[Tuple[int, str]]:
+        """Add a line; returns (first line number, record text) once the record is complete."""
+        if not self.lines:
+            self.start = line_no
+        self.lines.append(line)
+        self._size += len(line) + 1
+        self._quoted = _ends_quoted(line, self._quoted)
+        if self._quoted:
+            if self._size > MAX_RECORD_CHARS:
+                raise ValueError(
+                    f"line {self.start}: quoted field runs past {MAX_RECORD_CHARS} characters (unmatched quote?)"
+                )
+            return None
+        record = (self.start, "\n".join(self.lines))
+        self.lines, self._size = [], 0
+        return record
+
+    def take(self) -> Tuple[int, List[str]]:
+        """Remove and return the unfinished record's first line number and lines."""
+        pending = (self.start, self.lines)
+        self.lines, self._size, self._quoted = [], 0, False
+        return pending
+
+
+async def parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRow]:
+    """CSV with a header row; empty cells are NULL. Quoted fields may span lines.
+
+    A quoted field still open at the end of the input is rejected at the line
+    where it started, and the lines it swallowed are parsed again as records.
+    """
+    header: Optional[List[str]] = None
+
+    def parse(start: int, text: str) -> Optional[ParsedRow]:
+        nonlocal header
+        if not text.strip():
+            return None
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [h.strip() for h in values]
+            return None
+        if len(values) != len(header):
+            return ParsedRow(start, None, f"expected {len(header)} fields, got {len(values)}")
+        return ParsedRow(start, {k: (v if v != "" else None) for k, v in zip(header, values)})
+
+    records = _CsvRecords()
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        record = records.feed(line_no, line)
+        if record is not None and (parsed := parse(*record)) is not None:
+            yield parsed
+
+    while records.lines:
+        start, pending = records.take()
+        yield ParsedRow(start, None, "unterminated quoted field")
+        for line_no, line in enumerate(pending[1:], start + 1):
+            record = records.feed(line_no, line)
+            if record is not None and (parsed := parse(*record)) is not None:
+                yield parsed
+
+
+PARSERS = {"csv": parse_csv, "ndjson": parse_ndjson}
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def _upsert(target: str, staging: str, columns: Sequence[str], extra_set: str = "") -> str:
+    cols = ", ".join(columns)
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c != "organization_id")
+    return f"""
+        INSERT INTO {target} ({cols})
+        SELECT {cols} FROM {staging}
+        ON CONFLICT (organization_id) DO UPDATE SET {updates}{extra_set}
+    """
+
+
+# Staging tables are session temp tables emptied at every commit, so pooled
+# connections reuse them across chunks.
+_STAGE = "CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+
+_UPSERT_ORGS = _upsert(
+    "organizations", "_ingest_organizations", ORG_COLUMNS, ", updated_at = CURRENT_TIMESTAMP"
+)
+
+
+async def _copy(cur, staging: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    async with cur.copy(f"COPY {staging} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            await copy.write_row(row)
+
+
+async def write_chunk(rows: Sequence[OrganizationIngestRow]) -> None:
+    """Upsert one validated chunk (organizations + sector attributes) in one transaction."""
+    attributes: Dict[str, List[OrganizationIngestRow]] = defaultdict(list)
+    for row in rows:
+        if any(v is not None for v in row.attributes.values()):
+            attributes[row.focus_group_id].append(row)
+
+    async with adb.transaction(name="ingest_chunk") as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_STAGE.format(staging="_ingest_organizations", target="organizations"))
+            await _copy(
+                cur,
+                "_ingest_organizations",
+                ORG_COLUMNS,
+                [[getattr(r, c) for c in ORG_COLUMNS] for r in rows],
+            )
+            await cur.execute(_UPSERT_ORGS)
+
+            for focus_group_id, sector_rows in attributes.items():
+                table, columns = SECTOR_ATTRIBUTES[focus_group_id]
+                staging = f"_ingest_{table}"
+                all_columns = ("organization_id", *columns)
+                await cur.execute(_STAGE.format(staging=staging, target=table))
+                await _copy(
+                    cur,
+                    staging,
+                    all_columns,
+                    [[r.organization_id, *(r.attributes.get(c) for c in columns)] for r in sector_rows],
+                )
+                await cur.execute(_upsert(table, staging, all_columns))
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+@dataclass
+class IngestReport:
+    rows_read: int = 0
+    rows_rejected: int = 0
+    rows_written: int = 0
+    chunks_committed: int = 0
+    sectors: Dict[str, int] = field(default_factory=dict)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    dry_run: bool = False
+    failed: Optional[str] = None
+    duration_s: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": "failed" if self.failed else "completed",
+            "rows_read": self.rows_read,
+            "rows_rejected": self.rows_rejected,
+            "rows_written": self.rows_written,
+            "chunks_committed": self.chunks_committed,
+            "sectors": dict(self.sectors),
+            "errors": list(self.errors),
+            "dry_run": self.dry_run,
+            "failed": self.failed,
+            "duration_s": self.duration_s,
+        }
+
+
+class OrganizationIngestor:
+    """Validates parsed rows in chunks and writes them with COPY.
+
+    - chunk_size: rows per validation call and per transaction
+    - queue_depth: validated chunks allowed to wait for the writer (backpressure)
+    - dry_run: validate and report only
+    - max_errors: rejected rows listed in the report (all are counted)
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 5000,
+        queue_depth: int = 2,
+        dry_run: bool = False,
+        max_errors: int = 100,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.queue_depth = queue_depth
+        self.dry_run = dry_run
+        self.max_errors = max_errors
+
+    async def run(self, rows: AsyncIterable[ParsedRow]) -> IngestReport:
+        report = IngestReport(dry_run=self.dry_run)
+        start = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+
+        with _tracer.start_as_current_span("ingest.run", attributes={"dry_run": self.dry_run}) as span:
+            writer = asyncio.ensure_future(self._write_all(queue, report))
+            try:
+                async for chunk in self._validated_chunks(rows, report):
+                    await self._put(queue, chunk, writer)
+                await self._put(queue, None, writer)
+                await writer
+            except Exception as e:
+                logger.exception("ingest_failed", rows_written=report.rows_written, error=str(e))
+                report.failed = str(e)
+            finally:
+                if not writer.done():
+                    writer.cancel()
+                if report.chunks_committed:
+                    for focus_group_id in report.sectors:
+                        organization_service.invalidate_cache(focus_group_id)
+            span.set_attribute("rows_written", report.rows_written)
+            span.set_attribute("rows_rejected", report.rows_rejected)
+
+        report.errors.sort(key=lambda e: e["line"])
+        report.duration_s = round(time.perf_counter() - start, 3)
+        logger.info("ingest_finished", **{k: v for k, v in report.to_dict().items() if k != "errors"})
+        return report
+
+    @staticmethod
+    async def _put(queue: asyncio.Queue, item: Any, writer: asyncio.Future) -> None:
+        # Wait for queue space, but surface a writer failure instead of blocking forever
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            writer.result()
+            raise RuntimeError("ingest writer stopped early")
+
+    async def _validated_chunks(
+        self, rows: AsyncIterable[ParsedRow], report: IngestReport
+    ) -> AsyncIterator[List[OrganizationIngestRow]]:
+        pending: List[ParsedRow] = []
+        async for parsed in rows:
+            report.rows_read += 1
+            if parsed.error is not None:
+                self._reject(report, parsed.line, parsed.error)
+                continue
+            pending.append(parsed)
+            if len(pending) >= self.chunk_size:
+                yield self._validate(pending, report)
+                pending = []
+        if pending:
+            yield self._validate(pending, report)
+
+    def _validate(self, pending: List[ParsedRow], report: IngestReport) -> List[OrganizationIngestRow]:
+        try:
+            # One validator call for the whole chunk in the common, all-valid case
+            valid = _ROWS.validate_python([p.data for p in pending])
+        except ValidationError:
+            valid = []
+            for parsed in pending:
+                try:
+                    valid.append(OrganizationIngestRow.model_validate(parsed.data))
+                except ValidationError as e:
+                    self._reject(report, parsed.line, _summarize(e))
+        # The last occurrence of an organization_id within a chunk wins
+        return list({row.organization_id: row for row in valid}.values())
+
+    def _reject(self, report: IngestReport, line: int, message: str) -> None:
+        report.rows_rejected += 1
+        if len(report.errors) < self.max_errors:
+            report.errors.append({"line": line, "error": message})
+
+    async def _write_all(self, queue: asyncio.Queue, report: IngestReport) -> None:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                return
+            if chunk and not self.dry_run:
+                with _tracer.start_as_current_span("ingest.chunk", attributes={"rows": len(chunk)}):
+                    await write_chunk(chunk)
+                report.chunks_committed += 1
+                report.rows_written += len(chunk)
+            for row in chunk:
+                report.sectors[row.focus_group_id] = report.sectors.get(row.focus_group_id, 0) + 1
+
+
+def _summarize(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or 'row'}: {e['msg']}" for e in error.errors()[:5]
+    )
+
+
+async def ingest_stream(
+    chunks: AsyncIterable[bytes], fmt: str, **options: Any
+) -> IngestReport:
+    """Parse, validate and write a CSV or NDJSON byte stream."""
+    parser = PARSERS[fmt]
+    return await OrganizationIngestor(**options).run(parser(iter_lines(chunks)))
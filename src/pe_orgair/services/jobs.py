@@ -0,0 +1,447 @@
+# src/pe_orgair/services/jobs.py
+"""Background jobs for heavy recomputations: catalog reloads, portfolio rescoring, bulk ingest.
+
+    submit() -> job record "queued" -> runner -> execute_job() -> "running" -> "succeeded" | "failed"
+
+Job status lives in its own store under `job:{job_id}`: Redis (JOBS_REDIS_URL)
+under Celery or a redis/tiered CACHE_BACKEND, so any API instance can
+answer GET /jobs/{job_id}, otherwise an in-process cache. Unlike the
+response cache it is never bounded, so a running job or an idempotency key
+is only dropped when JOB_TTL lapses. Two runners (JOBS_BACKEND):
+
+- "local" (default, and what tests use): a process pool on this instance.
+  Children send status updates over a queue that a thread in the API process
+  applies, so it works with the in-process store as well. Jobs marked
+  `in_process` (the catalog reload, whose point is this process's cache)
+  run on the API's event loop instead.
+- "celery": jobs go to the Celery worker in `pe_orgair.worker`, which writes
+  status straight to the Redis store.
+
+Submissions are idempotent per (kind, key). With an explicit idempotency key
+the existing job is returned unless it failed; without one the key is a
+digest of the params and only a queued or running job is reused, so
+identical requests made while a job is in progress coalesce into it.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+import structlog
+from opentelemetry import trace
+from pydantic import BaseModel
+
+from pe_orgair.config.settings import settings
+from pe_orgair.infrastructure.cache import RedisCache, SimpleCache
+from pe_orgair.schemas.jobs import (
+    IngestOrganizationsParams,
+    JobInfo,
+    ReloadSectorConfigsParams,
+    RescorePortfolioParams,
+)
+from pe_orgair.services.ingest import ingest_stream, read_file
+from pe_orgair.services.organizations import organization_service
+from pe_orgair.services.rescoring import rescoring_pipeline
+from pe_orgair.services.sector_config import sector_service
+
+logger = structlog.get_logger()
+_tracer = trace.get_tracer(__name__)
+
+# (job_id, changed fields) -> applied to the job record
+StatusSink = Callable[[str, Dict[str, Any]], None]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def spool_dir() -> Path:
+    """Where uploads wait for a background ingest (must be shared with Celery workers)."""
+    path = Path(settings.INGEST_SPOOL_DIR or Path(tempfile.gettempdir()) / "pe_orgair_ingest")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class JobFailed(Exception):
+    """Raised by a job to fail with a partial result (e.g. an ingest report)."""
+
+    def __init__(self, message: str, result: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(message)
+        self.result = result
+
+
+class JobProgress:
+    """Progress callback handed to jobs; throttled so a tight loop does not flood the cache."""
+
+    MIN_INTERVAL = 0.5  # seconds between updates (completion is always reported)
+
+    def __init__(self, job_id: str, sink: StatusSink) -> None:
+        self.job_id = job_id
+        self._sink = sink
+        self._last = 0.0
+
+    def __call__(self, fraction: float, message: Optional[str] = None) -> None:
+        fraction = min(max(fraction, 0.0), 1.0)
+        now = time.monotonic()
+        if fraction < 1.0 and now - self._last < self.MIN_INTERVAL:
+            return
+        self._last = now
+        self._sink(self.job_id, {"progress": round(fraction, 4), "message": message})
+
+
+# ---------------------------------------------------------------------------
+# Jobs
+# ---------------------------------------------------------------------------
+
+async def _reload_sector_configs(
+    progress: JobProgress, params: ReloadSectorConfigsParams
+) -> Dict[str, Any]:
+    progress(0.0, "reloading sector configurations")
+    configs = await sector_service.reload_all_configs()
+    progress(1.0, f"{len(configs)} sectors loaded")
+    return {"sectors": len(configs)}
+
+
+async def _rescore_portfolio(progress: JobProgress, params: RescorePortfolioParams) -> Dict[str, Any]:
+    focus_group_ids = params.focus_group_ids
+    if not focus_group_ids:
+        focus_group_ids = [cfg.sector_id for cfg in await sector_service.load_all_configs()]
+    scored: Dict[str, int] = {}
+    for i, focus_group_id in enumerate(focus_group_ids):
+        progress(i / len(focus_group_ids), f"rescoring {focus_group_id}")
+        scored[focus_group_id] = await rescoring_pipeline.rescore_sector(
+            focus_group_id, skip_fresh=params.config_version is not None
+        )
+    progress(1.0, f"{len(scored)} sectors rescored")
+    return {"sectors": scored, "organizations": sum(scored.values())}
+
+
+async def _ingest_organizations(
+    progress: JobProgress, params: IngestOrganizationsParams
+) -> Dict[str, Any]:
+    path = Path(params.path)
+
+    def on_read(position: int, size: int) -> None:
+        # Bytes read lead bytes written by at most the writer queue, which is close enough
+        progress(position / size if size else 1.0, f"{position} of {size} bytes read")
+
+    try:
+        report = await ingest_stream(
+            read_file(path, on_read), params.format, chunk_size=params.chunk_size, dry_run=params.dry_run
+        )
+    finally:
+        if path.resolve().parent == spool_dir().resolve():
+            path.unlink(missing_ok=True)
+    result = report.to_dict()
+    if report.failed:
+        raise JobFailed(f"ingest failed after {report.rows_written} rows: {report.failed}", result)
+    progress(1.0, f"{report.rows_written} written, {report.rows_rejected} rejected")
+    return result
+
+
+async def _invalidate_organizations(result: Dict[str, Any]) -> None:
+    for focus_group_id in result.get("sectors", {}):
+        organization_service.invalidate_cache(focus_group_id)
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    run: Callable[[JobProgress, Any], Awaitable[Dict[str, Any]]]
+    params: Type[BaseModel]
+
+    # Cache upkeep in the API process after a local job returns a result: a pool
+    # child's in-memory cache is its own. Under Celery the cache is shared
+    # and the worker's own invalidations already reach every instance.
+    after: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+
+    # Local runner only: run on the API's event loop rather than in a pool
+    # child, for I/O-bound jobs whose result is this process's own state
+    in_process: bool = False
+
+
+JOBS: Dict[str, JobSpec] = {
+    "reload_sector_configs": JobSpec(_reload_sector_configs, ReloadSectorConfigsParams, in_process=True),
+    "rescore_portfolio": JobSpec(_rescore_portfolio, RescorePortfolioParams),
+    "ingest_organizations": JobSpec(_ingest_organizations, IngestOrganizationsParams, _invalidate_organizations),
+}
+
+
+async def execute_job(job_id: str, kind: str, params: Dict[str, Any], sink: StatusSink) -> Dict[str, Any]:
+    """Run one job to completion, reporting through `sink`; returns the final status fields."""
+    spec = JOBS[kind]
+    log = logger.bind(job_id=job_id, kind=kind)
+    sink(job_id, {"state": "running", "started_at": _now()})
+    log.info("job_started")
+    start = time.perf_counter()
+    with _tracer.start_as_current_span("job.run", attributes={"job.id": job_id, "job.kind": kind}) as span:
+        try:
+            result = await spec.run(JobProgress(job_id, sink), spec.params.model_validate(params))
+            final = {"state": "succeeded", "progress": 1.0, "result": result}
+        except Exception as e:
+            log.exception("job_failed", error=str(e))
+            span.record_exception(e)
+            final = {"state": "failed", "error": str(e), "result": e.result if isinstance(e, JobFailed) else None}
+        span.set_attribute("job.state", final["state"])
+    final["finished_at"] = _now()
+    sink(job_id, final)
+    log.info("job_finished", state=final["state"], duration_s=round(time.perf_counter() - start, 3))
+    return final
+
+
+# ---------------------------------------------------------------------------
+# Status store
+# ---------------------------------------------------------------------------
+
+class JobStore:
+    """Job records plus the idempotency-key -> job_id slots, in a cache that never evicts.
+
+    Calls are blocking (Redis round trips); code on the event loop goes
+    through JobService, which runs them in a thread.
+    """
+
+    KEY = "job:{job_id}"
+    KEY_IDEMPOTENCY = "job_key:{kind}:{key}"
+
+    def __init__(self, backend: Any, ttl: int) -> None:
+        self._cache = backend
+        self._ttl = ttl
+
+    def get(self, job_id: str) -> Optional[JobInfo]:
+        return self._cache.get(self.KEY.format(job_id=job_id))
+
+    def update(self, job_id: str, fields: Dict[str, Any]) -> Optional[JobInfo]:
+        """Apply changed fields (None if the record has expired)."""
+        job = self.get(job_id)
+        if job is None:
+            logger.warning("job_update_for_unknown_job", job_id=job_id, fields=sorted(fields))
+            return None
+        job = job.model_copy(update=fields)
+        self._save(job)
+        return job
+
+    def create(
+        self, kind: str, params: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Tuple[JobInfo, bool]:
+        """A new queued job, or the existing one for this key; the flag is True if created."""
+        job = JobInfo(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            idempotency_key=idempotency_key,
+            params=params,
+            created_at=_now(),
+        )
+        # The record is written before the key is claimed, so a concurrent
+        # submitter that loses the claim always finds the winner's record
+        self._save(job)
+        key = idempotency_key or _digest(params)
+        slot = self.KEY_IDEMPOTENCY.format(kind=kind, key=key)
+        if self._cache.add(slot, job.job_id, self._ttl):
+            return job, True
+
+        existing_id = self._cache.get(slot)
+        existing = self.get(existing_id) if existing_id else None
+        reusable = existing is not None and (
+            existing.state != "failed" if idempotency_key else not existing.finished
+        )
+        if reusable:
+            self._cache.delete(self.KEY.format(job_id=job.job_id))
+            return existing, False
+        # The previous job failed, finished or expired: this submission takes the key
+        self._cache.set(slot, job.job_id, self._ttl)
+        return job, True
+
+    def _save(self, job: JobInfo) -> None:
+        self._cache.set(self.KEY.format(job_id=job.job_id), job, self._ttl)
+
+    def start_sweeper(self, interval: float) -> None:
+        """Drop expired records periodically (Redis expires them itself)."""
+        if isinstance(self._cache, SimpleCache):
+            self._cache.start_sweeper(interval)
+
+    def stop_sweeper(self) -> None:
+        if isinstance(self._cache, SimpleCache):
+            self._cache.stop_sweeper()
+
+
+def _digest(params: Dict[str, Any]) -> str:
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+# ---------------------------------------------------------------------------
+# Runners
+# ---------------------------------------------------------------------------
+
+def _run_in_child(job_id: str, kind: str, params: Dict[str, Any], events: Any) -> Dict[str, Any]:
+    """Process-pool entry point; status updates go back to the parent over `events`."""
+    return asyncio.run(execute_job(job_id, kind, params, lambda jid, fields: events.put((jid, fields))))
+
+
+class LocalJobRunner:
+    """Runs jobs in a spawn-based process pool, keeping heavy work off the API's event loop.
+
+    Child status updates are applied to the store by one thread in this
+    process, so updates for a job are written in order. `stop()` cancels
+    jobs that have not started and waits for running ones to finish. The
+    pool is created on the first submit.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int = 2) -> None:
+        self._store = store
+        self._max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._events = None
+        self._applier: Optional[threading.Thread] = None
+        self._futures: Dict[str, Future] = {}
+        self._watchers: Dict[str, asyncio.Task] = {}
+
+    def _start(self) -> None:
+        # spawn, not fork: the API process has threads and an event loop
+        ctx = multiprocessing.get_context("spawn")
+        self._manager = ctx.Manager()
+        self._events = self._manager.Queue()
+        self._pool = ProcessPoolExecutor(self._max_workers, mp_context=ctx)
+        self._applier = threading.Thread(target=self._apply_events, name="job-status", daemon=True)
+        self._applier.start()
+
+    async def submit(self, job: JobInfo) -> None:
+        if self._pool is None:
+            self._start()
+        if JOBS[job.kind].in_process:
+            self._watchers[job.job_id] = asyncio.ensure_future(self._run_here(job))
+            return
+        future = self._pool.submit(_run_in_child, job.job_id, job.kind, job.params, self._events)
+        self._futures[job.job_id] = future
+        self._watchers[job.job_id] = asyncio.ensure_future(self._watch(job, asyncio.wrap_future(future)))
+
+    async def _watch(self, job: JobInfo, future: Awaitable[Dict[str, Any]]) -> None:
+        try:
+            final = await future
+        except Exception as e:
+            # The child died (BrokenProcessPool) or the job could not be sent to it
+            logger.exception("job_worker_failed", job_id=job.job_id, kind=job.kind, error=str(e))
+            self._events.put((job.job_id, {"state": "failed", "error": f"worker process failed: {e}", "finished_at": _now()}))
+            return
+        finally:
+            self._futures.pop(job.job_id, None)
+            self._watchers.pop(job.job_id, None)
+        after = JOBS[job.kind].after
+        # Partial results count too: a failed ingest may have committed chunks
+        if after is not None and final.get("result") is not None:
+            try:
+                await after(final["result"])
+            except Exception as e:
+                logger.exception("job_after_hook_failed", job_id=job.job_id, kind=job.kind, error=str(e))
+
+    async def _run_here(self, job: JobInfo) -> None:
+        # Status goes through the same queue as the children's, keeping
+        # store writes off the event loop and in order
+        try:
+            await execute_job(job.job_id, job.kind, job.params, lambda jid, fields: self._events.put((jid, fields)))
+        finally:
+            self._watchers.pop(job.job_id, None)
+
+    def _apply_events(self) -> None:
+        while True:
+            item = self._events.get()
+            if item is None:
+                return
+            job_id, fields = item
+            try:
+                self._store.update(job_id, fields)
+            except Exception as e:
+                logger.exception("job_status_update_failed", job_id=job_id, error=str(e))
+
+    async def stop(self) -> None:
+        if self._pool is None:
+            return
+        for job_id, future in list(self._futures.items()):
+            if future.cancel():
+                self._events.put((job_id, {"state": "failed", "error": "cancelled at shutdown", "finished_at": _now()}))
+        await asyncio.to_thread(self._pool.shutdown, wait=True)
+        await asyncio.gather(*self._watchers.values(), return_exceptions=True)
+        self._events.put(None)
+        await asyncio.to_thread(self._applier.join, 5)
+        self._manager.shutdown()
+        self._pool = self._manager = self._events = self._applier = None
+
+
+class CeleryJobRunner:
+    """Sends jobs to the Celery worker; the Celery task id is the job id."""
+
+    async def submit(self, job: JobInfo) -> None:
+        # Imported here so the local runner works without celery installed
+        from pe_orgair.worker import run_job
+
+        await asyncio.to_thread(
+            run_job.apply_async, args=(job.job_id, job.kind, job.params), task_id=job.job_id
+        )
+
+    async def stop(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+class JobService:
+    def __init__(self, store: JobStore, runner: Any) -> None:
+        self._store = store
+        self._runner = runner
+
+    async def submit(
+        self, kind: str, params: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Tuple[JobInfo, bool]:
+        """Queue a job (validating `params` for its kind); returns (job, created)."""
+        spec = JOBS[kind]
+        params = spec.params.model_validate(params).model_dump(mode="json")
+        job, created = await asyncio.to_thread(self._store.create, kind, params, idempotency_key)
+        if not created:
+            logger.info("job_reused", job_id=job.job_id, kind=kind, state=job.state)
+            return job, False
+        try:
+            await self._runner.submit(job)
+        except Exception as e:
+            failed = {"state": "failed", "error": f"could not queue job: {e}", "finished_at": _now()}
+            await asyncio.to_thread(self._store.update, job.job_id, failed)
+            raise
+        logger.info("job_queued", job_id=job.job_id, kind=kind)
+        return job, True
+
+    async def get(self, job_id: str) -> Optional[JobInfo]:
+        return await asyncio.to_thread(self._store.get, job_id)
+
+    async def stop(self) -> None:
+        await self._runner.stop()
+
+
+def _build_store_backend() -> Any:
+    # Not the shared response cache: its LRU/byte bounds could evict a running
+    # job's record or an idempotency key
+    if settings.JOBS_BACKEND == "celery" or settings.CACHE_BACKEND != "memory":
+        return RedisCache(settings.JOBS_REDIS_URL or settings.REDIS_URL, key_prefix="pe_orgair:jobs:")
+    return SimpleCache()
+
+
+def _build_runner(store: JobStore) -> Any:
+    if settings.JOBS_BACKEND == "celery":
+        return CeleryJobRunner()
+    return LocalJobRunner(store, max_workers=settings.JOBS_LOCAL_WORKERS)
+
+
+# Singleton instances
+job_store = JobStore(_build_store_backend(), settings.JOB_TTL)
+job_service = JobService(job_store, _build_runner(job_store))
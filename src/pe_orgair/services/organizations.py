@@ -0,0 +1,356 @@
+# src/pe_orgair/services/organizations.py
+"""Organization store: bulk, columnar loading of organizations with their sector attributes."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import uuid
+from dataclasses import asdict, dataclass
+from functools import partial
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+from opentelemetry import trace
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.infrastructure.cache import cache, jittered, off_loop
+from pe_orgair.infrastructure.singleflight import SingleFlight
+from pe_orgair.schemas.organization import OrganizationBatch
+
+logger = structlog.get_logger()
+_tracer = trace.get_tracer(__name__)
+
+# Core organizations columns carried in every batch (organization_id is separate)
+CORE_COLUMNS: Tuple[str, ...] = (
+    "legal_name",
+    "display_name",
+    "ticker_symbol",
+    "cik_number",
+    "duns_number",
+    "primary_sic_code",
+    "primary_naics_code",
+    "employee_count",
+    "annual_revenue_usd",
+    "founding_year",
+    "headquarters_country",
+    "headquarters_state",
+    "headquarters_city",
+    "website_url",
+)
+
+# focus_group_id -> (attribute table, its columns), mirroring 002e_sector_attributes.sql
+SECTOR_ATTRIBUTES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "pe_manufacturing": (
+        "org_attributes_manufacturing",
+        (
+            "ot_systems", "it_ot_integration", "scada_vendor", "mes_system", "plant_count",
+            "automation_level", "iot_platforms", "digital_twin_status", "edge_computing",
+            "supply_chain_visibility", "demand_forecasting_ai",
+        ),
+    ),
+    "pe_financial_services": (
+        "org_attributes_financial_services",
+        (
+            "regulatory_bodies", "charter_type", "model_risk_framework", "mrm_team_size",
+            "model_inventory_count", "algo_trading", "fraud_detection_ai", "credit_ai", "aml_ai",
+            "aum_billions", "total_assets_billions",
+        ),
+    ),
+    "pe_healthcare": (
+        "org_attributes_healthcare",
+        (
+            "hipaa_certified", "hitrust_certified", "fda_clearances", "fda_clearance_count",
+            "ehr_system", "ehr_integration_level", "fhir_enabled", "clinical_ai_deployed",
+            "imaging_ai", "org_type", "bed_count",
+        ),
+    ),
+    "pe_technology": (
+        "org_attributes_technology",
+        (
+            "tech_category", "primary_language", "cloud_native", "github_org", "github_stars_total",
+            "open_source_projects", "ml_platform", "llm_integration", "ai_product_features",
+            "gpu_infrastructure",
+        ),
+    ),
+    "pe_retail": (
+        "org_attributes_retail",
+        (
+            "retail_type", "store_count", "ecommerce_pct", "cdp_vendor", "loyalty_program",
+            "loyalty_members", "personalization_ai", "recommendation_engine", "demand_forecasting",
+        ),
+    ),
+    "pe_energy": (
+        "org_attributes_energy",
+        (
+            "energy_type", "regulated", "scada_systems", "ami_deployed", "smart_grid_pct",
+            "generation_capacity_mw", "grid_optimization_ai", "predictive_maintenance",
+            "renewable_pct",
+        ),
+    ),
+    "pe_professional_services": (
+        "org_attributes_professional_services",
+        (
+            "firm_type", "partnership_model", "partner_count", "professional_staff", "km_system",
+            "document_ai", "knowledge_graph", "client_ai_services", "internal_ai_tools",
+        ),
+    ),
+}
+
+
+# DECIMAL columns are read as float8 so batches stay JSON-safe (Redis) and
+# NumPy-friendly without a per-value conversion in Python
+_DECIMAL_COLUMNS = frozenset({
+    "annual_revenue_usd",
+    "aum_billions",
+    "total_assets_billions",
+    "ecommerce_pct",
+    "smart_grid_pct",
+    "generation_capacity_mw",
+    "renewable_pct",
+})
+
+
+def _select(alias: str, column: str) -> str:
+    return f"{alias}.{column}::float8 AS {column}" if column in _DECIMAL_COLUMNS else f"{alias}.{column}"
+
+
+def _sector_query(table: str, attribute_columns: Sequence[str]) -> str:
+    # Table and column names come from SECTOR_ATTRIBUTES, never from callers
+    core = ", ".join(_select("o", c) for c in CORE_COLUMNS)
+    attrs = ", ".join(_select("a", c) for c in attribute_columns)
+    return f"""
+        SELECT o.organization_id::text AS organization_id, {core}, {attrs}
+        FROM organizations o
+        LEFT JOIN {table} a ON a.organization_id = o.organization_id
+        WHERE o.focus_group_id = %(focus_group_id)s
+          AND o.status = 'active'
+        ORDER BY o.organization_id
+    """
+
+
+_LIST_COLUMNS = """o.organization_id::text AS organization_id, o.legal_name, o.display_name,
+    o.ticker_symbol, o.focus_group_id, o.status, o.employee_count,
+    o.annual_revenue_usd::float8 AS annual_revenue_usd, o.founding_year,
+    o.headquarters_country, o.headquarters_state, o.headquarters_city,
+    o.website_url, o.updated_at"""
+
+
+@dataclass(frozen=True)
+class OrganizationFilters:
+    """Filters for the organizations listing (None = not filtered)."""
+    focus_group_ids: Optional[Tuple[str, ...]] = None
+    status: str = "active"
+    headquarters_country: Optional[str] = None
+    min_revenue: Optional[float] = None
+    max_revenue: Optional[float] = None
+    min_employees: Optional[int] = None
+    max_employees: Optional[int] = None
+
+    def fingerprint(self) -> str:
+        """Short hash binding a cursor to the filters it was issued for."""
+        canonical = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+
+    def where(self) -> Tuple[List[str], Dict[str, Any]]:
+        """SQL predicates for the filters that are set (only those, so the planner
+        sees a plain, index-friendly WHERE clause)."""
+        clauses = ["o.status = %(status)s"]
+        params: Dict[str, Any] = {"status": self.status}
+        if self.focus_group_ids and len(self.focus_group_ids) == 1:
+            # Plain equality lets the planner walk the (focus_group_id, status, legal_name) index in order
+            clauses.append("o.focus_group_id = %(focus_group_id)s")
+            params["focus_group_id"] = self.focus_group_ids[0]
+        elif self.focus_group_ids:
+            clauses.append("o.focus_group_id = ANY(%(focus_group_ids)s)")
+            params["focus_group_ids"] = list(self.focus_group_ids)
+        if self.headquarters_country:
+            clauses.append("o.headquarters_country = %(headquarters_country)s")
+            params["headquarters_country"] = self.headquarters_country
+        for name, column, op in (
+            ("min_revenue", "annual_revenue_usd", ">="),
+            ("max_revenue", "annual_revenue_usd", "<="),
+            ("min_employees", "employee_count", ">="),
+            ("max_employees", "employee_count", "<="),
+        ):
+            value = getattr(self, name)
+            if value is not None:
+                clauses.append(f"o.{column} {op} %({name})s")
+                params[name] = value
+        return clauses, params
+
+
+def encode_cursor(legal_name: str, organization_id: str, filters: OrganizationFilters) -> str:
+    raw = json.dumps([legal_name, organization_id, filters.fingerprint()], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, filters: OrganizationFilters) -> Tuple[str, str]:
+    """(legal_name, organization_id) of the last row of the previous page.
+
+    Raises ValueError for malformed cursors or cursors issued for other filters.
+    The fingerprint is not a signature (anyone can recompute it), so the
+    fields are type-checked here rather than trusted to reach the SQL casts.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        legal_name, organization_id, fingerprint = json.loads(raw)
+        if not isinstance(legal_name, str) or not isinstance(organization_id, str):
+            raise TypeError("cursor fields must be strings")
+        organization_id = str(uuid.UUID(organization_id))
+    except (ValueError, TypeError) as e:
+        raise ValueError("malformed cursor") from e
+    if fingerprint != filters.fingerprint():
+        raise ValueError("cursor was issued for different filters")
+    return legal_name, organization_id
+
+
+class OrganizationService:
+    """Active organizations per sector, as cached columnar batches.
+
+    Each sector is one query (organizations LEFT JOIN its attribute table),
+    transposed into per-column lists once and cached under
+    `orgs:{focus_group_id}`. Callers that need numbers pull NumPy arrays with
+    `OrganizationBatch.array(...)` instead of walking a dict per organization.
+    """
+
+    CACHE_KEY_SECTOR = "orgs:{focus_group_id}"
+    CACHE_TTL = 900  # 15 min (hard)
+    CACHE_SOFT_TTL = 300  # 5 min (soft: serve stale + refresh in background)
+
+    def __init__(self) -> None:
+        self._flight = SingleFlight("organizations")
+
+    async def get_batch(self, focus_group_id: str) -> Optional[OrganizationBatch]:
+        """All active organizations of one sector (None if the sector has no attribute table)."""
+        if focus_group_id not in SECTOR_ATTRIBUTES:
+            return None
+        cache_key = self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id)
+
+        loader = partial(self._load_and_cache, focus_group_id)
+        entry = await cache.aget_entry(cache_key)
+        if entry is not None and entry.value is not None:
+            if entry.stale and not self._flight.in_flight(cache_key):
+                self._flight.start(cache_key, loader)
+            return entry.value
+
+        return await self._flight.do(cache_key, loader)
+
+    async def get_batches(
+        self, focus_group_ids: Optional[Sequence[str]] = None
+    ) -> Dict[str, OrganizationBatch]:
+        """Batches for several sectors (every sector if None); unknown sectors are omitted.
+
+        Hits come from one cache multi-get; misses load concurrently, one query each.
+        """
+        ids = [i for i in dict.fromkeys(focus_group_ids or SECTOR_ATTRIBUTES) if i in SECTOR_ATTRIBUTES]
+        keys = {self.CACHE_KEY_SECTOR.format(focus_group_id=i): i for i in ids}
+        results: Dict[str, OrganizationBatch] = {}
+
+        for key, entry in (await cache.aget_entries(keys)).items():
+            if entry.value is not None:
+                results[keys[key]] = entry.value
+                if entry.stale and not self._flight.in_flight(key):
+                    self._flight.start(key, partial(self._load_and_cache, keys[key]))
+
+        missing = [i for i in ids if i not in results]
+        loaded = await asyncio.gather(*(self.get_batch(i) for i in missing))
+        for fg_id, batch in zip(missing, loaded):
+            if batch is not None:
+                results[fg_id] = batch
+        return {i: results[i] for i in ids if i in results}
+
+    async def list_organizations(
+        self,
+        filters: OrganizationFilters,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """One page of organizations ordered by (legal_name, organization_id).
+
+        Keyset pagination: the cursor carries the last row's sort key, so every
+        page is an index range scan of `limit + 1` rows no matter how deep it
+        is. Returns (rows, next_cursor); next_cursor is None on the last page.
+        Raises ValueError for an invalid cursor.
+        """
+        clauses, params = filters.where()
+        if cursor:
+            params["after_name"], params["after_id"] = decode_cursor(cursor, filters)
+            clauses.append("(o.legal_name, o.organization_id) > (%(after_name)s, %(after_id)s::uuid)")
+        params["limit"] = limit + 1
+
+        rows = await adb.fetch_all(
+            f"""
+            SELECT {_LIST_COLUMNS}
+            FROM organizations o
+            WHERE {" AND ".join(clauses)}
+            ORDER BY o.legal_name, o.organization_id
+            LIMIT %(limit)s
+            """,
+            params,
+            name="list_organizations",
+        )
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last["legal_name"], last["organization_id"], filters)
+
+    def invalidate_cache(self, focus_group_id: Optional[str] = None) -> None:
+        """Drop cached batches (one sector, or every sector if None)."""
+        off_loop(cache.invalidate_pattern, self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id or "*"))
+        logger.info("organization_cache_invalidated", focus_group_id=focus_group_id)
+
+    async def _load_and_cache(self, focus_group_id: str) -> Optional[OrganizationBatch]:
+        with _tracer.start_as_current_span(
+            "organizations.load", attributes={"focus_group_id": focus_group_id}
+        ) as span:
+            batch = await self._load_from_db(focus_group_id)
+            span.set_attribute("organizations", len(batch) if batch is not None else 0)
+        if batch is None:
+            return None
+        await cache.aset(
+            self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id),
+            batch,
+            jittered(self.CACHE_TTL),
+            jittered(self.CACHE_SOFT_TTL),
+        )
+        return batch
+
+    async def _load_from_db(self, focus_group_id: str) -> Optional[OrganizationBatch]:
+        """One query for the sector; DB/infra issues => log + return None (not cached)."""
+        table, attribute_columns = SECTOR_ATTRIBUTES[focus_group_id]
+        try:
+            rows = await adb.fetch_all(
+                _sector_query(table, attribute_columns),
+                {"focus_group_id": focus_group_id},
+                name=f"organizations_{focus_group_id}",
+            )
+        except RuntimeError as e:
+            logger.warning("organizations_db_unavailable", focus_group_id=focus_group_id, error=str(e))
+            return None
+        except Exception as e:
+            logger.exception("organizations_db_error", focus_group_id=focus_group_id, error=str(e))
+            return None
+
+        batch = self._to_batch(focus_group_id, table, attribute_columns, rows)
+        logger.info("organizations_loaded", focus_group_id=focus_group_id, organizations=len(batch))
+        return batch
+
+    @staticmethod
+    def _to_batch(
+        focus_group_id: str, table: str, attribute_columns: Sequence[str], rows: List[dict]
+    ) -> OrganizationBatch:
+        return OrganizationBatch(
+            focus_group_id=focus_group_id,
+            attribute_table=table,
+            organization_ids=list(map(itemgetter("organization_id"), rows)),
+            columns={c: list(map(itemgetter(c), rows)) for c in CORE_COLUMNS},
+            attributes={c: list(map(itemgetter(c), rows)) for c in attribute_columns},
+        )
+
+
+# Singleton instance
+organization_service = OrganizationService()
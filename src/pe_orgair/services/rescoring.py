@@ -0,0 +1,183 @@
+# src/pe_orgair/services/rescoring.py
+"""Incremental rescoring: when one sector's config changes, rescore only its organizations."""
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional, Set
+
+import structlog
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.services.scoring import (
+    PortfolioScores,
+    ScoringParams,
+    config_fingerprint,
+    load_score_inputs,
+    score_portfolio,
+)
+from pe_orgair.services.sector_config import sector_service
+
+logger = structlog.get_logger()
+
+_UPSERT_SCORE = """
+    INSERT INTO organization_scores (
+        organization_id, focus_group_id, weighted_score, penalty, v_r_score,
+        h_r_score, synergy_score, org_air_score, config_version, computed_at
+    ) VALUES (
+        %(organization_id)s, %(focus_group_id)s, %(weighted)s, %(penalty)s, %(v_r)s,
+        %(h_r)s, %(synergy)s, %(org_air)s, %(config_version)s, CURRENT_TIMESTAMP
+    )
+    ON CONFLICT (organization_id) DO UPDATE SET
+        focus_group_id = EXCLUDED.focus_group_id,
+        weighted_score = EXCLUDED.weighted_score,
+        penalty = EXCLUDED.penalty,
+        v_r_score = EXCLUDED.v_r_score,
+        h_r_score = EXCLUDED.h_r_score,
+        synergy_score = EXCLUDED.synergy_score,
+        org_air_score = EXCLUDED.org_air_score,
+        config_version = EXCLUDED.config_version,
+        computed_at = EXCLUDED.computed_at
+"""
+
+
+_STALE_COUNT = """
+    SELECT count(*) AS stale
+    FROM organizations o
+    LEFT JOIN organization_scores s ON s.organization_id = o.organization_id
+    WHERE o.focus_group_id = %(focus_group_id)s
+      AND o.status = 'active'
+      AND (s.config_version IS DISTINCT FROM %(config_version)s
+           OR s.focus_group_id IS DISTINCT FROM o.focus_group_id)
+"""
+
+
+class RescoringPipeline:
+    """Rescore a sector's organizations whenever its configuration is invalidated.
+
+    `register()` hooks into SectorConfigService.invalidate_cache. An
+    invalidation does not score anything in the API process: it submits a
+    `rescore_portfolio` job whose params carry the new config fingerprint, so
+    the submissions every worker makes for one change coalesce into one job
+    (when the job store is shared). The rescore itself holds a Postgres
+    advisory lock per sector and skips a sector whose scores are already at
+    the current config, so a change is scored once however many processes
+    react to it. Results are stamped with the config fingerprint so readers
+    can tell fresh scores from stale ones. Whole-cache invalidations (no
+    focus_group_id) do not trigger a rescore.
+    """
+
+    def __init__(self) -> None:
+        self._submitting: Set[asyncio.Task] = set()
+
+    def register(self) -> None:
+        sector_service.add_invalidation_listener(self._on_invalidated)
+
+    def unregister(self) -> None:
+        sector_service.remove_invalidation_listener(self._on_invalidated)
+
+    def _on_invalidated(self, focus_group_id: Optional[str]) -> None:
+        if not focus_group_id:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("rescore_skipped_no_event_loop", focus_group_id=focus_group_id)
+            return
+        self.schedule(focus_group_id)
+
+    def schedule(self, focus_group_id: str) -> None:
+        """Queue a background rescore of one sector at its current config."""
+        task = asyncio.ensure_future(self._submit(focus_group_id))
+        self._submitting.add(task)
+        task.add_done_callback(self._submitting.discard)
+
+    async def _submit(self, focus_group_id: str) -> None:
+        # Imported here: the job module imports this one
+        from pe_orgair.services.jobs import job_service
+
+        try:
+            cfg = await sector_service.get_config(focus_group_id)
+            if cfg is None:
+                logger.warning("rescore_unknown_sector", focus_group_id=focus_group_id)
+                return
+            params = {"focus_group_ids": [focus_group_id], "config_version": config_fingerprint(cfg)}
+            await job_service.submit("rescore_portfolio", params)
+        except Exception as e:
+            logger.exception("rescore_submit_failed", focus_group_id=focus_group_id, error=str(e))
+
+    async def rescore_sector(
+        self, focus_group_id: str, params: Optional[ScoringParams] = None, *, skip_fresh: bool = False
+    ) -> int:
+        """Recompute and store scores for every active organization in one sector.
+
+        Runs under a per-sector advisory lock, so concurrent rescores of a
+        sector take turns. With `skip_fresh` the sector is left alone (and 0
+        returned) when every active organization is already scored at the
+        current config.
+        """
+        async with adb.transaction(name="rescore_sector_lock") as conn:
+            await conn.execute(
+                "SELECT pg_advisory_xact_lock(hashtext(%(lock)s))", {"lock": f"rescore:{focus_group_id}"}
+            )
+            # Straight from the database: the current config, and a DB error
+            # fails the rescore instead of looking like an unknown sector
+            cfg = await sector_service.load_config(focus_group_id)
+            if cfg is None:
+                logger.warning("rescore_unknown_sector", focus_group_id=focus_group_id)
+                return 0
+            version = config_fingerprint(cfg)
+            if skip_fresh and not await self._stale_count(focus_group_id, version):
+                logger.info("rescore_skipped_fresh", focus_group_id=focus_group_id, config_version=version)
+                return 0
+
+            inputs = await load_score_inputs([focus_group_id])
+            if not len(inputs):
+                return 0
+            result = score_portfolio(inputs, {focus_group_id: cfg}, params or ScoringParams.from_settings())
+            written = await self._store(result, version)
+        logger.info(
+            "sector_rescored",
+            focus_group_id=focus_group_id,
+            organizations=written,
+            config_version=version,
+        )
+        return written
+
+    async def _stale_count(self, focus_group_id: str, version: str) -> int:
+        row = await adb.fetch_one(
+            _STALE_COUNT,
+            {"focus_group_id": focus_group_id, "config_version": version},
+            name="count_stale_organization_scores",
+        )
+        return row["stale"]
+
+    async def _store(self, result: PortfolioScores, version: str) -> int:
+        rows = result.to_records()
+        for row in rows:
+            row["config_version"] = version
+        await adb.execute_many(_UPSERT_SCORE, rows, name="upsert_organization_scores")
+        return len(rows)
+
+    async def get_scores(self, focus_group_id: str) -> List[dict]:
+        """Stored scores for a sector, each flagged `is_fresh` against the current config."""
+        cfg = await sector_service.get_config(focus_group_id)
+        current = config_fingerprint(cfg) if cfg is not None else None
+        rows = await adb.fetch_all(
+            """
+            SELECT organization_id::text AS organization_id, focus_group_id,
+                   org_air_score, v_r_score, h_r_score, synergy_score, penalty,
+                   config_version, computed_at
+            FROM organization_scores
+            WHERE focus_group_id = %(focus_group_id)s
+            ORDER BY organization_id
+            """,
+            {"focus_group_id": focus_group_id},
+            name="select_organization_scores",
+        )
+        for row in rows:
+            row["is_fresh"] = current is not None and row["config_version"] == current
+        return rows
+
+
+# Singleton instance
+rescoring_pipeline = RescoringPipeline()
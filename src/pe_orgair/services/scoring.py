@@ -0,0 +1,291 @@
+# src/pe_orgair/services/scoring.py
+"""Vectorized Org-AI-R scoring for whole portfolios.
+
+All organizations are scored in one pass of NumPy array operations: each row's
+sector weights and calibrations are gathered from small per-sector tables, so
+there is no per-organization Python (or Decimal) loop.
+
+Per organization, with dimension scores s_d in [0, 100] and sector weights w_d:
+
+    weighted  = sum_d w_d * s_d
+    penalty   = lambda * cv(s)                      (weighted coefficient of variation)
+              + lambda * max(0, talent_conc - talent_concentration_threshold)
+    V^R       = clip(weighted * (1 - penalty), 0, 100)
+    H^R       = clip(h_r_baseline * (1 + position_factor_delta * position_factor), 0, 100)
+    synergy   = sqrt(V^R * H^R)
+    Org-AI-R  = (1 - beta) * (alpha * V^R + (1 - alpha) * H^R) + beta * synergy
+
+alpha, beta and lambda come from Settings (ALPHA_VR_WEIGHT, BETA_SYNERGY_WEIGHT,
+LAMBDA_PENALTY); everything else comes from the sector configuration. The
+`ebitda_multiplier` calibration is not a scoring input: it scales EBITDA
+projections, which this module does not compute.
+
+position_factor and talent_conc are per-organization inputs with no table
+yet, so `load_score_inputs` leaves them unset: stored scores use
+H^R = h_r_baseline and no talent-concentration penalty until that data
+exists. Callers that have the values can pass them in `ScoreInputs`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import structlog
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.schemas.sector_config import SectorConfigContract
+from pe_orgair.services.sector_config import sector_service
+
+logger = structlog.get_logger()
+
+# Column order of every dimension-score matrix (matches dimensions.display_order)
+DIMENSION_CODES = (
+    "DATA_INFRA",
+    "AI_GOV",
+    "TECH_STACK",
+    "TALENT",
+    "LEADERSHIP",
+    "USE_CASES",
+    "CULTURE",
+)
+_DIM_INDEX = {code: i for i, code in enumerate(DIMENSION_CODES)}
+
+# Calibration defaults mirror SectorConfig's properties
+_CALIBRATION_DEFAULTS = {
+    "h_r_baseline": 75.0,
+    "position_factor_delta": 0.15,
+    "talent_concentration_threshold": 0.25,
+}
+
+
+@dataclass(frozen=True)
+class ScoringParams:
+    """Platform-wide scoring coefficients."""
+    alpha: float = 0.60
+    beta: float = 0.12
+    lam: float = 0.25
+
+    @classmethod
+    def from_settings(cls) -> "ScoringParams":
+        from pe_orgair.config.settings import get_settings
+
+        s = get_settings()
+        return cls(alpha=s.ALPHA_VR_WEIGHT, beta=s.BETA_SYNERGY_WEIGHT, lam=s.LAMBDA_PENALTY)
+
+
+@dataclass
+class ScoreInputs:
+    """Row-aligned scoring inputs for N organizations."""
+    organization_ids: List[str]
+    focus_group_ids: np.ndarray               # (N,) object
+    dimension_scores: np.ndarray              # (N, 7) float64, columns = DIMENSION_CODES
+    position_factors: Optional[np.ndarray] = None      # (N,) in [-1, 1]; 0 if omitted
+    talent_concentration: Optional[np.ndarray] = None  # (N,) in [0, 1]; no penalty if omitted
+
+    def __len__(self) -> int:
+        return len(self.organization_ids)
+
+
+@dataclass
+class PortfolioScores:
+    """Row-aligned scoring outputs (same order as the inputs)."""
+    organization_ids: List[str]
+    focus_group_ids: np.ndarray
+    weighted: np.ndarray
+    penalty: np.ndarray
+    v_r: np.ndarray
+    h_r: np.ndarray
+    synergy: np.ndarray
+    org_air: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.organization_ids)
+
+    def to_records(self) -> List[Dict[str, object]]:
+        return [
+            {
+                "organization_id": org_id,
+                "focus_group_id": str(self.focus_group_ids[i]),
+                "weighted": float(self.weighted[i]),
+                "penalty": float(self.penalty[i]),
+                "v_r": float(self.v_r[i]),
+                "h_r": float(self.h_r[i]),
+                "synergy": float(self.synergy[i]),
+                "org_air": float(self.org_air[i]),
+            }
+            for i, org_id in enumerate(self.organization_ids)
+        ]
+
+
+def weight_vector(cfg: SectorConfigContract) -> np.ndarray:
+    """Sector weights in DIMENSION_CODES order (missing dimensions weigh 0)."""
+    w = np.zeros(len(DIMENSION_CODES))
+    for code, weight in cfg.dimension_weights.items():
+        idx = _DIM_INDEX.get(code)
+        if idx is not None:
+            w[idx] = float(weight)
+    return w
+
+
+def config_fingerprint(cfg: SectorConfigContract) -> str:
+    """Stable version id for a sector's weights + calibrations (changes iff they change)."""
+    canonical = json.dumps(
+        {
+            "w": {k: str(v.normalize()) for k, v in sorted(cfg.dimension_weights.items())},
+            "c": {k: str(v.normalize()) for k, v in sorted(cfg.calibrations.items())},
+        },
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _calibration(cfg: SectorConfigContract, name: str) -> float:
+    value = cfg.calibrations.get(name)
+    return float(value) if value is not None else _CALIBRATION_DEFAULTS[name]
+
+
+def score_portfolio(
+    inputs: ScoreInputs,
+    configs: Mapping[str, SectorConfigContract],
+    params: Optional[ScoringParams] = None,
+) -> PortfolioScores:
+    """Score every organization in `inputs` against its sector's configuration.
+
+    Raises KeyError if an organization's focus group has no entry in `configs`.
+    """
+    params = params or ScoringParams()
+    scores = np.asarray(inputs.dimension_scores, dtype=np.float64)
+    n = scores.shape[0]
+    if scores.shape != (n, len(DIMENSION_CODES)):
+        raise ValueError(f"dimension_scores must be (N, {len(DIMENSION_CODES)}), got {scores.shape}")
+
+    # Per-sector lookup tables, gathered to per-row arrays via the inverse index
+    sectors, row_sector = np.unique(np.asarray(inputs.focus_group_ids, dtype=object), return_inverse=True)
+    missing = [fg for fg in sectors if fg not in configs]
+    if missing:
+        raise KeyError(f"no sector configuration for: {sorted(missing)}")
+    cfgs = [configs[fg] for fg in sectors]
+    weights = np.stack([weight_vector(c) for c in cfgs])[row_sector]                       # (N, 7)
+    h_r_base = np.array([_calibration(c, "h_r_baseline") for c in cfgs])[row_sector]
+    delta = np.array([_calibration(c, "position_factor_delta") for c in cfgs])[row_sector]
+    tc_threshold = np.array([_calibration(c, "talent_concentration_threshold") for c in cfgs])[row_sector]
+
+    weighted = np.einsum("ij,ij->i", weights, scores)
+
+    # Dispersion penalty: weighted coefficient of variation across dimensions
+    spread = np.sqrt(np.einsum("ij,ij->i", weights, (scores - weighted[:, None]) ** 2))
+    cv = np.divide(spread, weighted, out=np.zeros(n), where=weighted > 0)
+    penalty = params.lam * cv
+    if inputs.talent_concentration is not None:
+        excess = np.clip(np.asarray(inputs.talent_concentration, dtype=np.float64) - tc_threshold, 0.0, None)
+        penalty = penalty + params.lam * excess
+    penalty = np.clip(penalty, 0.0, 1.0)
+
+    v_r = np.clip(weighted * (1.0 - penalty), 0.0, 100.0)
+
+    position = (
+        np.zeros(n)
+        if inputs.position_factors is None
+        else np.clip(np.asarray(inputs.position_factors, dtype=np.float64), -1.0, 1.0)
+    )
+    h_r = np.clip(h_r_base * (1.0 + delta * position), 0.0, 100.0)
+
+    synergy = np.sqrt(v_r * h_r)
+    org_air = (1.0 - params.beta) * (params.alpha * v_r + (1.0 - params.alpha) * h_r) + params.beta * synergy
+
+    return PortfolioScores(
+        organization_ids=list(inputs.organization_ids),
+        focus_group_ids=np.asarray(inputs.focus_group_ids, dtype=object),
+        weighted=weighted,
+        penalty=penalty,
+        v_r=v_r,
+        h_r=h_r,
+        synergy=synergy,
+        org_air=org_air,
+    )
+
+
+async def load_score_inputs(focus_group_ids: Optional[Sequence[str]] = None) -> ScoreInputs:
+    """Load current dimension scores for active organizations as one (N, 7) matrix.
+
+    One query for the whole selection; dimensions with no current score are 0.
+    Position factors and talent concentration are not stored anywhere yet, so
+    they are left unset (neutral; see the module docstring).
+    """
+    query = """
+        SELECT o.organization_id::text AS organization_id, o.focus_group_id,
+               d.dimension_code, s.score
+        FROM organizations o
+        LEFT JOIN organization_dimension_scores s
+          ON s.organization_id = o.organization_id
+         AND s.is_current = TRUE
+        LEFT JOIN dimensions d ON s.dimension_id = d.dimension_id
+        WHERE o.status = 'active'
+          AND (%(focus_group_ids)s::text[] IS NULL OR o.focus_group_id = ANY(%(focus_group_ids)s))
+        ORDER BY o.focus_group_id, o.organization_id
+    """
+    rows = await adb.fetch_all(
+        query,
+        {"focus_group_ids": list(focus_group_ids) if focus_group_ids is not None else None},
+        name="load_score_inputs",
+    )
+
+    row_of: Dict[str, int] = {}
+    org_ids: List[str] = []
+    fg_ids: List[str] = []
+    for row in rows:
+        if row["organization_id"] not in row_of:
+            row_of[row["organization_id"]] = len(org_ids)
+            org_ids.append(row["organization_id"])
+            fg_ids.append(row["focus_group_id"])
+
+    scores = np.zeros((len(org_ids), len(DIMENSION_CODES)))
+    for row in rows:
+        col = _DIM_INDEX.get(row["dimension_code"])
+        if col is not None and row["score"] is not None:
+            scores[row_of[row["organization_id"]], col] = float(row["score"])
+
+    return ScoreInputs(
+        organization_ids=org_ids,
+        focus_group_ids=np.array(fg_ids, dtype=object),
+        dimension_scores=scores,
+    )
+
+
+class PortfolioScoringService:
+    """Loads inputs and sector configs, then scores the whole selection at once."""
+
+    async def score(
+        self,
+        focus_group_ids: Optional[Sequence[str]] = None,
+        params: Optional[ScoringParams] = None,
+    ) -> PortfolioScores:
+        inputs = await load_score_inputs(focus_group_ids)
+        sector_ids = sorted(set(inputs.focus_group_ids.tolist()))
+        found = await sector_service.get_configs(sector_ids)
+        configs = {fg: cfg for fg, cfg in found.items() if cfg is not None}
+
+        unconfigured = [fg for fg in sector_ids if fg not in configs]
+        if unconfigured:
+            logger.warning("scoring_sectors_without_config", focus_group_ids=unconfigured)
+            keep = np.isin(inputs.focus_group_ids, unconfigured, invert=True)
+            inputs = ScoreInputs(
+                organization_ids=[o for o, k in zip(inputs.organization_ids, keep) if k],
+                focus_group_ids=inputs.focus_group_ids[keep],
+                dimension_scores=inputs.dimension_scores[keep],
+                position_factors=None if inputs.position_factors is None else inputs.position_factors[keep],
+                talent_concentration=(
+                    None if inputs.talent_concentration is None else inputs.talent_concentration[keep]
+                ),
+            )
+
+        result = score_portfolio(inputs, configs, params or ScoringParams.from_settings())
+        logger.info("portfolio_scored", organizations=len(result), sectors=len(configs))
+        return result
+
+
+# Singleton instance
+scoring_service = PortfolioScoringService()
@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import date
+from functools import partial
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import structlog
+from opentelemetry import trace
 from pydantic import ValidationError
 
-from pe_orgair.db.snowflake import db
-from pe_orgair.infrastructure.cache import cache
+from pe_orgair.db.snowflake import adb
+from pe_orgair.infrastructure.cache import cache, jittered, off_loop
+from pe_orgair.infrastructure.singleflight import SingleFlight
 from pe_orgair.schemas.sector_config import SectorConfigContract
+from pe_orgair.services.sector_history import SectorConfigHistory
 
 logger = structlog.get_logger()
+_tracer = trace.get_tracer(__name__)
 
 
 @dataclass
@@ -54,82 +60,209 @@ class SectorConfigService:
 
     CACHE_KEY_SECTOR = "sector:{focus_group_id}"
     CACHE_KEY_ALL = "sectors:all"
-    CACHE_TTL = 3600  # 1 hour
+    CACHE_TTL = 3600  # 1 hour (hard: past this, callers block on a reload)
+    CACHE_SOFT_TTL = 600  # 10 min (soft: past this, serve stale + refresh in background)
+
+    def __init__(self) -> None:
+        # Concurrent misses for the same cache key share one DB load
+        self._flight = SingleFlight("sector_config")
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self._history: Optional[SectorConfigHistory] = None
+        # Bumped by invalidate_cache; a load that started under an older
+        # generation must not write its (possibly pre-change) result back
+        self._generation = 0
+
+    async def get_config(
+        self, focus_group_id: str, as_of: Optional[date] = None
+    ) -> Optional[SectorConfigContract]:
+        """Get configuration for a single sector (validated contract).
+
+        With `as_of`, returns the configuration in effect on that date from the
+        in-memory history index (loaded in bulk on first use).
+        """
+        if as_of is not None:
+            history = await self.get_history()
+            return history.get_config(focus_group_id, as_of)
 
-    async def get_config(self, focus_group_id: str) -> Optional[SectorConfigContract]:
-        """Get configuration for a single sector (validated contract)."""
         cache_key = self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id)
 
-        cached = cache.get(cache_key)
-        if cached:
-            cfg = self._dict_to_config(cached)
-            return self._to_contract(cfg)
-
-        cfg = await self._load_from_db(focus_group_id)
-        if not cfg:
-            return None
+        loader = partial(self._load_and_cache, focus_group_id)
+        entry = await cache.aget_entry(cache_key)
+        if entry is not None and entry.value:
+            if entry.stale:
+                self._refresh_in_background(cache_key, loader)
+            # The cache holds the frozen, already-validated contract
+            return entry.value
 
-        cache.set(cache_key, self._config_to_dict(cfg), self.CACHE_TTL)
-        return self._to_contract(cfg)
+        return await self._flight.do(cache_key, loader)
 
     async def get_all_configs(self) -> List[SectorConfigContract]:
         """Get all sector configurations (validated contract)."""
         cache_key = self.CACHE_KEY_ALL
 
-        cached = cache.get(cache_key)
-        if cached:
-            return [self._to_contract(self._dict_to_config(c)) for c in cached]
+        entry = await cache.aget_entry(cache_key)
+        if entry is not None and entry.value:
+            if entry.stale:
+                self._refresh_in_background(cache_key, self._load_all_and_cache)
+            return list(entry.value)
+
+        return list(await self._flight.do(cache_key, self._load_all_and_cache))
+
+    async def get_configs(self, focus_group_ids: List[str]) -> Dict[str, Optional[SectorConfigContract]]:
+        """Get several sectors at once (unknown ids map to None).
+
+        Hits come from one cache multi-get; more than one miss is served by a
+        single bulk load instead of one query per id.
+        """
+        ids = list(dict.fromkeys(focus_group_ids))
+        keys = {self.CACHE_KEY_SECTOR.format(focus_group_id=i): i for i in ids}
+        results: Dict[str, Optional[SectorConfigContract]] = dict.fromkeys(ids)
+
+        for key, entry in (await cache.aget_entries(keys)).items():
+            if entry.value:
+                results[keys[key]] = entry.value
+                if entry.stale:
+                    self._refresh_in_background(key, partial(self._load_and_cache, keys[key]))
+
+        missing = [i for i in ids if results[i] is None]
+        if len(missing) == 1:
+            results[missing[0]] = await self.get_config(missing[0])
+        elif missing:
+            by_id = {c.sector_id: c for c in await self.get_all_configs()}
+            for i in missing:
+                results[i] = by_id.get(i)
+        return results
+
+    async def load_config(self, focus_group_id: str) -> Optional[SectorConfigContract]:
+        """Read one sector straight from the database, bypassing the cache.
+
+        For background jobs: a database error raises instead of reading as an
+        unknown sector (None), so the job fails rather than doing nothing.
+        """
+        cfg = await self._load_from_db(focus_group_id, strict=True)
+        return self._to_contract(cfg) if cfg else None
+
+    async def load_all_configs(self) -> List[SectorConfigContract]:
+        """All sectors straight from the database; database errors raise (see load_config)."""
+        return [self._to_contract(c) for c in await self._load_all_from_db(strict=True)]
+
+    async def reload_all_configs(self) -> List[SectorConfigContract]:
+        """Drop the cached configurations and load every sector into the cache again.
 
-        cfgs = await self._load_all_from_db()
-        cache.set(cache_key, [self._config_to_dict(c) for c in cfgs], self.CACHE_TTL)
-        return [self._to_contract(c) for c in cfgs]
+        Database errors raise, leaving the cache empty so callers fall back
+        to loading on demand.
+        """
+        self.invalidate_cache()
+        return list(await self._load_all_and_cache(strict=True))
+
+    async def get_history(self) -> SectorConfigHistory:
+        """The effective-dated history index, loaded once and dropped on invalidation."""
+        if self._history is not None:
+            return self._history
+        generation = self._generation
+        history = await self._flight.do("sectors:history", SectorConfigHistory.load)
+        if generation == self._generation:
+            self._history = history
+        return history
+
+    def configure_ttl(self, hard: int, soft: int) -> None:
+        """Override the cache TTLs (e.g. much longer once push invalidation is on)."""
+        self.CACHE_TTL = hard
+        self.CACHE_SOFT_TTL = soft
+
+    def load_stats(self) -> Dict[str, int]:
+        """DB loads vs. callers coalesced onto an in-flight load."""
+        return self._flight.stats()
+
+    def _refresh_in_background(self, cache_key: str, loader) -> None:
+        """Reload a stale key without blocking the caller (at most one refresh per key)."""
+        if not self._flight.in_flight(cache_key):
+            logger.debug("sector_cache_refresh_scheduled", cache_key=cache_key)
+            self._flight.start(cache_key, loader)
+
+    async def _load_and_cache(self, focus_group_id: str) -> Optional[SectorConfigContract]:
+        generation = self._generation
+        with _tracer.start_as_current_span("sector_config.load", attributes={"focus_group_id": focus_group_id}) as span:
+            cfg = await self._load_from_db(focus_group_id)
+            span.set_attribute("found", cfg is not None)
+        if not cfg:
+            return None
+        contract = self._to_contract(cfg)
+        if generation != self._generation:
+            return contract
+        await cache.aset(
+            self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id),
+            contract,
+            jittered(self.CACHE_TTL),
+            jittered(self.CACHE_SOFT_TTL),
+        )
+        return contract
+
+    async def _load_all_and_cache(self, strict: bool = False) -> List[SectorConfigContract]:
+        generation = self._generation
+        with _tracer.start_as_current_span("sector_config.load_all") as span:
+            contracts = [self._to_contract(c) for c in await self._load_all_from_db(strict)]
+            span.set_attribute("sectors", len(contracts))
+        if generation != self._generation:
+            return contracts
+        await cache.aset(
+            self.CACHE_KEY_ALL,
+            contracts,
+            jittered(self.CACHE_TTL),
+            jittered(self.CACHE_SOFT_TTL),
+        )
+        # Per-sector keys come for free with the bulk load
+        for contract in contracts:
+            await cache.aset(
+                self.CACHE_KEY_SECTOR.format(focus_group_id=contract.sector_id),
+                contract,
+                jittered(self.CACHE_TTL),
+                jittered(self.CACHE_SOFT_TTL),
+            )
+        return contracts
 
-    async def _load_from_db(self, focus_group_id: str) -> Optional[SectorConfig]:
+    async def _load_from_db(self, focus_group_id: str, strict: bool = False) -> Optional[SectorConfig]:
         """Load a single configuration from database.
 
         Behavior:
         - Unknown focus_group_id => return None
-        - DB/infra issues => log + return None (keeps negative tests deterministic)
+        - DB/infra issues => log + return None (keeps negative tests deterministic),
+          or log + raise with `strict`
         """
         try:
-            # 1) Base focus group
-            fg_query = """
-                SELECT focus_group_id, group_name, group_code
-                FROM focus_groups
-                WHERE focus_group_id = %(focus_group_id)s
-                  AND platform = 'pe_org_air'
-                  AND is_active = TRUE
+            # Focus group + current weights + current calibrations in one round
+            # trip. Values are aggregated as text so Decimal precision survives
+            # the JSON hop; unknown focus_group_id yields no row.
+            query = """
+                SELECT fg.focus_group_id, fg.group_name, fg.group_code,
+                       COALESCE((
+                           SELECT json_object_agg(d.dimension_code, w.weight::text
+                                                  ORDER BY d.display_order)
+                           FROM focus_group_dimension_weights w
+                           JOIN dimensions d ON w.dimension_id = d.dimension_id
+                           WHERE w.focus_group_id = fg.focus_group_id
+                             AND w.is_current = TRUE
+                       ), '{}'::json) AS dimension_weights,
+                       COALESCE((
+                           SELECT json_object_agg(c.parameter_name, c.parameter_value::text)
+                           FROM focus_group_calibrations c
+                           WHERE c.focus_group_id = fg.focus_group_id
+                             AND c.is_current = TRUE
+                       ), '{}'::json) AS calibrations
+                FROM focus_groups fg
+                WHERE fg.focus_group_id = %(focus_group_id)s
+                  AND fg.platform = 'pe_org_air'
+                  AND fg.is_active = TRUE
             """
-            fg_row = db.fetch_one(fg_query, {"focus_group_id": focus_group_id})
+            fg_row = await adb.fetch_one(query, {"focus_group_id": focus_group_id}, name="sector_config")
             if not fg_row:
                 return None
 
-            # 2) Dimension weights
-            weights_query = """
-                SELECT d.dimension_code, w.weight
-                FROM focus_group_dimension_weights w
-                JOIN dimensions d ON w.dimension_id = d.dimension_id
-                WHERE w.focus_group_id = %(focus_group_id)s
-                  AND w.is_current = TRUE
-                ORDER BY d.display_order
-            """
-            weights_rows = db.fetch_all(weights_query, {"focus_group_id": focus_group_id})
             dimension_weights = {
-                row["dimension_code"]: Decimal(str(row["weight"]))
-                for row in weights_rows
+                code: Decimal(value) for code, value in fg_row["dimension_weights"].items()
             }
-
-            # 3) Calibrations
-            calib_query = """
-                SELECT parameter_name, parameter_value
-                FROM focus_group_calibrations
-                WHERE focus_group_id = %(focus_group_id)s
-                  AND is_current = TRUE
-            """
-            calib_rows = db.fetch_all(calib_query, {"focus_group_id": focus_group_id})
             calibrations = {
-                row["parameter_name"]: Decimal(str(row["parameter_value"]))
-                for row in calib_rows
+                name: Decimal(value) for name, value in fg_row["calibrations"].items()
             }
 
         except RuntimeError as e:
@@ -139,6 +272,8 @@ class SectorConfigService:
                 focus_group_id=focus_group_id,
                 error=str(e),
             )
+            if strict:
+                raise
             return None
         except Exception as e:
             logger.exception(
@@ -146,6 +281,8 @@ class SectorConfigService:
                 focus_group_id=focus_group_id,
                 error=str(e),
             )
+            if strict:
+                raise
             return None
 
         cfg = SectorConfig(
@@ -155,40 +292,86 @@ class SectorConfigService:
             dimension_weights=dimension_weights,
             calibrations=calibrations,
         )
-
-        if not cfg.validate_weights_sum():
-            logger.warning("invalid_weights_sum", focus_group_id=focus_group_id)
-
-        # Deterministic contract validation (case study requirement)
-        self._validate_contract(cfg)
-
+        self._check_config(cfg)
         return cfg
 
-    async def _load_all_from_db(self) -> List[SectorConfig]:
-        """Load all sector configurations from database."""
+    async def _load_all_from_db(self, strict: bool = False) -> List[SectorConfig]:
+        """Load all sector configurations from database.
+
+        Two set-based queries regardless of how many focus groups exist:
+        focus groups joined with their current weights, then all current
+        calibrations. Configs are assembled in memory. DB errors yield []
+        unless `strict`, which re-raises them.
+        """
         try:
-            fg_query = """
-                SELECT focus_group_id
-                FROM focus_groups
-                WHERE platform = 'pe_org_air'
-                  AND is_active = TRUE
-                ORDER BY display_order
+            # 1) Focus groups + current weights (LEFT JOIN keeps groups with no weights)
+            fg_weights_query = """
+                SELECT fg.focus_group_id, fg.group_name, fg.group_code,
+                       d.dimension_code, w.weight
+                FROM focus_groups fg
+                LEFT JOIN focus_group_dimension_weights w
+                  ON w.focus_group_id = fg.focus_group_id
+                 AND w.is_current = TRUE
+                LEFT JOIN dimensions d ON w.dimension_id = d.dimension_id
+                WHERE fg.platform = 'pe_org_air'
+                  AND fg.is_active = TRUE
+                ORDER BY fg.display_order, d.display_order
             """
-            fg_rows = db.fetch_all(fg_query)
+            fg_weight_rows = await adb.fetch_all(fg_weights_query, name="sector_configs_weights")
+
+            # 2) Current calibrations for the same focus groups
+            calib_query = """
+                SELECT c.focus_group_id, c.parameter_name, c.parameter_value
+                FROM focus_group_calibrations c
+                JOIN focus_groups fg ON fg.focus_group_id = c.focus_group_id
+                WHERE fg.platform = 'pe_org_air'
+                  AND fg.is_active = TRUE
+                  AND c.is_current = TRUE
+            """
+            calib_rows = await adb.fetch_all(calib_query, name="sector_configs_calibrations")
         except RuntimeError as e:
             logger.warning("sector_configs_db_unavailable", error=str(e))
+            if strict:
+                raise
             return []
         except Exception as e:
             logger.exception("sector_configs_db_error", error=str(e))
+            if strict:
+                raise
             return []
 
-        cfgs: List[SectorConfig] = []
-        for row in fg_rows:
-            cfg = await self._load_from_db(row["focus_group_id"])
-            if cfg:
-                cfgs.append(cfg)
+        # dicts preserve insertion order, so display_order is kept
+        by_id: Dict[str, SectorConfig] = {}
+        for row in fg_weight_rows:
+            fg_id = row["focus_group_id"]
+            cfg = by_id.get(fg_id)
+            if cfg is None:
+                cfg = by_id[fg_id] = SectorConfig(
+                    focus_group_id=fg_id,
+                    group_name=row["group_name"],
+                    group_code=row["group_code"],
+                )
+            if row["dimension_code"] is not None:
+                cfg.dimension_weights[row["dimension_code"]] = Decimal(str(row["weight"]))
+
+        for row in calib_rows:
+            cfg = by_id.get(row["focus_group_id"])
+            if cfg is not None:
+                cfg.calibrations[row["parameter_name"]] = Decimal(str(row["parameter_value"]))
+
+        cfgs = list(by_id.values())
+        for cfg in cfgs:
+            self._check_config(cfg)
         return cfgs
 
+    def _check_config(self, cfg: SectorConfig) -> None:
+        """Warn on bad weight sums and enforce the contract (raises ValidationError)."""
+        if not cfg.validate_weights_sum():
+            logger.warning("invalid_weights_sum", focus_group_id=cfg.focus_group_id)
+
+        # Deterministic contract validation (case study requirement)
+        self._validate_contract(cfg)
+
     def _validate_contract(self, cfg: SectorConfig) -> None:
         payload = {
             "sector_id": cfg.focus_group_id,
@@ -218,32 +401,35 @@ class SectorConfigService:
         }
         return SectorConfigContract.model_validate(payload)
 
-    def _config_to_dict(self, cfg: SectorConfig) -> dict:
-        """Convert config to dict for caching."""
-        return {
-            "focus_group_id": cfg.focus_group_id,
-            "group_name": cfg.group_name,
-            "group_code": cfg.group_code,
-            "dimension_weights": {k: str(v) for k, v in cfg.dimension_weights.items()},
-            "calibrations": {k: str(v) for k, v in cfg.calibrations.items()},
-        }
-
-    def _dict_to_config(self, data: dict) -> SectorConfig:
-        """Convert cached dict to internal config."""
-        return SectorConfig(
-            focus_group_id=data["focus_group_id"],
-            group_name=data["group_name"],
-            group_code=data["group_code"],
-            dimension_weights={k: Decimal(v) for k, v in data["dimension_weights"].items()},
-            calibrations={k: Decimal(v) for k, v in data["calibrations"].items()},
-        )
-
     def invalidate_cache(self, focus_group_id: Optional[str] = None) -> None:
-        """Invalidate cached configurations."""
+        """Invalidate cached configurations (one sector, or every sector if None).
+
+        Loads already in flight are detached and will not write back, so a
+        read that raced with the change cannot restore the old config.
+        """
+        self._generation += 1
+        self._flight.forget()
         if focus_group_id:
-            cache.delete(self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id))
-        cache.invalidate_pattern("sectors:*")
+            off_loop(cache.delete, self.CACHE_KEY_SECTOR.format(focus_group_id=focus_group_id))
+        else:
+            off_loop(cache.invalidate_pattern, self.CACHE_KEY_SECTOR.format(focus_group_id="*"))
+        off_loop(cache.invalidate_pattern, "sectors:*")
+        self._history = None
         logger.info("sector_cache_invalidated", focus_group_id=focus_group_id)
+        for listener in self._listeners:
+            try:
+                listener(focus_group_id)
+            except Exception as e:
+                logger.exception("sector_invalidation_listener_failed", focus_group_id=focus_group_id, error=str(e))
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Call `listener(focus_group_id)` after every invalidate_cache (None = all sectors)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_invalidation_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
 
 # Singleton instance
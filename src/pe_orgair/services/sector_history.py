@@ -0,0 +1,143 @@
+# src/pe_orgair/services/sector_history.py
+"""Effective-dated sector configuration history with point-in-time lookups."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import structlog
+from pydantic import ValidationError
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.schemas.sector_config import SectorConfigContract
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _Timeline:
+    """Config snapshots for one sector, one per interval between change dates."""
+    starts: List[date] = field(default_factory=list)
+    configs: List[Optional[SectorConfigContract]] = field(default_factory=list)
+
+    def at(self, as_of: date) -> Optional[SectorConfigContract]:
+        i = bisect_right(self.starts, as_of) - 1
+        return self.configs[i] if i >= 0 else None
+
+
+def _active(rows: List[dict], day: date) -> List[dict]:
+    # effective_to is exclusive: a row replaced on D stops applying on D
+    return [
+        r for r in rows
+        if r["effective_from"] <= day and (r["effective_to"] is None or day < r["effective_to"])
+    ]
+
+
+class SectorConfigHistory:
+    """In-memory interval index of every weight and calibration version.
+
+    Loaded in bulk (one query per table) and answered by binary search, so a
+    backtest can ask for thousands of dates without touching the database.
+    Dates where the effective rows do not form a valid contract (e.g. weights
+    mid-migration) resolve to None.
+    """
+
+    def __init__(self) -> None:
+        self._timelines: Dict[str, _Timeline] = {}
+
+    @classmethod
+    async def load(cls) -> "SectorConfigHistory":
+        groups = await adb.fetch_all(
+            """
+            SELECT focus_group_id, group_name, group_code
+            FROM focus_groups
+            WHERE platform = 'pe_org_air'
+              AND is_active = TRUE
+            """,
+            name="history_focus_groups",
+        )
+        weight_rows = await adb.fetch_all(
+            """
+            SELECT w.focus_group_id, d.dimension_code, w.weight::text AS value,
+                   w.effective_from, w.effective_to
+            FROM focus_group_dimension_weights w
+            JOIN dimensions d ON w.dimension_id = d.dimension_id
+            JOIN focus_groups fg ON fg.focus_group_id = w.focus_group_id
+            WHERE fg.platform = 'pe_org_air'
+              AND fg.is_active = TRUE
+            ORDER BY w.focus_group_id, d.display_order
+            """,
+            name="history_weights",
+        )
+        calib_rows = await adb.fetch_all(
+            """
+            SELECT c.focus_group_id, c.parameter_name, c.parameter_value::text AS value,
+                   c.effective_from, c.effective_to
+            FROM focus_group_calibrations c
+            JOIN focus_groups fg ON fg.focus_group_id = c.focus_group_id
+            WHERE fg.platform = 'pe_org_air'
+              AND fg.is_active = TRUE
+            """,
+            name="history_calibrations",
+        )
+
+        history = cls()
+        weights_by_fg: Dict[str, List[dict]] = defaultdict(list)
+        for row in weight_rows:
+            weights_by_fg[row["focus_group_id"]].append(row)
+        calibs_by_fg: Dict[str, List[dict]] = defaultdict(list)
+        for row in calib_rows:
+            calibs_by_fg[row["focus_group_id"]].append(row)
+
+        for fg in groups:
+            fg_id = fg["focus_group_id"]
+            history._timelines[fg_id] = cls._build_timeline(
+                fg, weights_by_fg.get(fg_id, []), calibs_by_fg.get(fg_id, [])
+            )
+        logger.info(
+            "sector_history_loaded",
+            sectors=len(history._timelines),
+            weight_versions=len(weight_rows),
+            calibration_versions=len(calib_rows),
+        )
+        return history
+
+    @staticmethod
+    def _build_timeline(fg: dict, weight_rows: List[dict], calib_rows: List[dict]) -> _Timeline:
+        change_dates = sorted(
+            {r["effective_from"] for r in weight_rows + calib_rows}
+            | {r["effective_to"] for r in weight_rows + calib_rows if r["effective_to"] is not None}
+        )
+        timeline = _Timeline()
+        for day in change_dates:
+            payload = {
+                "sector_id": fg["focus_group_id"],
+                "sector_name": fg["group_name"],
+                "sector_code": fg["group_code"],
+                "dimension_weights": {r["dimension_code"]: Decimal(r["value"]) for r in _active(weight_rows, day)},
+                "calibrations": {r["parameter_name"]: Decimal(r["value"]) for r in _active(calib_rows, day)},
+            }
+            try:
+                cfg: Optional[SectorConfigContract] = SectorConfigContract.model_validate(payload)
+            except ValidationError:
+                cfg = None
+            # Consecutive identical snapshots collapse into one interval
+            if timeline.configs and timeline.configs[-1] == cfg:
+                continue
+            timeline.starts.append(day)
+            timeline.configs.append(cfg)
+        return timeline
+
+    def get_config(self, focus_group_id: str, as_of: date) -> Optional[SectorConfigContract]:
+        """The configuration in effect on `as_of` (None if unknown or not valid then)."""
+        timeline = self._timelines.get(focus_group_id)
+        return timeline.at(as_of) if timeline is not None else None
+
+    def change_dates(self, focus_group_id: str) -> List[date]:
+        """Dates on which the sector's effective configuration changed."""
+        timeline = self._timelines.get(focus_group_id)
+        return list(timeline.starts) if timeline is not None else []
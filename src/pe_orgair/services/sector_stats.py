@@ -0,0 +1,208 @@
+# src/pe_orgair/services/sector_stats.py
+"""Precomputed sector aggregates, refreshed per sector when organizations change."""
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional, Set
+
+import structlog
+
+from pe_orgair.db.snowflake import adb
+from pe_orgair.infrastructure.cache import SimpleCache
+from pe_orgair.infrastructure.singleflight import SingleFlight
+from pe_orgair.schemas.sector_stats import EmployeeDistribution, RevenueSummary, SectorStats
+
+logger = structlog.get_logger()
+
+# Cached in place of stats for ids with no focus_groups row
+_UNKNOWN = object()
+
+# Taking the marker row also serializes concurrent refreshes of a sector: a
+# second DELETE waits for the first transaction and then finds nothing.
+_CLAIM_DIRTY = """
+    DELETE FROM sector_stats_dirty
+    WHERE focus_group_id = %(focus_group_id)s
+    RETURNING focus_group_id
+"""
+
+
+class SectorStatsService:
+    """Serves rows of the `sector_stats` summary table from an in-process cache.
+
+    The aggregation runs in the database (`refresh_sector_stats`, migration
+    010) one sector at a time, never per request. Triggers mark changed
+    sectors in `sector_stats_dirty`; `refresh_dirty()` (run periodically by
+    `start()`, and on demand via `mark_dirty()` when push notifications are
+    on) rebuilds only those sectors. A rebuild first claims the sector's
+    dirty marker, so when every worker hears about the same change only one
+    runs the aggregation and the others just re-read the summary row. Each
+    refresh replaces the sector's entry in this process's cache; other
+    instances pick it up when CACHE_TTL lapses.
+    """
+
+    CACHE_TTL = 60
+
+    def __init__(self) -> None:
+        # Always in-process: these are small, read on every dashboard view,
+        # and cheap to reload from the summary table.
+        self._cache = SimpleCache(max_entries=256)
+        self._flight = SingleFlight("sector_stats")
+        self._running: Dict[str, asyncio.Task] = {}
+        self._dirty: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def get_stats(self, focus_group_id: str) -> Optional[SectorStats]:
+        """Aggregates for one sector (None if the sector does not exist)."""
+        stats = self._cache.get(focus_group_id)
+        if stats is _UNKNOWN:
+            return None
+        if stats is not None:
+            return stats
+        return await self._flight.do(focus_group_id, lambda: self._load(focus_group_id))
+
+    async def refresh_sector(self, focus_group_id: str) -> Optional[SectorStats]:
+        """Rebuild one sector's summary row if it is still marked dirty, and cache the row."""
+        params = {"focus_group_id": focus_group_id}
+        async with adb.transaction(name="refresh_sector_stats") as conn:
+            cur = await conn.execute(_CLAIM_DIRTY, params)
+            claimed = await cur.fetchone() is not None
+            if claimed:
+                await conn.execute("SELECT refresh_sector_stats(%(focus_group_id)s)", params)
+        self._cache.delete(focus_group_id)
+        stats = await self._load(focus_group_id, build_missing=False)
+        if claimed and stats is not None:
+            logger.info("sector_stats_refreshed", focus_group_id=focus_group_id, active=stats.organization_counts["active"])
+        return stats
+
+    async def refresh_dirty(self) -> List[str]:
+        """Rebuild every sector marked dirty by the triggers; returns the sectors refreshed."""
+        rows = await adb.fetch_all(
+            "SELECT focus_group_id FROM sector_stats_dirty ORDER BY marked_at",
+            name="sector_stats_dirty",
+        )
+        refreshed = []
+        for row in rows:
+            await self.refresh_sector(row["focus_group_id"])
+            refreshed.append(row["focus_group_id"])
+        return refreshed
+
+    def mark_dirty(self, focus_group_id: Optional[str]) -> None:
+        """Schedule a refresh (coalesced per sector); None drains the dirty table."""
+        key = focus_group_id or ""
+        if key in self._running:
+            self._dirty.add(key)
+            return
+        self._running[key] = asyncio.ensure_future(self._run(key))
+
+    def start(self, interval: float = 60.0) -> None:
+        """Drain the dirty table every `interval` seconds (covers missed notifications)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._periodic(interval))
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._task, *self._running.values()) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._running.clear()
+
+    async def _periodic(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_dirty()
+            except Exception as e:
+                logger.exception("sector_stats_refresh_failed", error=str(e))
+
+    async def _run(self, key: str) -> None:
+        try:
+            while True:
+                self._dirty.discard(key)
+                try:
+                    if key:
+                        await self.refresh_sector(key)
+                    else:
+                        await self.refresh_dirty()
+                except Exception as e:
+                    logger.exception("sector_stats_refresh_failed", focus_group_id=key or None, error=str(e))
+                if key not in self._dirty:
+                    break
+        finally:
+            self._running.pop(key, None)
+
+    async def _load(self, focus_group_id: str, build_missing: bool = True) -> Optional[SectorStats]:
+        row = await adb.fetch_one(
+            """
+            SELECT focus_group_id, active_count, inactive_count, archived_count,
+                   revenue_reported_count, revenue_total_usd::float8 AS revenue_total_usd,
+                   revenue_avg_usd::float8 AS revenue_avg_usd,
+                   revenue_median_usd::float8 AS revenue_median_usd,
+                   employee_reported_count, employee_total, employee_min,
+                   employee_p25::float8 AS employee_p25, employee_median::float8 AS employee_median,
+                   employee_p75::float8 AS employee_p75, employee_p90::float8 AS employee_p90,
+                   employee_max, employee_buckets, scored_count, dimension_score_avgs, refreshed_at
+            FROM sector_stats
+            WHERE focus_group_id = %(focus_group_id)s
+            """,
+            {"focus_group_id": focus_group_id},
+            name="sector_stats",
+        )
+        if row is None:
+            return await self._build_missing(focus_group_id) if build_missing else None
+        stats = self._to_stats(row)
+        self._cache.set(focus_group_id, stats, self.CACHE_TTL)
+        return stats
+
+    async def _build_missing(self, focus_group_id: str) -> Optional[SectorStats]:
+        # A sector added after the migration has no row until its first build.
+        # Only ids in focus_groups are built; others are remembered as unknown
+        # for CACHE_TTL so probing random ids never writes to the database.
+        built = await adb.fetch_one(
+            "SELECT refresh_sector_stats(focus_group_id) FROM focus_groups WHERE focus_group_id = %(focus_group_id)s",
+            {"focus_group_id": focus_group_id},
+            name="build_sector_stats",
+        )
+        if built is None:
+            self._cache.set(focus_group_id, _UNKNOWN, self.CACHE_TTL)
+            return None
+        return await self._load(focus_group_id, build_missing=False)
+
+    @staticmethod
+    def _to_stats(row: dict) -> SectorStats:
+        return SectorStats(
+            focus_group_id=row["focus_group_id"],
+            organization_counts={
+                "active": row["active_count"],
+                "inactive": row["inactive_count"],
+                "archived": row["archived_count"],
+            },
+            revenue=RevenueSummary(
+                reported=row["revenue_reported_count"],
+                total_usd=row["revenue_total_usd"],
+                avg_usd=row["revenue_avg_usd"],
+                median_usd=row["revenue_median_usd"],
+            ),
+            employees=EmployeeDistribution(
+                reported=row["employee_reported_count"],
+                total=row["employee_total"],
+                min=row["employee_min"],
+                p25=row["employee_p25"],
+                median=row["employee_median"],
+                p75=row["employee_p75"],
+                p90=row["employee_p90"],
+                max=row["employee_max"],
+                buckets=row["employee_buckets"],
+            ),
+            scored_organizations=row["scored_count"],
+            dimension_score_averages={k: float(v) for k, v in row["dimension_score_avgs"].items()},
+            refreshed_at=row["refreshed_at"],
+        )
+
+
+# Singleton instance
+sector_stats_service = SectorStatsService()
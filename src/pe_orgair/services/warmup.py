@@ -0,0 +1,77 @@
+# src/pe_orgair/services/warmup.py
+"""Startup cache warming, so the first requests after a deploy don't all miss."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+import structlog
+
+from pe_orgair.services.sector_config import sector_service
+
+logger = structlog.get_logger()
+
+
+class CacheWarmer:
+    """Bulk-loads every active sector config into the cache and tracks readiness.
+
+    `warm()` retries with capped exponential backoff until a load returns at
+    least one sector, so an instance started before its DB is reachable
+    becomes ready as soon as the DB is.
+    """
+
+    def __init__(self, max_backoff: float = 30.0) -> None:
+        self._max_backoff = max_backoff
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.sectors_loaded = 0
+        self.attempts = 0
+        self.duration_s: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def status(self) -> Dict[str, object]:
+        return {
+            "status": "ready" if self.is_ready else "warming",
+            "sectors_loaded": self.sectors_loaded,
+            "attempts": self.attempts,
+            "warmup_seconds": self.duration_s,
+        }
+
+    async def warm(self) -> None:
+        start = time.perf_counter()
+        backoff = 0.5
+        while True:
+            self.attempts += 1
+            cfgs = await sector_service.get_all_configs()
+            if cfgs:
+                break
+            logger.warning("cache_warmup_retry", attempt=self.attempts, retry_in_s=backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self._max_backoff)
+
+        self.sectors_loaded = len(cfgs)
+        self.duration_s = round(time.perf_counter() - start, 3)
+        self._ready.set()
+        logger.info("cache_warmup_complete", sectors=self.sectors_loaded, duration_s=self.duration_s)
+
+    def start(self) -> None:
+        """Warm in the background; readiness flips once it completes."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.warm())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# Singleton instance
+cache_warmer = CacheWarmer()
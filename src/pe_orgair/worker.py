@@ -0,0 +1,41 @@
+# src/pe_orgair/worker.py
+"""Celery worker for background jobs (JOBS_BACKEND=celery).
+
+    celery -A pe_orgair.worker worker --concurrency 4 --loglevel INFO
+
+Each task runs one job from `pe_orgair.services.jobs` on its own event loop
+and writes status to the Redis job store, where the API reads it.
+"""
+import asyncio
+from typing import Any, Dict
+
+from celery import Celery
+
+from pe_orgair.config.settings import settings
+from pe_orgair.observability.setup import setup_logging
+from pe_orgair.services.jobs import execute_job, job_store
+
+setup_logging()
+
+celery_app = Celery(
+    "pe_orgair",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+)
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    # Ack after the job ran, so a worker crash re-delivers it; every job is
+    # an idempotent upsert or reload, so running one twice is safe
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Jobs run for minutes: do not reserve more than one per worker process
+    worker_prefetch_multiplier=1,
+    # Status and results live in the job store, not the Celery backend
+    task_ignore_result=True,
+)
+
+
+@celery_app.task(name="pe_orgair.run_job")
+def run_job(job_id: str, kind: str, params: Dict[str, Any]) -> None:
+    asyncio.run(execute_job(job_id, kind, params, job_store.update))
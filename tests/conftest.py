@@ -0,0 +1,14 @@
+import os
+
+# Settings refuses to load without these; tests never reach the real services
+for _name, _value in {
+    "SECRET_KEY": "test-secret-key-that-is-at-least-32-characters",
+    "SNOWFLAKE_ACCOUNT": "test",
+    "SNOWFLAKE_USER": "test",
+    "SNOWFLAKE_PASSWORD": "test",
+    "SNOWFLAKE_WAREHOUSE": "test",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "S3_BUCKET": "test",
+}.items():
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,140 @@
+import pytest
+
+from pe_orgair.infrastructure.cache import EvictionPolicy, LFUPolicy, LRUPolicy, SimpleCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = SimpleCache(max_entries=3, policy="lru")
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    cache.get("a")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in ("a", "c", "d")] == ["a", "c", "d"]
+    assert len(cache) == 3
+    assert cache.evictions == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = SimpleCache(max_entries=3, policy="lfu")
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("c")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("c") == "c"
+
+
+def test_lfu_insert_evicts_an_older_key_when_others_were_read():
+    cache = SimpleCache(max_entries=3, policy="lfu")
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+        cache.get(key)
+    cache.get("a")
+
+    for key in ("d", "e"):
+        cache.set(key, key)
+        assert len(cache) == 3
+        assert cache.get(key) == key
+    assert cache.get("a") == "a"
+
+
+def test_lfu_byte_bound_holds_after_reads():
+    cache = SimpleCache(max_bytes=3000, policy="lfu")
+    cache.set("a", "x" * 1000)
+    cache.set("b", "y" * 1000)
+    cache.get("a")
+    cache.get("b")
+    cache.set("big", "z" * 2000)
+
+    assert cache.size_bytes <= 3000
+    assert cache.get("big") == "z" * 2000
+    assert cache.evictions >= 1
+
+
+def test_lfu_victim_skips_excluded_key():
+    policy = LFUPolicy()
+    policy.add("a")
+    policy.touch("a")
+    policy.add("b")
+
+    assert policy.victim() == "b"
+    assert policy.victim(exclude="b") == "a"
+    policy.remove("a")
+    assert policy.victim(exclude="b") is None
+
+
+def test_lfu_breaks_ties_by_recency():
+    policy = LFUPolicy()
+    for key in ("a", "b", "c"):
+        policy.add(key)
+    policy.touch("a")
+    policy.touch("b")
+
+    assert policy.victim() == "c"
+    policy.remove("c")
+    assert policy.victim() == "a"
+
+
+def test_lru_policy_tracks_removals():
+    policy = LRUPolicy()
+    policy.add("a")
+    policy.add("b")
+    policy.remove("a")
+
+    assert policy.victim() == "b"
+    assert policy.victim(exclude="b") is None
+    policy.remove("b")
+    assert policy.victim() is None
+
+
+def test_max_bytes_bounds_total_size():
+    value = "x" * 1000
+    cache = SimpleCache(max_bytes=3500)
+    for i in range(10):
+        cache.set(f"k{i}", value)
+
+    assert cache.size_bytes <= 3500
+    assert len(cache) == 3
+    assert [cache.get(f"k{i}") for i in range(7, 10)] == [value] * 3
+
+
+def test_overwrite_replaces_size_instead_of_adding():
+    cache = SimpleCache(max_bytes=10_000)
+    cache.set("k", "x" * 1000)
+    first = cache.size_bytes
+    cache.set("k", "x" * 1000)
+
+    assert cache.size_bytes == first
+
+
+def test_value_larger_than_max_bytes_is_not_cached():
+    cache = SimpleCache(max_bytes=500)
+    cache.set("small", "s")
+    cache.set("big", "x" * 1000)
+
+    assert cache.get("big") is None
+    assert cache.get("small") == "s"
+
+
+def test_unbounded_cache_never_evicts():
+    cache = SimpleCache()
+    for i in range(1000):
+        cache.set(f"k{i}", i)
+
+    assert len(cache) == 1000
+    assert cache.evictions == 0
+
+
+def test_custom_policy_must_implement_every_method():
+    class Incomplete(EvictionPolicy):
+        def add(self, key):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,73 @@
+import pytest
+
+from pe_orgair.infrastructure.cache import RedisCache, SimpleCache, _PrefixIndex
+
+
+def _keys(cache, keys):
+    return {k for k in keys if cache.get(k) is not None}
+
+
+KEYS = ["sector:pe_a", "sector:pe_b", "sectors:all", "orgs:pe_a", "score:pe_a:2024-01", "score:pe_b:2024-02"]
+
+
+@pytest.fixture
+def cache():
+    c = SimpleCache()
+    for key in KEYS:
+        c.set(key, key)
+    return c
+
+
+def test_prefix_pattern_removes_only_matching_keys(cache):
+    cache.invalidate_pattern("sector:*")
+
+    assert _keys(cache, KEYS) == {"sectors:all", "orgs:pe_a", "score:pe_a:2024-01", "score:pe_b:2024-02"}
+
+
+def test_partial_segment_prefix_matches_across_segments(cache):
+    cache.invalidate_pattern("sector*")
+
+    assert _keys(cache, KEYS) == {"orgs:pe_a", "score:pe_a:2024-01", "score:pe_b:2024-02"}
+
+
+def test_wildcards_after_the_prefix_are_honoured(cache):
+    cache.invalidate_pattern("score:pe_?:2024-02")
+
+    assert _keys(cache, KEYS) == set(KEYS) - {"score:pe_b:2024-02"}
+
+
+def test_literal_pattern_removes_exactly_that_key(cache):
+    cache.invalidate_pattern("sector:pe_a")
+
+    assert _keys(cache, KEYS) == set(KEYS) - {"sector:pe_a"}
+
+
+def test_invalidated_keys_can_be_set_again(cache):
+    cache.invalidate_pattern("sector:*")
+    cache.set("sector:pe_a", "new")
+    cache.invalidate_pattern("orgs:*")
+
+    assert cache.get("sector:pe_a") == "new"
+
+
+def test_prefix_index_prunes_empty_branches():
+    index = _PrefixIndex()
+    index.add("a:b:c")
+    index.add("a:b")
+    index.remove("a:b:c")
+
+    assert list(index.with_prefix("a:")) == ["a:b"]
+    index.remove("a:b")
+    assert index._root.children == {}
+
+
+def test_redis_pattern_invalidation_matches_memory():
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = RedisCache("redis://localhost:6379/0", key_prefix="test:")
+    cache._client = fakeredis.FakeRedis()
+    for key in KEYS:
+        cache.set(key, key)
+
+    cache.invalidate_pattern("score:pe_a:*")
+
+    assert _keys(cache, KEYS) == set(KEYS) - {"score:pe_a:2024-01"}
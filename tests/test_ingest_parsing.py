@@ -0,0 +1,129 @@
+import asyncio
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from pe_orgair.schemas.organization import OrganizationIngestRow
+from pe_orgair.services import ingest
+from pe_orgair.services.ingest import iter_lines, parse_csv, parse_ndjson
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def _parse(parser, text: str, chunk_size: int = 7):
+    async def run():
+        return [row async for row in parser(iter_lines(_chunks(text.encode("utf-8"), chunk_size)))]
+
+    return asyncio.run(run())
+
+
+def test_iter_lines_reassembles_lines_split_across_chunks():
+    async def run():
+        data = "﻿name\r\nAcme Corp\nÜber GmbH".encode("utf-8")
+        return [line async for line in iter_lines(_chunks(data, 3))]
+
+    assert asyncio.run(run()) == ["name", "Acme Corp", "Über GmbH"]
+
+
+def test_csv_rows_use_header_and_map_empty_cells_to_none():
+    rows = _parse(parse_csv, "legal_name,focus_group_id,status\nAcme,pe_manufacturing,\n")
+
+    assert rows == [(2, {"legal_name": "Acme", "focus_group_id": "pe_manufacturing", "status": None}, None)]
+
+
+def test_csv_quoted_field_may_span_lines():
+    rows = _parse(parse_csv, 'legal_name,website_url\n"Acme,\nInc",https://acme.test\nBeta,\n')
+
+    assert [(r.line, r.data["legal_name"]) for r in rows] == [(2, "Acme,\nInc"), (4, "Beta")]
+
+
+def test_csv_field_count_mismatch_is_reported_with_its_line():
+    rows = _parse(parse_csv, "a,b\n1,2\n1,2,3\n")
+
+    assert rows[1].line == 3
+    assert rows[1].data is None
+    assert "expected 2 fields, got 3" in rows[1].error
+
+
+def test_csv_stray_quote_in_unquoted_cell_is_literal():
+    text = 'legal_name,status\nAcme 5" Displays,active\nBeta,active\n"Gamma ""G"" Inc",active\n'
+
+    rows = _parse(parse_csv, text)
+
+    assert [(r.line, r.data["legal_name"], r.error) for r in rows] == [
+        (2, 'Acme 5" Displays', None),
+        (3, "Beta", None),
+        (4, 'Gamma "G" Inc', None),
+    ]
+
+
+def test_csv_unterminated_quote_at_eof_rejects_its_line_and_keeps_later_rows():
+    rows = _parse(parse_csv, 'a,b\n1,2\n"open,3\n4,5\n6,7\n')
+
+    assert rows[0] == (2, {"a": "1", "b": "2"}, None)
+    assert rows[1] == (3, None, "unterminated quoted field")
+    assert [(r.line, r.data) for r in rows[2:]] == [(4, {"a": "4", "b": "5"}), (5, {"a": "6", "b": "7"})]
+
+
+def test_csv_quoted_field_past_the_cap_fails(monkeypatch):
+    monkeypatch.setattr(ingest, "MAX_RECORD_CHARS", 50)
+    text = "a,b\n" + '"open,1\n' + "x,y\n" * 20
+
+    with pytest.raises(ValueError, match="line 2"):
+        _parse(parse_csv, text)
+
+
+def test_ndjson_parses_objects_and_reports_bad_lines():
+    text = '{"legal_name": "Acme"}\n\n[1, 2]\n{not json\n{"legal_name": "Beta"}'
+
+    rows = _parse(parse_ndjson, text)
+
+    assert [(r.line, r.data, r.error is not None) for r in rows] == [
+        (1, {"legal_name": "Acme"}, False),
+        (3, None, True),
+        (4, None, True),
+        (5, {"legal_name": "Beta"}, False),
+    ]
+    assert rows[1].error == "expected a JSON object"
+    assert rows[2].error.startswith("invalid JSON")
+
+
+def test_blank_core_cells_take_their_defaults():
+    row = OrganizationIngestRow.model_validate(
+        {"organization_id": None, "status": None, "legal_name": "Acme", "focus_group_id": "pe_manufacturing"}
+    )
+
+    assert isinstance(row.organization_id, UUID)
+    assert row.status == "active"
+
+
+def test_blank_required_cell_is_still_rejected():
+    with pytest.raises(ValidationError):
+        OrganizationIngestRow.model_validate({"legal_name": None, "focus_group_id": "pe_manufacturing"})
+
+
+def test_unknown_columns_become_sector_attributes():
+    row = OrganizationIngestRow.model_validate(
+        {
+            "legal_name": "Acme",
+            "focus_group_id": "pe_manufacturing",
+            "plant_count": "4",
+            "ot_systems": "SCADA | DCS",
+            "scada_vendor": None,
+        }
+    )
+
+    assert row.attributes["plant_count"] == 4
+    assert row.attributes["ot_systems"] == ["SCADA", "DCS"]
+    assert row.attributes["scada_vendor"] is None
+
+
+def test_column_unknown_to_the_sector_is_rejected():
+    with pytest.raises(ValidationError):
+        OrganizationIngestRow.model_validate(
+            {"legal_name": "Acme", "focus_group_id": "pe_manufacturing", "not_a_column": "x"}
+        )
@@ -0,0 +1,78 @@
+import base64
+import json
+
+import pytest
+
+from pe_orgair.services.organizations import OrganizationFilters, decode_cursor, encode_cursor
+
+FILTERS = OrganizationFilters(focus_group_ids=("pe_manufacturing",), min_revenue=1e6)
+ORG_ID = "3f0c9a52-8a1e-4f57-9a3b-6f4f1f7f2c11"
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize("name", ["Acme Corp", "Ünïcødé, \"quoted\" & co", ""])
+def test_round_trip(name):
+    cursor = encode_cursor(name, ORG_ID, FILTERS)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, FILTERS) == (name, ORG_ID)
+
+
+def test_cursor_is_bound_to_its_filters():
+    cursor = encode_cursor("Acme Corp", ORG_ID, FILTERS)
+
+    with pytest.raises(ValueError, match="different filters"):
+        decode_cursor(cursor, OrganizationFilters(focus_group_ids=("pe_healthcare",), min_revenue=1e6))
+    with pytest.raises(ValueError, match="different filters"):
+        decode_cursor(cursor, OrganizationFilters(focus_group_ids=("pe_manufacturing",)))
+
+
+def test_tampered_fingerprint_is_rejected():
+    name, org_id, _ = json.loads(base64.urlsafe_b64decode(encode_cursor("Acme", ORG_ID, FILTERS) + "=="))
+    forged = _b64(json.dumps([name, org_id, "000000000000"]))
+
+    with pytest.raises(ValueError, match="different filters"):
+        decode_cursor(forged, FILTERS)
+
+
+@pytest.mark.parametrize(
+    "legal_name, organization_id",
+    [("Acme", "not-a-uuid"), ("Acme", 12345), (["Acme"], ORG_ID), (None, ORG_ID), ("Acme", "'; DROP TABLE x; --")],
+)
+def test_cursor_with_valid_fingerprint_but_bad_fields_is_rejected(legal_name, organization_id):
+    forged = _b64(json.dumps([legal_name, organization_id, FILTERS.fingerprint()]))
+
+    with pytest.raises(ValueError, match="malformed cursor"):
+        decode_cursor(forged, FILTERS)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 !!",
+        _b64("not json"),
+        _b64('{"a": 1}'),
+        _b64("[1, 2]"),
+        _b64("42"),
+        base64.urlsafe_b64encode(b"\xff\xfe\x00").decode("ascii"),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, FILTERS)
+
+
+def test_fingerprint_depends_on_every_filter():
+    base = OrganizationFilters()
+    variants = [
+        OrganizationFilters(status="inactive"),
+        OrganizationFilters(headquarters_country="USA"),
+        OrganizationFilters(max_revenue=5.0),
+        OrganizationFilters(min_employees=10),
+        OrganizationFilters(max_employees=10),
+    ]
+
+    assert len({base.fingerprint(), *(v.fingerprint() for v in variants)}) == len(variants) + 1
@@ -0,0 +1,133 @@
+import math
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pe_orgair.schemas.sector_config import SectorConfigContract
+from pe_orgair.services.scoring import (
+    DIMENSION_CODES,
+    ScoreInputs,
+    ScoringParams,
+    config_fingerprint,
+    score_portfolio,
+)
+
+PARAMS = ScoringParams(alpha=0.6, beta=0.12, lam=0.25)
+
+
+def _config(sector_id, weights, **calibrations):
+    values = {
+        "ebitda_multiplier": "1.0",
+        "h_r_baseline": "75",
+        "position_factor_delta": "0.15",
+        "talent_concentration_threshold": "0.25",
+        **calibrations,
+    }
+    return SectorConfigContract(
+        sector_id=sector_id,
+        sector_name=sector_id,
+        sector_code=sector_id.upper(),
+        dimension_weights={code: Decimal(w) for code, w in zip(DIMENSION_CODES, weights)},
+        calibrations={k: Decimal(v) for k, v in values.items()},
+    )
+
+
+CONFIGS = {
+    "pe_mfg": _config("pe_mfg", ["0.25", "0.10", "0.20", "0.15", "0.10", "0.10", "0.10"]),
+    "pe_fin": _config(
+        "pe_fin",
+        ["0.10", "0.25", "0.15", "0.15", "0.15", "0.10", "0.10"],
+        h_r_baseline="82",
+        position_factor_delta="0.2",
+        talent_concentration_threshold="0.3",
+    ),
+}
+
+
+def _scalar(scores, cfg, position, talent, params):
+    """The formula from the scoring module docstring, one organization at a time."""
+    weights = [float(cfg.dimension_weights[code]) for code in DIMENSION_CODES]
+    cal = {k: float(v) for k, v in cfg.calibrations.items()}
+    weighted = sum(w * s for w, s in zip(weights, scores))
+    spread = math.sqrt(sum(w * (s - weighted) ** 2 for w, s in zip(weights, scores)))
+    cv = spread / weighted if weighted > 0 else 0.0
+    penalty = params.lam * cv + params.lam * max(0.0, talent - cal["talent_concentration_threshold"])
+    penalty = min(max(penalty, 0.0), 1.0)
+    v_r = min(max(weighted * (1 - penalty), 0.0), 100.0)
+    h_r = min(max(cal["h_r_baseline"] * (1 + cal["position_factor_delta"] * position), 0.0), 100.0)
+    synergy = math.sqrt(v_r * h_r)
+    org_air = (1 - params.beta) * (params.alpha * v_r + (1 - params.alpha) * h_r) + params.beta * synergy
+    return {"weighted": weighted, "penalty": penalty, "v_r": v_r, "h_r": h_r, "synergy": synergy, "org_air": org_air}
+
+
+def test_matches_scalar_formula_across_sectors():
+    rng = np.random.default_rng(7)
+    n = 200
+    sectors = np.array(["pe_mfg", "pe_fin"] * (n // 2), dtype=object)
+    scores = rng.uniform(0, 100, size=(n, len(DIMENSION_CODES)))
+    scores[0] = 0.0  # all-zero row: no dispersion penalty
+    position = rng.uniform(-1, 1, size=n)
+    talent = rng.uniform(0, 1, size=n)
+    inputs = ScoreInputs([f"org-{i}" for i in range(n)], sectors, scores, position, talent)
+
+    result = score_portfolio(inputs, CONFIGS, PARAMS)
+
+    for i in range(n):
+        expected = _scalar(scores[i], CONFIGS[sectors[i]], position[i], talent[i], PARAMS)
+        for field, value in expected.items():
+            assert getattr(result, field)[i] == pytest.approx(value, abs=1e-9), (i, field)
+
+
+def test_optional_inputs_default_to_neutral():
+    scores = np.full((1, len(DIMENSION_CODES)), 60.0)
+    inputs = ScoreInputs(["org"], np.array(["pe_mfg"], dtype=object), scores)
+
+    result = score_portfolio(inputs, CONFIGS, PARAMS)
+
+    expected = _scalar(scores[0], CONFIGS["pe_mfg"], 0.0, 0.0, PARAMS)
+    assert result.penalty[0] == 0.0
+    assert result.h_r[0] == pytest.approx(75.0)
+    assert result.org_air[0] == pytest.approx(expected["org_air"])
+
+
+def test_records_keep_input_order():
+    inputs = ScoreInputs(
+        ["b", "a"],
+        np.array(["pe_fin", "pe_mfg"], dtype=object),
+        np.full((2, len(DIMENSION_CODES)), 50.0),
+    )
+
+    records = score_portfolio(inputs, CONFIGS, PARAMS).to_records()
+
+    assert [(r["organization_id"], r["focus_group_id"]) for r in records] == [("b", "pe_fin"), ("a", "pe_mfg")]
+
+
+def test_unknown_sector_raises():
+    inputs = ScoreInputs(["org"], np.array(["pe_other"], dtype=object), np.zeros((1, len(DIMENSION_CODES))))
+
+    with pytest.raises(KeyError):
+        score_portfolio(inputs, CONFIGS, PARAMS)
+
+
+def test_wrong_matrix_shape_raises():
+    inputs = ScoreInputs(["org"], np.array(["pe_mfg"], dtype=object), np.zeros((1, 3)))
+
+    with pytest.raises(ValueError):
+        score_portfolio(inputs, CONFIGS, PARAMS)
+
+
+def test_fingerprint_ignores_trailing_zeros_but_not_values():
+    same = _config("pe_mfg", ["0.250", "0.10", "0.20", "0.15", "0.10", "0.10", "0.10"])
+    changed = _config("pe_mfg", ["0.25", "0.10", "0.20", "0.15", "0.10", "0.10", "0.10"], h_r_baseline="76")
+
+    assert config_fingerprint(same) == config_fingerprint(CONFIGS["pe_mfg"])
+    assert config_fingerprint(changed) != config_fingerprint(CONFIGS["pe_mfg"])
+
+
+def test_ebitda_multiplier_does_not_change_scores():
+    scores = np.full((1, len(DIMENSION_CODES)), 55.0)
+    inputs = ScoreInputs(["org"], np.array(["pe_mfg"], dtype=object), scores)
+    other = {"pe_mfg": _config("pe_mfg", ["0.25", "0.10", "0.20", "0.15", "0.10", "0.10", "0.10"], ebitda_multiplier="2.5")}
+
+    assert score_portfolio(inputs, other, PARAMS).org_air[0] == score_portfolio(inputs, CONFIGS, PARAMS).org_air[0]